@@ -26,6 +26,9 @@ class DepartmentResource(resources.ModelResource):
         export_order = ('id', 'name', 'faculty', 'created_by', 'created_at', 'updated_by', 'updated_at', 'is_deleted')
         import_id_fields = ('id',)
 
+    def get_queryset(self):
+        return super().get_queryset().select_related('created_by', 'updated_by')
+
     def dehydrate_faculty(self, department):
         """Export faculty as the display name instead of the value."""
         return department.get_faculty_display()
@@ -58,6 +61,7 @@ class DepartmentAdmin(ImportExportModelAdmin):
     resource_class = DepartmentResource
     list_display = ('id', 'name', 'get_faculty', 'created_by', 'created_at', 'updated_by', 'updated_at', 'is_active')
     list_filter = ('faculty', 'created_by', 'updated_by', 'is_deleted')
+    list_select_related = ('created_by', 'updated_by')
     search_fields = ('id', 'name', 'created_by__username', 'updated_by__username')
     readonly_fields = ('id', 'created_at', 'updated_at', 'created_by', 'updated_by')
 
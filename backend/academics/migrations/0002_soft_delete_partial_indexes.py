@@ -0,0 +1,23 @@
+# Generated by Django 5.1.7 on 2026-10-17 11:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='department',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['id'], name='department_live_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='department',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['faculty'], name='department_live_faculty_idx'),
+        ),
+    ]
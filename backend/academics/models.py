@@ -1,4 +1,5 @@
 from django.db import models, transaction
+from university.managers import SoftDeleteManager
 from django.contrib.auth import get_user_model
 from django.core.validators import RegexValidator
 from enum import Enum
@@ -21,8 +22,8 @@ class Faculty(Enum):
         """Returns a list of tuples compatible with Django's choices argument."""
         return [(key.value, key.name) for key in cls]
 
-class DepartmentManager(models.Manager):
-    """Custom manager for Department model to handle ID generation."""
+class DepartmentManager(SoftDeleteManager):
+    """Custom manager for Department model to handle ID generation and soft-delete queries."""
     def create_department(self, name, faculty, created_by, **kwargs):
         """Creates a new department with an auto-generated ID."""
         with transaction.atomic():
@@ -89,6 +90,9 @@ class Department(models.Model):
         indexes = [
             models.Index(fields=['faculty']),
             models.Index(fields=['created_at']),
+            # Partial indexes covering only live rows (what non-staff requests query)
+            models.Index(fields=['id'], name='department_live_id_idx', condition=models.Q(is_deleted=False)),
+            models.Index(fields=['faculty'], name='department_live_faculty_idx', condition=models.Q(is_deleted=False)),
         ]
 
     def save(self, *args, **kwargs):
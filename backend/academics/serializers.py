@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import Department, Faculty, User
+from university.fieldsets import SparseFieldsetSerializerMixin
 
 class FacultyChoiceSerializer(serializers.Serializer):
     """Serializer for Faculty Enum choices."""
@@ -9,7 +10,7 @@ class FacultyChoiceSerializer(serializers.Serializer):
     def to_representation(self, instance):
         return {'value': instance[0], 'label': instance[1]}
 
-class DepartmentSerializer(serializers.ModelSerializer):
+class DepartmentSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """Serializer for Department model CRUD operations."""
     created_by = serializers.PrimaryKeyRelatedField(read_only=True)
     updated_by = serializers.PrimaryKeyRelatedField(read_only=True)
@@ -0,0 +1,7 @@
+from django.db.models.signals import post_save, post_delete
+from university.cache import invalidate_catalog_cache_on_commit
+from .models import Department
+
+# Any department write (including soft deletes, which go through save()) drops the cached read responses.
+post_save.connect(invalidate_catalog_cache_on_commit, sender=Department, dispatch_uid='catalog_cache_save_Department')
+post_delete.connect(invalidate_catalog_cache_on_commit, sender=Department, dispatch_uid='catalog_cache_delete_Department')
@@ -1,12 +1,16 @@
-from rest_framework import viewsets, status
+from rest_framework import viewsets
 from rest_framework.views import APIView
-from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import Department, Faculty
+from drf_spectacular.utils import extend_schema
+from .models import Department
 from .serializers import DepartmentSerializer, FacultyChoiceSerializer
+from university.cache import CachedReadMixin
+from university.choices import CHOICE_PAYLOADS
+from university.conditional import ConditionalGetMixin
+from university.fieldsets import SparseFieldsetMixin
 
-class DepartmentViewSet(viewsets.ModelViewSet):
+class DepartmentViewSet(CachedReadMixin, ConditionalGetMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     """ViewSet for CRUD operations on Department model."""
     serializer_class = DepartmentSerializer
     filter_backends = [DjangoFilterBackend]
@@ -26,7 +30,7 @@ class DepartmentViewSet(viewsets.ModelViewSet):
         """Filter out soft-deleted departments for non-admin users."""
         if self.request.user.is_authenticated and self.request.user.is_staff:
             return self.queryset
-        return self.queryset.filter(is_deleted=False)
+        return self.queryset.live()
 
     def perform_destroy(self, instance):
         """Soft delete instead of hard delete."""
@@ -38,7 +42,6 @@ class FacultyChoicesView(APIView):
     """API endpoint to retrieve Faculty choices for frontend dropdowns."""
     permission_classes = [AllowAny]  # Read-only, no auth required
 
+    @extend_schema(responses=FacultyChoiceSerializer(many=True))
     def get(self, request):
-        choices = Faculty.choices()
-        serializer = FacultyChoiceSerializer(choices, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
\ No newline at end of file
+        return CHOICE_PAYLOADS['faculty'].response(request)
\ No newline at end of file
@@ -3,8 +3,11 @@ from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from rest_framework import exceptions
 from rest_framework_simplejwt.authentication import JWTAuthentication
-from rest_framework_simplejwt.exceptions import InvalidToken, AuthenticationFailed
+from rest_framework_simplejwt.exceptions import InvalidToken, AuthenticationFailed, TokenError
+from rest_framework_simplejwt.utils import aware_utcnow
 from django.contrib.auth import get_user_model
+from .cache import token_cache, token_cache_key, user_cache, user_cache_key
+from .tokens import check_token_generation
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +16,8 @@ class CookieJWTAuthentication(JWTAuthentication):
     Custom JWT authentication class that retrieves the access token from an HttpOnly cookie
     named 'access_token' instead of the Authorization header. The token is expected to be set
     by views such as RegisterView or CustomTokenRefreshView. Falls back to the Authorization
-    header only if ALLOW_HEADER_AUTH is True in settings.
+    header only if ALLOW_HEADER_AUTH is True in settings. Verified tokens and users are
+    served from per-process caches (see accounts.cache).
     """
 
     def authenticate(self, request):
@@ -59,4 +63,47 @@ class CookieJWTAuthentication(JWTAuthentication):
             raise AuthenticationFailed(_('User not found.'), code='user_not_found')
         except Exception as e:
             logger.error(f"Unexpected authentication error: {str(e)}")
-            raise AuthenticationFailed(_('Authentication failed.'), code='authentication_failed') from e
\ No newline at end of file
+            raise AuthenticationFailed(_('Authentication failed.'), code='authentication_failed') from e
+
+    def get_validated_token(self, raw_token):
+        """
+        Return the verified token from the token cache, decoding it and checking its
+        signature on a miss. Cached tokens still go through check_cached_token().
+        """
+        key = token_cache_key(raw_token)
+        token = token_cache.get(key)
+        if token is None:
+            token = super().get_validated_token(raw_token)
+            token_cache.set(key, token, token.get('exp', 0))
+            return token
+        try:
+            self.check_cached_token(token)
+        except TokenError as e:
+            token_cache.discard(key)
+            raise InvalidToken({'detail': _('Given token not valid for any token type'), 'messages': [str(e)]}) from e
+        return token
+
+    def check_cached_token(self, token):
+        """
+        The per-request checks a cached token must pass again: expiry against the
+        current time, the user's token generation, and the blacklist for token
+        classes that support it.
+        """
+        token.check_exp(current_time=aware_utcnow())
+        check_token_generation(token)
+        if hasattr(token, 'check_blacklist'):
+            token.check_blacklist()
+
+    def get_user(self, validated_token):
+        """
+        Return the token's user from the user cache, loading it from the database on a miss.
+        """
+        key = user_cache_key(validated_token)
+        if key is None:
+            return super().get_user(validated_token)
+        user = user_cache.get(key)
+        if user is None:
+            generation = user_cache.generation
+            user = super().get_user(validated_token)
+            user_cache.set(key, user, generation)
+        return user
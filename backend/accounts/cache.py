@@ -0,0 +1,125 @@
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from rest_framework_simplejwt.settings import api_settings
+from university.cache import CacheStats
+
+def user_cache_key(validated_token):
+    """(user id, issued at) of an access token, or None when it lacks either claim."""
+    user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+    issued_at = validated_token.get('iat')
+    if user_id is None or issued_at is None:
+        return None
+    return (str(user_id), issued_at)
+
+def token_cache_key(raw_token):
+    """SHA-256 of the raw token, so the cache never holds usable credentials as keys."""
+    if isinstance(raw_token, str):
+        raw_token = raw_token.encode()
+    return hashlib.sha256(raw_token).hexdigest()
+
+class ExpiringLRUCache:
+    """
+    Thread-safe, per-process LRU whose entries also expire at a given time
+    (epoch seconds). Bounded by the entry count in the setting named by
+    size_setting; 0 disables the cache.
+    """
+    size_setting = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._generation = 0
+        self.stats = CacheStats()
+
+    @property
+    def max_size(self):
+        return getattr(settings, self.size_setting)
+
+    @property
+    def generation(self):
+        """Changes on every invalidation; read it before loading a value and pass it to set()."""
+        return self._generation
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        self.stats.record(hit=entry is not None)
+        return entry[1] if entry is not None else None
+
+    def set(self, key, value, expires, generation=None):
+        """Stores value until expires unless an invalidation happened since generation was read."""
+        max_size = self.max_size
+        if max_size <= 0 or expires <= time.time():
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, key):
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def snapshot(self):
+        """Hit/miss counters plus the current and maximum size."""
+        with self._lock:
+            size = len(self._entries)
+        return {**self.stats.snapshot(), 'size': size, 'max_size': self.max_size}
+
+class UserCache(ExpiringLRUCache):
+    """
+    Authenticated users keyed by user_cache_key(), kept AUTH_USER_CACHE_TTL
+    seconds. Callers get copies, so request-level changes never reach the cache.
+
+    Invalidation is local to the process: other workers keep serving a stale
+    user until its entry expires, so the TTL bounds how long a deactivation or
+    password change takes to apply everywhere. It defaults to a few seconds:
+    enough to absorb a burst of requests, short enough for revocation.
+    """
+    size_setting = 'AUTH_USER_CACHE_SIZE'
+
+    def get(self, key):
+        user = super().get(key)
+        return copy.copy(user) if user is not None else None
+
+    def set(self, key, user, generation):
+        super().set(key, copy.copy(user), time.time() + settings.AUTH_USER_CACHE_TTL, generation)
+
+    def invalidate(self, user_id):
+        """Drops every cached token entry of the user."""
+        user_id = str(user_id)
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if key[0] == user_id]:
+                del self._entries[key]
+
+class TokenCache(ExpiringLRUCache):
+    """
+    Signature-verified access tokens keyed by token_cache_key(), each kept no
+    longer than its own exp claim. Only decoding and signature verification
+    are skipped on a hit: CookieJWTAuthentication.check_cached_token() re-runs
+    the expiry and revocation checks every time.
+    """
+    size_setting = 'AUTH_TOKEN_CACHE_SIZE'
+
+user_cache = UserCache()
+token_cache = TokenCache()
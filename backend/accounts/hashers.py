@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, PBKDF2PasswordHasher
+from django.db import close_old_connections
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with PBKDF2_ITERATIONS; older hashes are upgraded on the next login."""
+
+    @property
+    def iterations(self):
+        return settings.PBKDF2_ITERATIONS
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id with ARGON2_TIME_COST, ARGON2_MEMORY_COST (KiB) and ARGON2_PARALLELISM. Needs argon2-cffi."""
+
+    @property
+    def time_cost(self):
+        return settings.ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.ARGON2_PARALLELISM
+
+class HashingPoolFull(Exception):
+    """Raised when PASSWORD_HASHING_MAX_PENDING jobs are already queued or running."""
+
+class HashingStats:
+    """Thread-safe, per-process counters of the hashing pool, including time spent queued."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.completed = 0
+            self.rejected = 0
+            self.queue_seconds = 0.0
+            self.max_queue_seconds = 0.0
+            self.run_seconds = 0.0
+
+    def record_rejected(self):
+        with self._lock:
+            self.rejected += 1
+
+    def record(self, queued, ran):
+        with self._lock:
+            self.completed += 1
+            self.queue_seconds += queued
+            self.max_queue_seconds = max(self.max_queue_seconds, queued)
+            self.run_seconds += ran
+
+    def snapshot(self):
+        with self._lock:
+            completed = self.completed or 1
+            return {
+                'completed': self.completed,
+                'rejected': self.rejected,
+                'pending': _pending,
+                'mean_queue_ms': self.queue_seconds / completed * 1000,
+                'max_queue_ms': self.max_queue_seconds * 1000,
+                'mean_run_ms': self.run_seconds / completed * 1000,
+            }
+
+hashing_stats = HashingStats()
+
+_executor = None
+_pending = 0
+_pool_lock = threading.Lock()
+
+def get_hashing_executor():
+    """The process's hashing pool: PASSWORD_HASHING_WORKERS hashes run at once."""
+    global _executor
+    with _pool_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASHING_WORKERS, thread_name_prefix='password-hashing'
+            )
+        return _executor
+
+def _release(future):
+    global _pending
+    with _pool_lock:
+        _pending -= 1
+
+def _timed(func, args, kwargs, submitted):
+    started = time.perf_counter()
+    close_old_connections()  # Pool threads outlive requests; treat each job like one
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+        hashing_stats.record(started - submitted, time.perf_counter() - started)
+
+async def run_hashing(func, *args, **kwargs):
+    """
+    Awaits func(*args, **kwargs) (authenticate(), make_password(), ...) on the
+    hashing pool so the event loop stays free. Raises HashingPoolFull instead
+    of queueing beyond PASSWORD_HASHING_MAX_PENDING jobs.
+    """
+    global _pending
+    with _pool_lock:
+        if _pending >= settings.PASSWORD_HASHING_MAX_PENDING:
+            hashing_stats.record_rejected()
+            raise HashingPoolFull
+        _pending += 1
+    try:
+        future = get_hashing_executor().submit(_timed, func, args, kwargs, time.perf_counter())
+    except BaseException:
+        _release(None)
+        raise
+    future.add_done_callback(_release)  # Also when the awaiting request is cancelled
+    return await asyncio.wrap_future(future)
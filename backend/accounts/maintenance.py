@@ -0,0 +1,73 @@
+import logging
+import threading
+import time
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+logger = logging.getLogger(__name__)
+
+_pruner = None
+_pruner_lock = threading.Lock()
+
+def prune_expired_tokens(batch_size=1000, pause=0.0, max_seconds=None):
+    """
+    Deletes outstanding tokens that expired (their blacklist rows cascade) in
+    batches of batch_size, each in its own short transaction, sleeping pause
+    seconds between batches. Rows locked by a concurrent blacklist write are
+    skipped until the next run. Stops early after max_seconds. Returns counts
+    of deleted rows, batches run and elapsed seconds.
+    """
+    cutoff = timezone.now()
+    start = time.monotonic()
+    result = {'outstanding': 0, 'blacklisted': 0, 'batches': 0}
+    while True:
+        with transaction.atomic():
+            ids = list(
+                OutstandingToken.objects.filter(expires_at__lt=cutoff).order_by()
+                .select_for_update(skip_locked=True).values_list('pk', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            _, deleted = OutstandingToken.objects.filter(pk__in=ids).delete()
+        result['outstanding'] += deleted.get(OutstandingToken._meta.label, 0)
+        result['blacklisted'] += deleted.get(BlacklistedToken._meta.label, 0)
+        result['batches'] += 1
+        if len(ids) < batch_size or (max_seconds is not None and time.monotonic() - start >= max_seconds):
+            break
+        if pause:
+            time.sleep(pause)
+    result['seconds'] = time.monotonic() - start
+    return result
+
+def _prune_periodically(interval):
+    while True:
+        time.sleep(interval)
+        try:
+            result = prune_expired_tokens(settings.TOKEN_PRUNE_BATCH_SIZE, settings.TOKEN_PRUNE_PAUSE)
+            logger.info(
+                'Pruned %(outstanding)d outstanding and %(blacklisted)d blacklisted tokens '
+                'in %(batches)d batches (%(seconds).2f s)', result,
+            )
+        except Exception:
+            logger.exception('Pruning expired tokens failed')
+        finally:
+            connection.close()
+
+def start_token_pruner():
+    """
+    Starts a daemon thread that prunes expired tokens every TOKEN_PRUNE_INTERVAL
+    seconds (0 disables it), once per process. Returns the thread, or None.
+    """
+    global _pruner
+    interval = settings.TOKEN_PRUNE_INTERVAL
+    if interval <= 0:
+        return None
+    with _pruner_lock:
+        if _pruner is None:
+            _pruner = threading.Thread(
+                target=_prune_periodically, args=(interval,), name='token-pruner', daemon=True
+            )
+            _pruner.start()
+        return _pruner
@@ -0,0 +1,106 @@
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+from accounts.authentication import CookieJWTAuthentication
+from accounts.cache import token_cache, user_cache
+from accounts.models import CustomUser
+from accounts.views import UserProfileView
+
+# Settings overrides per benchmarked configuration
+SCENARIOS = {
+    'no caches': {'AUTH_TOKEN_CACHE_SIZE': 0, 'AUTH_USER_CACHE_SIZE': 0},
+    'token cache': {'AUTH_USER_CACHE_SIZE': 0},
+    'user cache': {'AUTH_TOKEN_CACHE_SIZE': 0},
+    'both caches': {},
+}
+
+class Command(BaseCommand):
+    help = (
+        'Measures the authentication hot path (CookieJWTAuthentication.authenticate) '
+        'and authenticated requests per second against the profile endpoint with '
+        'the verified-token and user caches on and off, using temporary users that '
+        'are deleted afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000, help='Requests per scenario.')
+        parser.add_argument('--threads', type=int, default=4, help='Concurrent request threads.')
+        parser.add_argument('--users', type=int, default=10, help='Distinct users (one token each).')
+        parser.add_argument('--calls', type=int, default=20000, help='authenticate() calls per scenario in the microbenchmark.')
+
+    def handle(self, *args, **options):
+        run_id = uuid.uuid4().hex[:8]
+        users = [
+            CustomUser.objects.create_user(f'bench.auth.{run_id}.{i}@example.com', 'Bench', 'User')
+            for i in range(options['users'])
+        ]
+        try:
+            tokens = [str(AccessToken.for_user(user)) for user in users]
+            for label, overrides in SCENARIOS.items():
+                with override_settings(**overrides):
+                    self.stdout.write(self.style.MIGRATE_HEADING(label))
+                    self._hot_path(tokens, options)
+                    self._endpoint(tokens, options)
+        finally:
+            CustomUser.objects.filter(pk__in=[user.pk for user in users]).delete()
+
+    def _reset(self):
+        for cache in (token_cache, user_cache):
+            cache.clear()
+            cache.stats.reset()
+
+    def _hit_rates(self):
+        return f"token hits {token_cache.snapshot()['hit_rate']:.1%}   user hits {user_cache.snapshot()['hit_rate']:.1%}"
+
+    def _hot_path(self, tokens, options):
+        # authenticate() alone, on one thread: no view, no response rendering.
+        factory = APIRequestFactory()
+        authentication = CookieJWTAuthentication()
+        requests = [Request(factory.get('/auth/me/', HTTP_COOKIE=f'access_token={token}')) for token in tokens]
+        calls = max(1, options['calls'])
+        self._reset()
+        start = time.perf_counter()
+        for i in range(calls):
+            authentication.authenticate(requests[i % len(requests)])
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"  authenticate(): {elapsed / calls * 1e6:8.1f} us/call   {calls / elapsed:9.0f} calls/s   {self._hit_rates()}"
+        )
+
+    def _endpoint(self, tokens, options):
+        factory = APIRequestFactory()
+        view = UserProfileView.as_view()
+        threads = max(1, options['threads'])
+        per_thread = max(1, options['requests'] // threads)
+
+        def worker(offset):
+            samples = []
+            try:
+                for i in range(per_thread):
+                    token = tokens[(offset + i) % len(tokens)]
+                    request = factory.get('/auth/me/', HTTP_COOKIE=f'access_token={token}')
+                    start = time.perf_counter()
+                    response = view(request)
+                    samples.append((time.perf_counter() - start) * 1000)
+                    if response.status_code != 200:
+                        raise RuntimeError(f'Unexpected status {response.status_code}: {response.data}')
+            finally:
+                connection.close()
+            return samples
+
+        self._reset()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            samples = [sample for result in pool.map(worker, range(threads)) for sample in result]
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"  GET /auth/me/ x{len(samples)} on {threads} threads: {len(samples) / elapsed:8.1f} req/s   "
+            f"median {statistics.median(samples):.2f} ms   {self._hit_rates()}"
+        )
@@ -0,0 +1,64 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, PBKDF2PasswordHasher
+from django.core.management.base import BaseCommand
+
+PASSWORD = 'benchmark-Passw0rd!'
+
+class Command(BaseCommand):
+    help = (
+        'Times password hashing for PBKDF2 and Argon2 parameter sets: single-hash '
+        'latency and hashes per second on a thread pool the size of the async '
+        'login pool. Use it to pick PASSWORD_HASHER and its parameters.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pbkdf2-iterations', type=int, nargs='*', default=None,
+                            help='PBKDF2 iteration counts (default: PBKDF2_ITERATIONS and half of it).')
+        parser.add_argument('--argon2-time-cost', type=int, nargs='*', default=None,
+                            help='Argon2 time costs (default: ARGON2_TIME_COST).')
+        parser.add_argument('--argon2-memory-cost', type=int, nargs='*', default=None,
+                            help='Argon2 memory costs in KiB (default: ARGON2_MEMORY_COST and a quarter of it).')
+        parser.add_argument('--samples', type=int, default=10, help='Hashes timed per parameter set and thread.')
+        parser.add_argument('--threads', type=int, default=settings.PASSWORD_HASHING_WORKERS,
+                            help='Threads for the throughput run (default: PASSWORD_HASHING_WORKERS).')
+
+    def handle(self, *args, **options):
+        for label, hasher in self._candidates(options):
+            try:
+                hasher.encode(PASSWORD, hasher.salt())
+            except ValueError as exc:  # Library not installed
+                self.stdout.write(f"{label:<44} skipped: {exc}")
+                continue
+            self._run(label, hasher, options)
+
+    def _candidates(self, options):
+        for iterations in options['pbkdf2_iterations'] or (settings.PBKDF2_ITERATIONS, settings.PBKDF2_ITERATIONS // 2):
+            hasher = PBKDF2PasswordHasher()
+            hasher.iterations = iterations
+            yield f"pbkdf2_sha256 iterations={iterations}", hasher
+        for time_cost in options['argon2_time_cost'] or (settings.ARGON2_TIME_COST,):
+            for memory_cost in options['argon2_memory_cost'] or (settings.ARGON2_MEMORY_COST, settings.ARGON2_MEMORY_COST // 4):
+                hasher = Argon2PasswordHasher()
+                hasher.time_cost, hasher.memory_cost, hasher.parallelism = time_cost, memory_cost, settings.ARGON2_PARALLELISM
+                yield f"argon2 t={time_cost} m={memory_cost}KiB p={settings.ARGON2_PARALLELISM}", hasher
+
+    def _run(self, label, hasher, options):
+        samples, threads = max(1, options['samples']), max(1, options['threads'])
+
+        def hash_once(_=None):
+            start = time.perf_counter()
+            hasher.encode(PASSWORD, hasher.salt())
+            return time.perf_counter() - start
+
+        latency = statistics.median(hash_once() for _ in range(samples)) * 1000
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(hash_once, range(samples * threads)))
+        throughput = samples * threads / (time.perf_counter() - start)
+        self.stdout.write(
+            f"{label:<44} {latency:8.1f} ms/hash   {throughput:7.1f} hashes/s on {threads} threads   "
+            f"~{100 / throughput:5.1f} s to absorb 100 simultaneous logins"
+        )
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from accounts.maintenance import prune_expired_tokens
+
+class Command(BaseCommand):
+    help = (
+        'Deletes expired outstanding tokens and their blacklist entries in small '
+        'batches, one short transaction each. Safe to run from cron during the day.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows deleted per transaction.')
+        parser.add_argument('--pause', type=float, default=0.1, help='Seconds to sleep between batches.')
+        parser.add_argument('--max-seconds', type=float, default=None, help='Stop after this long; the rest waits for the next run.')
+        parser.add_argument('--dry-run', action='store_true', help='Only count the expired rows.')
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            expired = OutstandingToken.objects.filter(expires_at__lt=timezone.now())
+            blacklisted = BlacklistedToken.objects.filter(token__in=expired).count()
+            self.stdout.write(f"{expired.count()} expired outstanding tokens ({blacklisted} blacklisted) would be removed.")
+            return
+        result = prune_expired_tokens(max(1, options['batch_size']), options['pause'], options['max_seconds'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Removed {result['outstanding']} outstanding and {result['blacklisted']} blacklisted tokens "
+            f"in {result['batches']} batches ({result['seconds']:.2f} s)."
+        ))
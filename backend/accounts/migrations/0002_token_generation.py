@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-17 12:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='token_generation',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text="Bumped to revoke all of the user's tokens (TOKEN_REVOCATION_MODE='generation').", verbose_name='Token Generation'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+# token_blacklist's tables belong to simplejwt, so the index expired-token
+# pruning relies on is created here. CONCURRENTLY keeps the table writable.
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0002_token_generation'),
+        ('token_blacklist', '0012_alter_outstandingtoken_user'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS token_outstanding_expires_idx '
+            'ON token_blacklist_outstandingtoken (expires_at)',
+            'DROP INDEX CONCURRENTLY IF EXISTS token_outstanding_expires_idx',
+        ),
+    ]
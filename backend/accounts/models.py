@@ -7,8 +7,12 @@ from django.core.exceptions import ValidationError
 class CustomUserManager(BaseUserManager):
     """Manager for handling CustomUser creation."""
 
-    def create_user(self, email, first_name, last_name, password=None, **extra_fields):
-        """Create and save a regular user with the given email and password."""
+    def create_user(self, email, first_name, last_name, password=None, password_hash=None, **extra_fields):
+        """
+        Create and save a regular user with the given email and password. Pass
+        password_hash instead when the password was already hashed (e.g. off the
+        request thread by the async registration view).
+        """
         if not email:
             raise ValueError('The Email field must be set')
         email = self.normalize_email(email)
@@ -19,7 +23,10 @@ class CustomUserManager(BaseUserManager):
                 last_name=last_name.strip().title(),
                 **extra_fields
             )
-            user.set_password(password)
+            if password_hash is not None:
+                user.password = password_hash
+            else:
+                user.set_password(password)
             user.save(using=self._db)
         except IntegrityError as e:
             if 'email' in str(e).lower():
@@ -76,6 +83,12 @@ class CustomUser(AbstractUser):
         verbose_name="Mobile Number",
         help_text="Enter a 10-digit Indian mobile number starting with 6, 7, 8, or 9.",
     )
+    token_generation = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Token Generation",
+        help_text="Bumped to revoke all of the user's tokens (TOKEN_REVOCATION_MODE='generation').",
+    )
     date_joined = models.DateTimeField(auto_now_add=True)
     last_updated = models.DateTimeField(auto_now=True)
 
@@ -99,6 +112,19 @@ class CustomUser(AbstractUser):
     def __str__(self):
         return self.email
 
+    def save(self, *args, **kwargs):
+        """
+        Full saves of an existing user leave token_generation out: it only changes
+        through accounts.tokens.bump_token_generation(), and writing back a stale
+        in-memory value would undo a revocation.
+        """
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'token_generation'
+            ]
+        super().save(*args, **kwargs)
+
     @property
     def full_name(self):
         return f"{self.first_name} {self.last_name}"
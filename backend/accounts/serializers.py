@@ -72,6 +72,7 @@ class RegisterSerializer(serializers.ModelSerializer):
             last_name=validated_data['last_name'],
             mobile_number=validated_data.get('mobile_number', None),
             password=validated_data['password'],
+            password_hash=validated_data.get('password_hash'),  # Set by the async view
         )
         if 'profile_picture' in validated_data:
             user.profile_picture = validated_data['profile_picture']
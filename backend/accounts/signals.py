@@ -0,0 +1,15 @@
+from functools import partial
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .cache import user_cache
+from .models import CustomUser
+
+# Saves cover profile edits, password changes (set_password() + save()) and
+# deactivation. Invalidate now, and again on commit in case a request reloaded
+# the old row before the write became visible.
+@receiver(post_save, sender=CustomUser, dispatch_uid='auth_user_cache_save')
+@receiver(post_delete, sender=CustomUser, dispatch_uid='auth_user_cache_delete')
+def invalidate_cached_user(sender, instance, **kwargs):
+    user_cache.invalidate(instance.pk)
+    transaction.on_commit(partial(user_cache.invalidate, instance.pk))
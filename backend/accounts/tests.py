@@ -1,3 +1,194 @@
-from django.test import TestCase
+import io
+import time
+from datetime import timedelta
+from unittest import mock
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import AsyncClient, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import AccessToken
+from accounts.cache import token_cache, token_cache_key, user_cache
+from accounts.hashers import hashing_stats
+from accounts.models import CustomUser
 
-# Create your tests here.
+
+class UserCacheTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('cached@example.com', 'Cached', 'User', 'secret-password')
+
+    def setUp(self):
+        for auth_cache in (token_cache, user_cache):
+            auth_cache.clear()
+            auth_cache.stats.reset()
+        self.client = APIClient()
+        self.client.cookies['access_token'] = str(AccessToken.for_user(self.user))
+
+    def test_repeated_requests_skip_the_user_query(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get('/auth/me/').status_code, 200)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get('/auth/me/').data['email'], 'cached@example.com')
+        self.assertEqual(user_cache.snapshot()['hits'], 1)
+
+    def test_saves_invalidate_the_cached_user(self):
+        self.client.get('/auth/me/')
+        self.user.first_name = 'Renamed'
+        self.user.save()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get('/auth/me/').data['first_name'], 'Renamed')
+
+        self.user.set_password('new-password')
+        self.user.save()
+        with self.assertNumQueries(1):
+            self.client.get('/auth/me/')
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get('/auth/me/').status_code, 401)
+
+    def test_other_workers_see_a_deactivation_within_the_ttl(self):
+        self.client.get('/auth/me/')
+        # A save in another worker only clears that worker's cache.
+        CustomUser.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertEqual(self.client.get('/auth/me/').status_code, 200)
+        later = time.time() + settings.AUTH_USER_CACHE_TTL + 1
+        with mock.patch('accounts.cache.time.time', return_value=later):
+            self.assertEqual(self.client.get('/auth/me/').status_code, 401)
+
+    def test_request_changes_do_not_leak_into_the_cache(self):
+        self.client.get('/auth/me/')
+        self.client.put('/auth/me/', {'first_name': 'Edited'})
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, 'Edited')
+        self.assertEqual(self.client.get('/auth/me/').data['first_name'], 'Edited')
+
+    @override_settings(AUTH_USER_CACHE_SIZE=0)
+    def test_size_zero_disables_the_cache(self):
+        self.client.get('/auth/me/')
+        with self.assertNumQueries(1):
+            self.client.get('/auth/me/')
+
+    def test_verified_tokens_are_cached_until_exp(self):
+        token = AccessToken.for_user(self.user)
+        self.client.cookies['access_token'] = str(token)
+        self.client.get('/auth/me/')
+        self.client.get('/auth/me/')
+        self.assertEqual(token_cache.snapshot()['hits'], 1)
+        self.assertEqual(token_cache.get(token_cache_key(str(token)))['exp'], token['exp'])
+
+    def test_cached_tokens_are_checked_for_expiry(self):
+        self.client.get('/auth/me/')
+        later = timezone.now() + timedelta(hours=1)
+        with mock.patch('accounts.authentication.aware_utcnow', return_value=later):
+            self.assertEqual(self.client.get('/auth/me/').status_code, 401)
+        self.assertEqual(token_cache.snapshot()['size'], 0)
+
+
+class TokenRevocationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('revoked@example.com', 'Revoked', 'User', 'secret-password')
+
+    def setUp(self):
+        cache.clear()
+        token_cache.clear()
+        user_cache.clear()
+
+    def login(self):
+        client = APIClient()
+        response = client.post('/auth/login/', {'email': 'revoked@example.com', 'password': 'secret-password'})
+        self.assertEqual(response.status_code, 200)
+        return client
+
+    def test_blacklist_mode_blacklists_the_refresh_token(self):
+        client = self.login()
+        refresh_token = client.cookies['refresh_token'].value
+        self.assertEqual(OutstandingToken.objects.count(), 1)
+        self.assertEqual(client.post('/auth/logout/').status_code, 204)
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
+        client.cookies['refresh_token'] = refresh_token
+        self.assertEqual(client.post('/auth/token/refresh/').status_code, 401)
+
+    @override_settings(TOKEN_REVOCATION_MODE='generation')
+    def test_generation_mode_refreshes_without_writes_and_logs_out_everywhere(self):
+        laptop, phone = self.login(), self.login()
+        old_refresh = laptop.cookies['refresh_token'].value
+        with self.assertNumQueries(2):  # The generation lookup and the cookie's user; no token rows written
+            self.assertEqual(laptop.post('/auth/token/refresh/').status_code, 200)
+        self.assertNotEqual(laptop.cookies['refresh_token'].value, old_refresh)
+        self.assertEqual(OutstandingToken.objects.count(), 0)
+        replay = APIClient()
+        replay.cookies['refresh_token'] = old_refresh
+        self.assertEqual(replay.post('/auth/token/refresh/').status_code, 200)  # The trade-off: rotation revokes nothing
+        self.assertEqual(phone.get('/auth/me/').status_code, 200)
+
+        phone_access = phone.cookies['access_token'].value
+        self.assertEqual(laptop.post('/auth/logout/').status_code, 204)
+        phone.cookies['access_token'] = phone_access
+        self.assertEqual(phone.get('/auth/me/').status_code, 401)  # Even though its token is cached
+        self.assertEqual(phone.post('/auth/token/refresh/').status_code, 401)
+        self.assertEqual(self.login().get('/auth/me/').status_code, 200)
+
+    @override_settings(TOKEN_REVOCATION_MODE='generation')
+    def test_saving_a_stale_copy_keeps_the_revocation(self):
+        stale = CustomUser.objects.get(pk=self.user.pk)
+        self.login().post('/auth/logout/')
+        stale.first_name = 'Stale'
+        stale.save()
+        self.user.refresh_from_db()
+        self.assertEqual((self.user.first_name, self.user.token_generation), ('Stale', 1))
+
+
+class TokenPruneTest(TestCase):
+    def test_expired_tokens_are_deleted_in_batches(self):
+        user = CustomUser.objects.create_user('pruned@example.com', 'Pruned', 'User')
+        now = timezone.now()
+        tokens = OutstandingToken.objects.bulk_create([
+            OutstandingToken(user=user, jti=f'jti-{i}', token='-', expires_at=now + timedelta(hours=-1 if i < 5 else 1))
+            for i in range(7)
+        ])
+        BlacklistedToken.objects.bulk_create([BlacklistedToken(token=tokens[0]), BlacklistedToken(token=tokens[6])])
+
+        out = io.StringIO()
+        call_command('prune_tokens', batch_size=2, pause=0, stdout=out)
+        self.assertIn('Removed 5 outstanding and 1 blacklisted tokens in 3 batches', out.getvalue())
+        self.assertEqual(sorted(OutstandingToken.objects.values_list('jti', flat=True)), ['jti-5', 'jti-6'])
+        self.assertEqual(BlacklistedToken.objects.get().token_id, tokens[6].pk)
+
+
+@override_settings(PBKDF2_ITERATIONS=1000)
+class AsyncAuthViewTest(TransactionTestCase):
+    # Hashing runs on pool threads with their own connections, so the data must be committed.
+
+    def setUp(self):
+        hashing_stats.reset()
+
+    async def test_register_then_login(self):
+        client = AsyncClient()
+        response = await client.post('/auth/register/async/', {
+            'email': 'async@example.com', 'first_name': 'async', 'last_name': 'user', 'password': 'secret-password',
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(response.json()['user']['first_name'], 'Async')
+        user = await CustomUser.objects.aget(email='async@example.com')
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$1000$'))
+
+        response = await client.post('/auth/login/async/', {'email': 'async@example.com', 'password': 'wrong-password'},
+                                     content_type='application/json')
+        self.assertEqual(response.status_code, 401)
+        response = await client.post('/auth/login/async/', {'email': 'async@example.com', 'password': 'secret-password'},
+                                     content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('access_token', response.cookies)
+        self.assertEqual(hashing_stats.snapshot()['completed'], 3)
+
+    @override_settings(PASSWORD_HASHING_MAX_PENDING=0)
+    async def test_full_pool_sheds_load(self):
+        response = await AsyncClient().post('/auth/login/async/', {'email': 'a@example.com', 'password': 'x'},
+                                            content_type='application/json')
+        self.assertEqual((response.status_code, response['Retry-After']), (503, '1'))
+        self.assertEqual(hashing_stats.snapshot()['rejected'], 1)
@@ -0,0 +1,115 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken, Token
+
+GENERATION_CLAIM = 'gen'
+
+def generation_mode():
+    """True when TOKEN_REVOCATION_MODE is 'generation' rather than 'blacklist'."""
+    return settings.TOKEN_REVOCATION_MODE == 'generation'
+
+def _generation_cache_key(user_id):
+    return f'auth:token-generation:{user_id}'
+
+def get_token_generation(user_id):
+    """The user's current token generation (None for unknown users), served from the Django cache."""
+    key = _generation_cache_key(user_id)
+    generation = cache.get(key)
+    if generation is None:
+        User = get_user_model()
+        try:
+            generation = User.objects.values_list('token_generation', flat=True).get(pk=user_id)
+        except (User.DoesNotExist, ValueError, TypeError):
+            return None
+        cache.set(key, generation, settings.TOKEN_GENERATION_CACHE_TIMEOUT)
+    return generation
+
+def bump_token_generation(user):
+    """
+    Revokes every token issued to the user so far with one UPDATE: tokens
+    carry the generation they were issued under and must match the current one.
+    Other processes see the bump only through a shared cache backend; with a
+    per-process one they keep the old generation for TOKEN_GENERATION_CACHE_TIMEOUT.
+    """
+    User = get_user_model()
+    User.objects.filter(pk=user.pk).update(token_generation=F('token_generation') + 1)
+    user.token_generation = User.objects.values_list('token_generation', flat=True).get(pk=user.pk)
+    key = _generation_cache_key(user.pk)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
+
+def check_token_generation(token):
+    """In generation mode, raises TokenError unless the token's generation is the user's current one."""
+    if not generation_mode():
+        return
+    current = get_token_generation(token.get(api_settings.USER_ID_CLAIM))
+    if current is None or token.get(GENERATION_CLAIM, 0) != current:
+        raise TokenError(_('Token has been revoked.'))
+
+class GenerationAccessToken(AccessToken):
+    """Access token that, in generation mode, is rejected once its user's generation moves on."""
+
+    def verify(self):
+        super().verify()
+        check_token_generation(self)
+
+class GenerationRefreshToken(Token):
+    """
+    Refresh token revoked by generation instead of the blacklist: no
+    outstanding-token row on issue, no blacklist lookup on use.
+    """
+    token_type = 'refresh'
+    lifetime = api_settings.REFRESH_TOKEN_LIFETIME
+    no_copy_claims = RefreshToken.no_copy_claims
+    access_token_class = GenerationAccessToken
+    access_token = RefreshToken.access_token  # Copies the claims, including gen
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token[GENERATION_CLAIM] = user.token_generation
+        return token
+
+    def verify(self):
+        super().verify()
+        check_token_generation(self)
+
+    def rotate(self):
+        """
+        Turns this token into a fresh one (new jti, iat and exp) for the same
+        user and generation. The old token stays valid until it expires: with
+        no per-token state, a replayed refresh token is not detected.
+        """
+        self.set_jti()
+        self.set_iat()
+        self.set_exp(from_time=self.current_time)
+
+def refresh_token_for(user):
+    """A new refresh token for the user in the configured revocation mode."""
+    token_class = GenerationRefreshToken if generation_mode() else RefreshToken
+    return token_class.for_user(user)
+
+def load_refresh_token(raw_token):
+    """Decodes and verifies a refresh token in the configured revocation mode (raises TokenError)."""
+    token_class = GenerationRefreshToken if generation_mode() else RefreshToken
+    return token_class(raw_token)
+
+def revoke_tokens(user, raw_refresh_token=None):
+    """
+    Blacklist mode: blacklists the given refresh token. Generation mode: bumps
+    the user's generation, which revokes all of the user's tokens (every device).
+    """
+    if generation_mode():
+        bump_token_generation(user)
+        return
+    if raw_refresh_token:
+        try:
+            RefreshToken(raw_refresh_token).blacklist()
+        except TokenError:
+            pass  # Ignore invalid/expired token errors
@@ -1,7 +1,8 @@
 from django.urls import path
 from .views import (
     RegisterView, CustomTokenObtainPairView, LogoutView,
-    UserProfileView, ChangePasswordView, CustomTokenRefreshView
+    UserProfileView, ChangePasswordView, CustomTokenRefreshView,
+    AsyncRegisterView, AsyncTokenObtainPairView
 )
 
 app_name = 'accounts'  # Namespace for URL resolution
@@ -9,6 +10,9 @@ app_name = 'accounts'  # Namespace for URL resolution
 urlpatterns = [
     path('register/', RegisterView.as_view(), name='register'),
     path('login/', CustomTokenObtainPairView.as_view(), name='token_obtain_pair'),
+    # Async variants (ASGI): password hashing runs on a bounded thread pool
+    path('register/async/', AsyncRegisterView.as_view(), name='register_async'),
+    path('login/async/', AsyncTokenObtainPairView.as_view(), name='token_obtain_pair_async'),
     path('logout/', LogoutView.as_view(), name='logout'),
     path('me/', UserProfileView.as_view(), name='user_profile'),
     path('password/change/', ChangePasswordView.as_view(), name='change_password'),
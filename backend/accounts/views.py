@@ -1,19 +1,63 @@
+import json
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 from drf_spectacular.utils import extend_schema, OpenApiExample
+from .hashers import HashingPoolFull, run_hashing
 from .serializers import UserSerializer, RegisterSerializer, ChangePasswordSerializer
+from .tokens import GenerationRefreshToken, load_refresh_token, refresh_token_for, revoke_tokens
+from university.conditional import make_etag, not_modified, set_validators
 from rest_framework import serializers
 
 class LoginSerializer(serializers.Serializer):
     email = serializers.EmailField()
     password = serializers.CharField(write_only=True)
 
+def set_auth_cookies(response, refresh):
+    """Sets the HttpOnly access and refresh token cookies for a new session."""
+    secure = not settings.DEBUG
+    response.set_cookie(
+        key='access_token',
+        value=str(refresh.access_token),
+        httponly=True,
+        secure=secure,
+        samesite='Strict',
+        max_age=15 * 60
+    )
+    response.set_cookie(
+        key='refresh_token',
+        value=str(refresh),
+        httponly=True,
+        secure=secure,
+        samesite='Strict',
+        max_age=1 * 24 * 60 * 60
+    )
+    return response
+
+def _request_data(request):
+    """JSON or form/multipart body of a plain Django request, as a dict (ValueError if malformed)."""
+    if request.content_type == 'application/json':
+        data = json.loads(request.body or b'{}')
+        if not isinstance(data, dict):
+            raise ValueError('Expected a JSON object.')
+        return data
+    return {**request.POST.dict(), **request.FILES.dict()}
+
+def _hashing_busy():
+    response = JsonResponse({'error': 'Too many sign-ins in progress, retry shortly.'}, status=503)
+    response['Retry-After'] = '1'
+    return response
+
 class RegisterView(APIView):
     @extend_schema(
         request=RegisterSerializer,
@@ -38,29 +82,11 @@ class RegisterView(APIView):
         serializer = RegisterSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()
-            refresh = RefreshToken.for_user(user)
             response = Response({
                 'message': 'Registration successful',
                 'user': UserSerializer(user).data
             }, status=status.HTTP_201_CREATED)
-            secure = not settings.DEBUG
-            response.set_cookie(
-                key='access_token',
-                value=str(refresh.access_token),
-                httponly=True,
-                secure=secure,
-                samesite='Strict',
-                max_age=15 * 60
-            )
-            response.set_cookie(
-                key='refresh_token',
-                value=str(refresh),
-                httponly=True,
-                secure=secure,
-                samesite='Strict',
-                max_age=1 * 24 * 60 * 60
-            )
-            return response
+            return set_auth_cookies(response, refresh_token_for(user))
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 class CustomTokenObtainPairView(APIView):
@@ -86,29 +112,11 @@ class CustomTokenObtainPairView(APIView):
             password=serializer.validated_data['password']
         )
         if user:
-            refresh = RefreshToken.for_user(user)
             response = Response({
                 'message': 'Login successful',
                 'user': UserSerializer(user).data
             }, status=status.HTTP_200_OK)
-            secure = not settings.DEBUG
-            response.set_cookie(
-                key='access_token',
-                value=str(refresh.access_token),
-                httponly=True,
-                secure=secure,
-                samesite='Strict',
-                max_age=15 * 60
-            )
-            response.set_cookie(
-                key='refresh_token',
-                value=str(refresh),
-                httponly=True,
-                secure=secure,
-                samesite='Strict',
-                max_age=1 * 24 * 60 * 60
-            )
-            return response
+            return set_auth_cookies(response, refresh_token_for(user))
         return Response({'error': 'Invalid credentials'}, status=status.HTTP_401_UNAUTHORIZED)
 
 class LogoutView(APIView):
@@ -116,19 +124,15 @@ class LogoutView(APIView):
 
     @extend_schema(
         responses={204: {'description': 'Logout successful'}},
-        description='Log out a user by blacklisting the refresh token and clearing cookies.'
+        description=(
+            'Log out a user by revoking the refresh token and clearing cookies. With '
+            "TOKEN_REVOCATION_MODE='generation' this logs the user out everywhere."
+        )
     )
     def post(self, request):
-        refresh_token = request.COOKIES.get('refresh_token')
-        
-        # Blacklist refresh token if present
-        if refresh_token:
-            try:
-                token = RefreshToken(refresh_token)
-                token.blacklist()
-            except TokenError:
-                pass  # Ignore invalid/expired token errors
-        
+        # Blacklist the refresh token if present, or bump the user's token generation
+        revoke_tokens(request.user, request.COOKIES.get('refresh_token'))
+
         # Return success and clear cookies
         response = Response(status=status.HTTP_204_NO_CONTENT)
         response.delete_cookie('access_token')
@@ -157,8 +161,14 @@ class UserProfileView(APIView):
         methods=['PUT']
     )
     def get(self, request):
-        serializer = UserSerializer(request.user)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        user = request.user
+        etag = make_etag(user.pk, user.last_updated)
+        response = not_modified(request, etag, user.last_updated)
+        if response is not None:
+            return response
+        serializer = UserSerializer(user)
+        response = Response(serializer.data, status=status.HTTP_200_OK)
+        return set_validators(response, etag, user.last_updated)
 
     def put(self, request):
         serializer = UserSerializer(request.user, data=request.data, partial=True)
@@ -186,13 +196,7 @@ class ChangePasswordView(APIView):
         serializer = ChangePasswordSerializer(data=request.data, context={'request': request})
         if serializer.is_valid():
             serializer.update(request.user, serializer.validated_data)
-            refresh_token = request.COOKIES.get('refresh_token')
-            if refresh_token:
-                try:
-                    token = RefreshToken(refresh_token)
-                    token.blacklist()
-                except TokenError:
-                    pass
+            revoke_tokens(request.user, request.COOKIES.get('refresh_token'))
             response = Response({'message': 'Password changed successfully'}, status=status.HTTP_200_OK)
             response.delete_cookie('access_token')
             response.delete_cookie('refresh_token')
@@ -210,7 +214,7 @@ class CustomTokenRefreshView(APIView):
             return Response({'error': 'No refresh token provided'}, status=status.HTTP_400_BAD_REQUEST)
         
         try:
-            token = RefreshToken(refresh_token)
+            token = load_refresh_token(refresh_token)
             new_access_token = str(token.access_token)
             response = Response({'message': 'Token refreshed successfully'}, status=status.HTTP_200_OK)
             secure = not settings.DEBUG
@@ -223,6 +227,8 @@ class CustomTokenRefreshView(APIView):
                 max_age=15 * 60
             )
             if getattr(settings, 'ROTATE_REFRESH_TOKENS', True):
+                if isinstance(token, GenerationRefreshToken):
+                    token.rotate()  # No database writes; revoked through the generation
                 new_refresh_token = str(token)
                 response.set_cookie(
                     key='refresh_token',
@@ -234,4 +240,57 @@ class CustomTokenRefreshView(APIView):
                 )
             return response
         except TokenError:
-            return Response({'error': 'Invalid or expired refresh token'}, status=status.HTTP_401_UNAUTHORIZED)
\ No newline at end of file
+            return Response({'error': 'Invalid or expired refresh token'}, status=status.HTTP_401_UNAUTHORIZED)
+
+def _signed_in(user, message, status_code):
+    response = JsonResponse({'message': message, 'user': UserSerializer(user).data}, status=status_code)
+    return set_auth_cookies(response, refresh_token_for(user))
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncRegisterView(View):
+    """
+    Async variant of RegisterView for ASGI deployments. The password is hashed
+    on the bounded hashing pool (accounts.hashers) instead of a server worker;
+    503 when PASSWORD_HASHING_MAX_PENDING hashes are already waiting.
+    """
+
+    async def post(self, request):
+        try:
+            serializer = RegisterSerializer(data=_request_data(request))
+        except ValueError:
+            return JsonResponse({'error': 'Malformed request body.'}, status=400)
+        if not await sync_to_async(serializer.is_valid)():
+            return JsonResponse(serializer.errors, status=400)
+        try:
+            password_hash = await run_hashing(make_password, serializer.validated_data['password'])
+        except HashingPoolFull:
+            return _hashing_busy()
+        user = await sync_to_async(serializer.save)(password_hash=password_hash)
+        return await sync_to_async(_signed_in)(user, 'Registration successful', 201)
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncTokenObtainPairView(View):
+    """
+    Async variant of CustomTokenObtainPairView for ASGI deployments: authenticate()
+    (user lookup and password check) runs on the bounded hashing pool; 503 when
+    PASSWORD_HASHING_MAX_PENDING checks are already waiting.
+    """
+
+    async def post(self, request):
+        try:
+            serializer = LoginSerializer(data=_request_data(request))
+        except ValueError:
+            return JsonResponse({'error': 'Malformed request body.'}, status=400)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=400)
+        try:
+            user = await run_hashing(
+                authenticate,
+                email=serializer.validated_data['email'],
+                password=serializer.validated_data['password'],
+            )
+        except HashingPoolFull:
+            return _hashing_busy()
+        if user is None:
+            return JsonResponse({'error': 'Invalid credentials'}, status=401)
+        return await sync_to_async(_signed_in)(user, 'Login successful', 200)
@@ -108,13 +108,14 @@ class CourseResource(resources.ModelResource):
         return course.cbcs_category  # Export raw value, e.g., "CORE"
 
     def dehydrate_discipline(self, course):
-        return course.discipline.id if course.discipline else ''  # Export ID, e.g., "1"
+        return course.discipline_id or ''  # Export ID, e.g., "101"
 
 @admin.register(Course)
 class CourseAdmin(CustomImportExportModelAdmin):
     resource_class = CourseResource
     list_display = ('course_code', 'course_name', 'get_course_category', 'get_type', 'get_cbcs_category', 'maximum_credit', 'discipline_name', 'is_deleted')
     list_filter = ('course_category', 'type', 'cbcs_category', 'discipline', 'is_deleted')
+    list_select_related = ('discipline',)
     search_fields = ('course_code', 'course_name', 'discipline__name')
     readonly_fields = ('created_by', 'created_at', 'updated_by', 'updated_at')
 
@@ -159,8 +160,11 @@ class SyllabusResource(resources.ModelResource):
         export_order = ('id', 'course', 'course_name', 'uploaded_by', 'uploaded_at', 'description', 'version', 'is_deleted')
         import_id_fields = ('id',)
 
+    def get_queryset(self):
+        return super().get_queryset().select_related('uploaded_by')
+
     def dehydrate_course(self, syllabus):
-        return syllabus.course.course_code
+        return syllabus.course_id
     def dehydrate_uploaded_by(self, syllabus):
         return syllabus.uploaded_by.username
 
@@ -173,6 +177,8 @@ class SyllabusAdmin(CustomImportExportModelAdmin):
     resource_class = SyllabusResource
     list_display = ('course', 'course_name', 'version', 'uploaded_by', 'uploaded_at', 'description_short', 'is_deleted')
     list_filter = ('uploaded_by', 'uploaded_at', 'is_deleted')
+    list_select_related = ('course', 'uploaded_by')
+    ordering = ('course', 'version_key')
     search_fields = ('course__course_code', 'course_name', 'description')
     readonly_fields = ('course_name', 'uploaded_by', 'uploaded_at', 'updated_by', 'updated_at')
 
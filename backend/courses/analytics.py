@@ -0,0 +1,140 @@
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
+from .models import DepartmentCreditSummary
+
+logger = logging.getLogger(__name__)
+
+PENDING_CHANGES_KEY = 'analytics:credit-summary:pending-since'
+REFRESH_LOCK_KEY = 'analytics:credit-summary:refresh-lock'
+TRAILING_REFRESH_KEY = 'analytics:credit-summary:trailing-refresh'
+COUNT_FIELDS = ('cbcs_category_counts', 'type_counts', 'course_category_counts')
+
+_refresh_executor = None
+_refresh_executor_lock = threading.Lock()
+
+
+def refresh_department_credit_summary(concurrently=True):
+    """Recomputes the materialized view. CONCURRENTLY keeps it readable during the refresh."""
+    # Clear the marker first so writes that land during the refresh stay pending.
+    cache.delete(PENDING_CHANGES_KEY)
+    option = 'CONCURRENTLY ' if concurrently else ''
+    with connection.cursor() as cursor:
+        cursor.execute(f'REFRESH MATERIALIZED VIEW {option}{DepartmentCreditSummary._meta.db_table}')
+
+
+def get_refresh_executor():
+    """One background thread per process: refreshes run one at a time, off the request thread."""
+    global _refresh_executor
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='course-analytics')
+        return _refresh_executor
+
+
+def mark_credit_summary_stale(**kwargs):
+    """
+    Signal receiver for course/department writes: records that the view is
+    behind and, when COURSE_ANALYTICS_REFRESH_ON_WRITE is set, queues a refresh
+    after commit at most once per COURSE_ANALYTICS_MIN_REFRESH_INTERVAL seconds.
+    The refresh runs on a background thread, so the write's response never
+    waits for it. Writes that fall inside the interval get one trailing
+    refresh when the interval ends.
+
+    The marker, the throttle and the trailing timer live in the Django cache
+    and the web process: with a per-process cache each worker throttles on
+    its own, and a process that exits drops its timer. Keep the
+    refresh_course_analytics command on a schedule as the backstop.
+    """
+    cache.add(PENDING_CHANGES_KEY, timezone.now(), timeout=None)
+    if settings.COURSE_ANALYTICS_REFRESH_ON_WRITE:
+        transaction.on_commit(schedule_credit_summary_refresh)
+
+
+def schedule_credit_summary_refresh():
+    """
+    Queues a refresh unless one ran within the interval, in which case a
+    single trailing refresh is timed for the end of the interval. Returns the
+    future of an immediate refresh, or None.
+    """
+    interval = settings.COURSE_ANALYTICS_MIN_REFRESH_INTERVAL
+    if cache.add(REFRESH_LOCK_KEY, time.time(), timeout=interval):
+        return get_refresh_executor().submit(_refresh_in_background)
+    started = cache.get(REFRESH_LOCK_KEY, time.time())
+    delay = max(started + interval - time.time(), 0)
+    if cache.add(TRAILING_REFRESH_KEY, 1, timeout=interval):
+        timer = threading.Timer(delay, _trailing_refresh)
+        timer.daemon = True
+        timer.start()
+    return None
+
+
+def _trailing_refresh():
+    cache.delete(TRAILING_REFRESH_KEY)
+    cache.delete(REFRESH_LOCK_KEY)  # The interval is over (also when the clocks disagree slightly)
+    schedule_credit_summary_refresh()
+
+
+def _refresh_in_background():
+    try:
+        refresh_department_credit_summary()
+    except Exception:
+        logger.exception("Refreshing the department credit summary failed.")
+    finally:
+        connection.close()  # The pool thread's own connection
+
+
+def credit_summary_report(faculty=None):
+    """Department rows plus per-faculty rollups and staleness of the view."""
+    summaries = DepartmentCreditSummary.objects.order_by('department_id')
+    if faculty:
+        summaries = summaries.filter(faculty=faculty)
+    departments = [
+        {
+            'department': row.department_id,
+            'department_name': row.department_name,
+            'faculty': row.faculty,
+            'course_count': row.course_count,
+            'total_credit': row.total_credit,
+            'average_credit': row.average_credit,
+            **{field: getattr(row, field) for field in COUNT_FIELDS},
+            'refreshed_at': row.refreshed_at,
+        }
+        for row in summaries
+    ]
+
+    faculties = {}
+    for row in departments:
+        rollup = faculties.setdefault(row['faculty'], {
+            'faculty': row['faculty'],
+            'department_count': 0,
+            'course_count': 0,
+            'total_credit': 0,
+            **{field: Counter() for field in COUNT_FIELDS},
+        })
+        rollup['department_count'] += 1
+        rollup['course_count'] += row['course_count']
+        rollup['total_credit'] += row['total_credit']
+        for field in COUNT_FIELDS:
+            rollup[field].update(row[field])
+    for rollup in faculties.values():
+        count = rollup['course_count']
+        rollup['average_credit'] = rollup['total_credit'] / count if count else None
+        for field in COUNT_FIELDS:
+            rollup[field] = dict(rollup[field])
+
+    refreshed_at = departments[0]['refreshed_at'] if departments else None
+    pending_since = cache.get(PENDING_CHANGES_KEY)
+    return {
+        'refreshed_at': refreshed_at,
+        'staleness_seconds': (timezone.now() - refreshed_at).total_seconds() if refreshed_at else None,
+        'pending_changes_since': pending_since,
+        'departments': departments,
+        'faculties': [faculties[name] for name in sorted(faculties)],
+    }
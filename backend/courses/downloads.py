@@ -0,0 +1,181 @@
+import re
+from urllib.parse import quote
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import content_disposition_header, http_date, parse_etags, parse_http_date_safe
+from rest_framework.renderers import JSONRenderer
+from university.conditional import make_etag
+from .previews import preview_exists, preview_name
+from .storage import blob_digest, syllabus_storage
+
+DOWNLOAD_BLOCK_SIZE = 64 * 1024
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+_RANGE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+class PassthroughRenderer(JSONRenderer):
+    """
+    Accepts any Accept header (PDF viewers send arbitrary ones) so file actions
+    are not rejected by content negotiation; error payloads still render as JSON.
+    """
+    media_type = '*/*'
+    format = None
+
+def file_etag(field):
+    """
+    Strong ETag for a stored file. Syllabus files are stored under their
+    SHA-256 (courses.storage), so the name identifies the bytes.
+    """
+    return make_etag('file', field.name)
+
+def file_version(field):
+    """Cache-busting token for ?v= in download URLs."""
+    return file_etag(field).strip('"')
+
+def parse_range(header, size):
+    """
+    Returns (start, end) inclusive for a single satisfiable byte range, None
+    when the header is absent, invalid (last before first) or not a single
+    range (serve the whole file), or False when it cannot be satisfied.
+    """
+    match = _RANGE.match(header.strip()) if header else None
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:  # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None  # Syntactically invalid: ignored (RFC 9110, section 14.1.1)
+    if start >= size:
+        return False
+    return start, min(int(last), size - 1) if last else size - 1
+
+def _if_range_matches(request, etag, last_modified):
+    """A Range request only applies when If-Range (if sent) still matches the representation."""
+    value = request.headers.get('If-Range')
+    if not value:
+        return True
+    if value.startswith(('"', 'W/')):
+        # Strong comparison: weak validators never match If-Range.
+        return not value.startswith('W/') and parse_etags(value) == [etag]
+    since = parse_http_date_safe(value)
+    return since is not None and int(last_modified.timestamp()) == since
+
+def _read_range(handle, start, length):
+    try:
+        handle.seek(start)
+        while length > 0:
+            block = handle.read(min(DOWNLOAD_BLOCK_SIZE, length))
+            if not block:
+                break
+            length -= len(block)
+            yield block
+    finally:
+        handle.close()
+
+def _offloaded(name, path, filename, content_type='application/pdf'):
+    """Hands the transfer (including Range handling) to the front web server, or returns None."""
+    offload = settings.SYLLABUS_DOWNLOAD_OFFLOAD
+    if offload == 'nginx':
+        response = HttpResponse(content_type=content_type)
+        response['X-Accel-Redirect'] = settings.SYLLABUS_ACCEL_REDIRECT_PREFIX + quote(name)
+    elif offload == 'sendfile':
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = path
+    else:
+        return None
+    response['Content-Disposition'] = content_disposition_header(False, filename)
+    return response
+
+def _ranged(request, field, filename, etag, last_modified):
+    """Serves the file from Django: 206 for a valid single Range, 416 if unsatisfiable, else 200."""
+    try:
+        size = field.size
+    except FileNotFoundError:
+        raise Http404('Syllabus file is missing.')
+    byte_range = None
+    if request.method == 'GET' and _if_range_matches(request, etag, last_modified):
+        byte_range = parse_range(request.headers.get('Range'), size)
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+    handle = field.storage.open(field.name, 'rb')
+    if byte_range is None:
+        # FileResponse uses wsgi.file_wrapper (sendfile where the server supports it).
+        return FileResponse(handle, content_type='application/pdf', filename=filename)
+    start, end = byte_range
+    response = StreamingHttpResponse(_read_range(handle, start, end - start + 1),
+                                     status=206, content_type='application/pdf')
+    response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    response['Content-Length'] = str(end - start + 1)
+    response['Content-Disposition'] = content_disposition_header(False, filename)
+    return response
+
+def serve_syllabus_file(request, syllabus):
+    """
+    Conditional, range-aware delivery of a syllabus PDF. Bytes are sent by the
+    front server when SYLLABUS_DOWNLOAD_OFFLOAD is set, otherwise by Django.
+    Requests carrying ?v=<current version> are cacheable as immutable.
+    """
+    field = syllabus.syllabus_file
+    if not field:
+        raise Http404('Syllabus has no file.')
+    etag = file_etag(field)
+    last_modified = syllabus.updated_at
+    filename = f"{syllabus.course_id}-{syllabus.version}.pdf"
+
+    response = get_conditional_response(request, etag=etag, last_modified=int(last_modified.timestamp()))
+    if response is None:
+        response = _offloaded(field.name, field.path, filename) or _ranged(request, field, filename, etag, last_modified)
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified.timestamp())
+    response['Accept-Ranges'] = 'bytes'
+    # Visibility depends on the user (soft-deleted syllabi are staff only), so never share caches.
+    if request.GET.get('v') == file_version(field):
+        patch_cache_control(response, private=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+def syllabus_download_path(syllabus):
+    """Relative download URL pinned to the current file, suitable for immutable caching."""
+    url = reverse('courses:syllabus-download', kwargs={'pk': syllabus.pk})
+    return f"{url}?v={file_version(syllabus.syllabus_file)}"
+
+def serve_syllabus_preview(request, syllabus):
+    """
+    Conditional delivery of the first-page PNG preview, with the same caching
+    rules as the PDF: immutable for ?v=<current preview>, otherwise revalidated.
+    """
+    name = preview_name(syllabus.syllabus_file.name)
+    if name is None or not syllabus_storage.exists(name):
+        raise Http404('Preview has not been rendered yet.')
+    etag = make_etag('preview', name)
+    filename = f"{syllabus.course_id}-{syllabus.version}.png"
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        path = syllabus_storage.path(name)
+        response = _offloaded(name, path, filename, 'image/png') or FileResponse(
+            syllabus_storage.open(name, 'rb'), content_type='image/png', filename=filename
+        )
+    response['ETag'] = etag
+    if request.GET.get('v') == blob_digest(syllabus.syllabus_file.name):
+        patch_cache_control(response, private=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+def syllabus_preview_path(syllabus):
+    """Relative preview URL pinned to the current file, or None until the preview is rendered."""
+    if not syllabus.syllabus_file or not preview_exists(syllabus.syllabus_file.name):
+        return None
+    url = reverse('courses:syllabus-preview', kwargs={'pk': syllabus.pk})
+    return f"{url}?v={blob_digest(syllabus.syllabus_file.name)}"
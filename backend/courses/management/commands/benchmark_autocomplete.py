@@ -0,0 +1,99 @@
+import statistics
+import time
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from rest_framework.test import APIRequestFactory
+from courses.models import Course
+from courses.views import CourseViewSet
+
+SUBJECTS = (
+    'Thermodynamics', 'Quantum Mechanics', 'Organic Chemistry', 'Linear Algebra', 'Microeconomics',
+    'Data Structures', 'Signal Processing', 'Cell Biology', 'Fluid Dynamics', 'Number Theory',
+    'Operating Systems', 'Structural Analysis', 'Corporate Finance', 'Modern Poetry', 'Soil Mechanics',
+)
+LEVELS = ('Introduction to', 'Advanced', 'Applied', 'Foundations of', 'Topics in', 'Seminar in')
+
+# (label, ?q=) pairs covering the matching paths of the endpoint.
+TERMS = (
+    ('code prefix', 'BM00042'),
+    ('short code prefix', 'BM'),
+    ('name word', 'thermodynamics'),
+    ('misspelled name', 'thermodinamics'),
+    ('two words', 'quantum mech'),
+    ('no match', 'zzqxj'),
+)
+
+class Command(BaseCommand):
+    help = (
+        'Seeds a temporary copy of the course table (same columns and indexes, '
+        'including the trigram ones) and times the course autocomplete endpoint '
+        'against it for code prefixes, name words and misspellings against a '
+        'latency target. The live table is never written or locked; the copy is '
+        'dropped at the end.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--courses', type=int, default=100000, help='Number of courses to seed.')
+        parser.add_argument('--departments', type=int, default=20, help='Number of departments to spread courses over.')
+        parser.add_argument('--repeat', type=int, default=50, help='Timed requests per term.')
+        parser.add_argument('--target-ms', type=float, default=20.0, help='Median latency each term should stay under.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            self.stderr.write('This benchmark requires PostgreSQL (pg_trgm indexes).')
+            return
+        table = Course._meta.db_table
+        with transaction.atomic(), connection.cursor() as cursor:
+            # A temp table shadows the live one of the same name for this session
+            # (pg_temp comes first in the search path), so the endpoint's
+            # unchanged queries hit the copy. It is dropped on commit.
+            cursor.execute('SELECT current_schema()')
+            live = f'{connection.ops.quote_name(cursor.fetchone()[0])}.{connection.ops.quote_name(table)}'
+            cursor.execute(
+                f'CREATE TEMP TABLE {connection.ops.quote_name(table)} (LIKE {live} INCLUDING ALL) ON COMMIT DROP'
+            )
+            self._seed(cursor, options)
+            cursor.execute(f'ANALYZE pg_temp.{connection.ops.quote_name(table)}')
+            self._run(options)
+        self.stdout.write('Benchmark table dropped.')
+
+    def _seed(self, cursor, options):
+        total = options['courses']
+        disciplines = [f"B{i:02d}" for i in range(options['departments'])]
+        # Every tenth row is soft-deleted, as in a long-lived catalog.
+        cursor.execute(
+            f"""
+            INSERT INTO pg_temp.{connection.ops.quote_name(Course._meta.db_table)} (
+                course_code, course_name, course_category, type, cbcs_category, maximum_credit,
+                discipline_id, created_at, updated_at, is_deleted
+            )
+            SELECT 'BM' || lpad(i::text, 7, '0'),
+                   (%s::varchar[])[i %% %s + 1] || ' ' || (%s::varchar[])[(i / %s) %% %s + 1] || ' ' || (i / 90),
+                   'COMPULSORY', 'THEORY', 'CORE', i %% 21, (%s::varchar[])[i %% %s + 1], now(), now(), i %% 10 = 9
+            FROM generate_series(0, %s - 1) AS i
+            """,
+            [list(LEVELS), len(LEVELS), list(SUBJECTS), len(LEVELS), len(SUBJECTS),
+             disciplines, len(disciplines), total],
+        )
+        self.stdout.write(f"Seeded {total} courses in {len(disciplines)} departments.")
+
+    def _run(self, options):
+        factory = APIRequestFactory()
+        view = CourseViewSet.as_view({'get': 'autocomplete'})
+        repeat, target = max(1, options['repeat']), options['target_ms']
+        slow = 0
+        for label, term in TERMS:
+            samples = []
+            for _ in range(repeat):
+                request = factory.get('/courses/courses/autocomplete/', {'q': term})
+                start = time.perf_counter()
+                response = view(request)
+                samples.append((time.perf_counter() - start) * 1000)
+            median = statistics.median(samples)
+            verdict = self.style.SUCCESS('ok') if median < target else self.style.ERROR('SLOW')
+            slow += median >= target
+            self.stdout.write(
+                f"  {label:<18} q={term!r:<18} median {median:7.2f} ms   max {max(samples):7.2f} ms   "
+                f"{len(response.data):2d} results   {verdict}"
+            )
+        self.stdout.write(f"{len(TERMS) - slow}/{len(TERMS)} terms under {target:g} ms (median).")
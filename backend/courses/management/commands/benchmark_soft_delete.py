@@ -0,0 +1,125 @@
+import re
+import statistics
+import time
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from courses.models import Course
+
+PARTIAL_INDEXES = ('course_live_code_idx', 'course_live_discipline_idx')
+SCRATCH_TABLE = 'benchmark_courses_course'
+
+class Command(BaseCommand):
+    help = (
+        'Seeds a temporary copy of the course table (same columns and indexes) with a '
+        'large share of soft-deleted rows and times the non-staff course list queries '
+        'with and without the partial indexes. The live table is never written or '
+        'locked; the copy is dropped at the end.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--courses', type=int, default=100000, help='Number of courses to seed.')
+        parser.add_argument('--deleted-share', type=float, default=0.8, help='Fraction of seeded courses that are soft-deleted.')
+        parser.add_argument('--departments', type=int, default=20, help='Number of departments to spread courses over.')
+        parser.add_argument('--repeat', type=int, default=50, help='Timed runs per query.')
+        parser.add_argument('--page-size', type=int, default=10, help='Rows per list page.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            self.stderr.write('This benchmark requires PostgreSQL (partial indexes and EXPLAIN output).')
+            return
+        with transaction.atomic(), connection.cursor() as cursor:
+            # The copy lives in this session's temp schema and is dropped on commit.
+            table = connection.ops.quote_name(SCRATCH_TABLE)
+            cursor.execute(
+                f'CREATE TEMP TABLE {table} (LIKE {Course._meta.db_table} INCLUDING ALL EXCLUDING INDEXES) '
+                'ON COMMIT DROP'
+            )
+            disciplines = self._seed(cursor, options)
+            self.stdout.write(f"Copied {len(self._copy_indexes(cursor))} indexes of the course table.")
+            cursor.execute(f'ANALYZE {table}')
+            self._run('with partial indexes', cursor, disciplines, options)
+            for name in PARTIAL_INDEXES:
+                cursor.execute(f'DROP INDEX {connection.ops.quote_name(self._scratch_index(name))}')
+            cursor.execute(f'ANALYZE {table}')
+            self._run('without partial indexes', cursor, disciplines, options)
+        self.stdout.write('Benchmark table dropped.')
+
+    def _scratch_index(self, name):
+        return f'benchmark_{name}'[:63]
+
+    def _copy_indexes(self, cursor):
+        """Recreates every index of the course table on the copy, under predictable names."""
+        cursor.execute(
+            'SELECT indexname, indexdef FROM pg_indexes WHERE schemaname = current_schema() AND tablename = %s',
+            [Course._meta.db_table],
+        )
+        names = []
+        for name, definition in cursor.fetchall():
+            head, _, rest = definition.partition(' ON ')
+            rest = re.sub(r'^\S+', connection.ops.quote_name(SCRATCH_TABLE), rest)
+            head = head[:head.rindex(' ') + 1] + connection.ops.quote_name(self._scratch_index(name))
+            cursor.execute(f'{head} ON {rest}')
+            names.append(self._scratch_index(name))
+        return names
+
+    def _seed(self, cursor, options):
+        total, deleted_share = options['courses'], options['deleted_share']
+        disciplines = [f"B{i:02d}" for i in range(options['departments'])]
+        # Deterministic spread: the first deleted_share of every 100 rows is deleted.
+        cursor.execute(
+            f"""
+            INSERT INTO {connection.ops.quote_name(SCRATCH_TABLE)} (
+                course_code, course_name, course_category, type, cbcs_category, maximum_credit,
+                discipline_id, created_at, updated_at, is_deleted
+            )
+            SELECT 'BM' || lpad(i::text, 7, '0'), 'Benchmark Course ' || i, 'COMPULSORY', 'THEORY', 'CORE',
+                   i %% 21, (%s::varchar[])[i %% %s + 1], now(), now(), (i %% 100) < %s
+            FROM generate_series(0, %s - 1) AS i
+            """,
+            [disciplines, len(disciplines), deleted_share * 100, total],
+        )
+        self.stdout.write(
+            f"Seeded {total} courses ({deleted_share:.0%} soft-deleted) in {len(disciplines)} departments."
+        )
+        return disciplines
+
+    def _scratch_sql(self, queryset):
+        """The SQL Django generates for queryset, pointed at the copy instead of the live table."""
+        sql, params = queryset.query.sql_with_params()
+        live, scratch = (connection.ops.quote_name(name) for name in (Course._meta.db_table, SCRATCH_TABLE))
+        return sql.replace(live, scratch), params
+
+    def _time(self, cursor, sql, params, repeat):
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            cursor.execute(sql, params)
+            cursor.fetchall()
+            samples.append((time.perf_counter() - start) * 1000)
+        return statistics.median(samples), max(samples)
+
+    def _run(self, label, cursor, disciplines, options):
+        page_size, repeat = options['page_size'], options['repeat']
+        # The same queries the non-staff list endpoint issues: a count and an ordered page.
+        all_live = Course.objects.live().order_by('course_code')
+        by_discipline = all_live.filter(discipline=disciplines[0])
+        deep_page = page_size * 200
+        querysets = {
+            'count (all live)': (all_live, True),
+            'first page': (all_live[:page_size], False),
+            f'page at offset {deep_page}': (all_live[deep_page:deep_page + page_size], False),
+            'count (one discipline)': (by_discipline, True),
+            'first page (one discipline)': (by_discipline[:page_size], False),
+        }
+        self.stdout.write(self.style.MIGRATE_HEADING(label))
+        for name, (queryset, count) in querysets.items():
+            sql, params = self._scratch_sql(queryset.order_by().values('pk') if count else queryset)
+            if count:
+                sql = f'SELECT COUNT(*) FROM ({sql}) AS counted'
+            median, worst = self._time(cursor, sql, params, repeat)
+            self.stdout.write(f"  {name:<32} median {median:8.2f} ms   max {worst:8.2f} ms")
+        sql, params = self._scratch_sql(by_discipline[:page_size])
+        cursor.execute(f'EXPLAIN {sql}', params)
+        self.stdout.write('  plan (first page, one discipline):')
+        for (line,) in cursor.fetchall():
+            self.stdout.write(f"    {line}")
@@ -0,0 +1,95 @@
+import os
+import shutil
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import Now
+from courses.models import Syllabus, SyllabusBlob
+from courses.storage import blob_digest, blob_name, hash_file, syllabus_storage
+from university.cache import invalidate_catalog_cache
+
+class Command(BaseCommand):
+    help = (
+        'Moves existing (date-based) syllabus files into content-addressed storage, '
+        'keeping one copy of identical files, then recounts blob references. '
+        'Files are hashed in parallel.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 4, help='Parallel hashing threads.')
+        parser.add_argument('--dry-run', action='store_true', help='Report what would be merged without changing anything.')
+
+    def handle(self, *args, **options):
+        names = set(
+            Syllabus.objects.exclude(syllabus_file='').values_list('syllabus_file', flat=True).distinct()
+        )
+        legacy = sorted(name for name in names if blob_digest(name) is None)
+        groups, sizes, missing = self._hash(legacy, options['workers'])
+
+        duplicates = sum(len(group) - 1 for group in groups.values())
+        reclaimable = sum(sizes[digest] * (len(group) - 1) for digest, group in groups.items())
+        self.stdout.write(
+            f"{len(legacy)} legacy file(s) -> {len(groups)} distinct blob(s); "
+            f"{duplicates} duplicate(s), {reclaimable / 1024 / 1024:.1f} MB reclaimable."
+        )
+        for name in missing:
+            self.stderr.write(f"Missing file, left untouched: {name}")
+        if options['dry_run']:
+            return
+
+        for digest, group in groups.items():
+            self._merge(digest, group)
+        self._recount()
+        invalidate_catalog_cache()
+        self.stdout.write(self.style.SUCCESS('Syllabus files deduplicated.'))
+
+    def _hash(self, names, workers):
+        """Hashes files concurrently (hashlib releases the GIL on large blocks)."""
+        groups, sizes, missing = defaultdict(list), {}, []
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = {pool.submit(hash_file, syllabus_storage.path(name)): name for name in names}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    digest = future.result()
+                except FileNotFoundError:
+                    missing.append(name)
+                    continue
+                groups[digest].append(name)
+                sizes[digest] = syllabus_storage.size(name)
+        return groups, sizes, missing
+
+    def _merge(self, digest, group):
+        """Copies one file of the group to its blob name, repoints the rows, then drops the old files."""
+        target = blob_name(digest, os.path.splitext(group[0])[1])
+        target_path = syllabus_storage.path(target)
+        if not os.path.exists(target_path):
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            temp_path = f"{target_path}.part"
+            shutil.copyfile(syllabus_storage.path(group[0]), temp_path)
+            os.replace(temp_path, target_path)
+        with transaction.atomic():
+            Syllabus.objects.filter(syllabus_file__in=group).update(syllabus_file=target, updated_at=Now())
+        # Rows now point at the blob; the old copies can go.
+        for name in group:
+            syllabus_storage.delete(name)
+
+    def _recount(self):
+        """Rebuilds SyllabusBlob rows from the syllabus table."""
+        counts = {
+            row['syllabus_file']: row['references']
+            for row in Syllabus.objects.values('syllabus_file').annotate(references=Count('id'))
+            if blob_digest(row['syllabus_file'])
+        }
+        blobs = [
+            SyllabusBlob(sha256=blob_digest(name), name=name, size=syllabus_storage.size(name), ref_count=count)
+            for name, count in counts.items()
+            if syllabus_storage.exists(name)
+        ]
+        with transaction.atomic():
+            SyllabusBlob.objects.bulk_create(
+                blobs, update_conflicts=True, unique_fields=['sha256'], update_fields=['name', 'size', 'ref_count']
+            )
+            SyllabusBlob.objects.exclude(name__in=counts.keys()).delete()
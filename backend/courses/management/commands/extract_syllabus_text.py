@@ -0,0 +1,58 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import F
+from courses.models import Syllabus
+from courses.pdftext import extract_pdf_text, extraction_available
+from courses.tasks import reuse_text, store_text
+
+class Command(BaseCommand):
+    help = (
+        'Extracts the text of syllabus PDFs that have none yet (or whose file changed) '
+        'in a process pool and stores it for content search.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=multiprocessing.cpu_count(), help='Extraction processes.')
+        parser.add_argument('--timeout', type=float, default=settings.SYLLABUS_TEXT_TIMEOUT,
+                            help='Seconds allowed per file; slower files are recorded as failed (0 disables).')
+        parser.add_argument('--force', action='store_true', help='Re-extract every syllabus, even when its text is current.')
+
+    def handle(self, *args, **options):
+        if not extraction_available():
+            raise CommandError('PDF text extraction requires the pypdf package.')
+        syllabi = Syllabus.objects.exclude(syllabus_file='')
+        if not options['force']:
+            syllabi = syllabi.exclude(text__file_name=F('syllabus_file'))
+        pending = list(syllabi.values_list('pk', 'syllabus_file'))
+
+        start = time.perf_counter()
+        stored = reused = failed = 0
+        to_extract = []
+        for pk, name in pending:
+            if not options['force'] and reuse_text(pk, name):
+                reused += 1
+            else:
+                to_extract.append((pk, name))
+
+        storage = Syllabus._meta.get_field('syllabus_file').storage
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=max(1, options['workers']), mp_context=context) as pool:
+            futures = {pool.submit(extract_pdf_text, storage.path(name), timeout=options['timeout']): (pk, name) for pk, name in to_extract}
+            for future in as_completed(futures):
+                pk, name = futures[future]
+                try:
+                    content, error = future.result(), ''
+                except Exception as exc:
+                    content, error = '', f'{type(exc).__name__}: {exc}'
+                    failed += 1
+                    self.stderr.write(f"Syllabus {pk}: {error}")
+                if store_text(pk, name, content, error) and not error:
+                    stored += 1
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f"Extracted {stored}, reused {reused}, failed {failed} of {len(pending)} syllabi in {elapsed:.1f} s."
+        ))
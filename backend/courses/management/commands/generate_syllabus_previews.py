@@ -0,0 +1,33 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from courses.models import Syllabus
+from courses.previews import generate_preview, preview_exists
+from courses.tasks import preview_ready
+
+class Command(BaseCommand):
+    help = 'Renders missing first-page previews for stored syllabus files (one per distinct file).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=settings.SYLLABUS_PREVIEW_WORKERS, help='Parallel pdftoppm processes.')
+
+    def handle(self, *args, **options):
+        names = set(Syllabus.objects.exclude(syllabus_file='').values_list('syllabus_file', flat=True).distinct())
+        pending = [name for name in names if not preview_exists(name)]
+        start = time.perf_counter()
+        rendered = failed = 0
+        with ThreadPoolExecutor(max_workers=max(1, options['workers'])) as pool:
+            futures = {pool.submit(generate_preview, name): name for name in pending}
+            for future in as_completed(futures):
+                try:
+                    if future.result():
+                        preview_ready(futures[future])
+                        rendered += 1
+                except Exception as exc:
+                    failed += 1
+                    self.stderr.write(f"{futures[future]}: {exc}")
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f"Rendered {rendered}, failed {failed} of {len(pending)} missing previews in {elapsed:.1f} s."
+        ))
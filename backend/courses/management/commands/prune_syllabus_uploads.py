@@ -0,0 +1,21 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from courses.models import SyllabusUpload
+from courses.uploads import discard_part
+
+class Command(BaseCommand):
+    help = 'Deletes resumable syllabus uploads (and their part files) abandoned or completed long ago (intended for cron).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than', type=int, default=24, help='Hours since the last received chunk.')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options['older_than'])
+        stale = SyllabusUpload.objects.filter(updated_at__lt=cutoff)
+        count = 0
+        for upload in stale.iterator():
+            discard_part(upload)
+            count += 1
+        stale.delete()
+        self.stdout.write(self.style.SUCCESS(f'Pruned {count} syllabus upload(s).'))
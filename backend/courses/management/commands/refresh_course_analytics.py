@@ -0,0 +1,18 @@
+import time
+from django.core.management.base import BaseCommand
+from courses.analytics import refresh_department_credit_summary
+
+class Command(BaseCommand):
+    help = 'Refreshes the department credit summary materialized view (intended for cron).'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--blocking', action='store_true',
+            help='Use a plain (locking) refresh instead of REFRESH ... CONCURRENTLY.'
+        )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        refresh_department_credit_summary(concurrently=not options['blocking'])
+        elapsed = (time.perf_counter() - start) * 1000
+        self.stdout.write(self.style.SUCCESS(f'Department credit summary refreshed in {elapsed:.1f} ms.'))
@@ -0,0 +1,57 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client
+from django.test.utils import override_settings
+from university.testing import ADMIN_QUERY_BUDGETS, API_QUERY_BUDGETS, QueryBudget, seed_catalog
+
+
+class BenchmarkRollback(Exception):
+    """Raised to roll back the seeded benchmark data."""
+
+
+class Command(BaseCommand):
+    help = (
+        'Seeds a catalog inside a transaction, requests every budgeted API endpoint '
+        'and admin changelist, reports SQL query count and database time against '
+        'the budgets, then rolls everything back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--departments', type=int, default=20, help='Number of departments to seed.')
+        parser.add_argument('--courses', type=int, default=50, help='Courses seeded per department.')
+        parser.add_argument('--syllabi', type=int, default=3, help='Syllabus versions seeded per course.')
+        parser.add_argument('--limit', type=int, default=50, help='Page size requested from list endpoints.')
+
+    def handle(self, *args, **options):
+        self.over_budget = 0
+        try:
+            with transaction.atomic(), override_settings(ALLOWED_HOSTS=['*']):
+                user = seed_catalog(options['departments'], options['courses'], options['syllabi'])
+                anonymous, admin = Client(), Client()
+                admin.force_login(user)
+                self.stdout.write(self.style.MIGRATE_HEADING('API endpoints (anonymous)'))
+                for url, budget in API_QUERY_BUDGETS.items():
+                    separator = '&' if '?' in url else '?'
+                    self._measure(anonymous, f"{url}{separator}limit={options['limit']}", budget)
+                self.stdout.write(self.style.MIGRATE_HEADING('Admin changelists'))
+                for url, budget in ADMIN_QUERY_BUDGETS.items():
+                    self._measure(admin, url, budget)
+                raise BenchmarkRollback
+        except BenchmarkRollback:
+            self.stdout.write('Benchmark data rolled back.')
+        if self.over_budget:
+            self.stderr.write(f'{self.over_budget} request(s) over budget.')
+
+    def _measure(self, client, url, budget):
+        cache.clear()
+        with QueryBudget(url) as measured:
+            response = client.get(url)
+        line = (f"  {url:<48} {response.status_code}  {measured.count:3d}/{budget:<3d} queries  "
+                f"{measured.db_time * 1000:8.2f} ms db  {measured.elapsed * 1000:8.2f} ms total")
+        if measured.count > budget:
+            self.over_budget += 1
+            self.stdout.write(self.style.ERROR(line))
+            self.stdout.write(measured.report())
+        else:
+            self.stdout.write(line)
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.7 on 2026-10-17 11:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0002_soft_delete_partial_indexes'),
+        ('courses', '0002_course_trigram_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['course_code'], name='course_live_code_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['discipline', 'course_code'], name='course_live_discipline_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='syllabus',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['course', 'version'], name='syllabus_live_course_ver_idx'),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.1.7 on 2026-10-17 11:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Counts of live courses per value of one column, as a JSON object, for department d.
+COUNTS_BY = """(
+        SELECT coalesce(jsonb_object_agg(value, total), '{{}}'::jsonb)
+        FROM (
+            SELECT {column} AS value, count(*) AS total
+            FROM courses_course
+            WHERE discipline_id = d.id AND NOT is_deleted
+            GROUP BY {column}
+        ) counts
+    )"""
+
+CREATE_VIEW = f"""
+CREATE MATERIALIZED VIEW courses_department_credit_summary AS
+SELECT
+    d.id AS department_id,
+    d.name AS department_name,
+    d.faculty AS faculty,
+    count(c.course_code) AS course_count,
+    coalesce(sum(c.maximum_credit), 0) AS total_credit,
+    avg(c.maximum_credit)::double precision AS average_credit,
+    {COUNTS_BY.format(column='cbcs_category')} AS cbcs_category_counts,
+    {COUNTS_BY.format(column='type')} AS type_counts,
+    {COUNTS_BY.format(column='course_category')} AS course_category_counts,
+    now() AS refreshed_at
+FROM academics_department d
+LEFT JOIN courses_course c ON c.discipline_id = d.id AND NOT c.is_deleted
+WHERE NOT d.is_deleted
+GROUP BY d.id;
+
+-- A unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY.
+CREATE UNIQUE INDEX courses_department_credit_summary_pk
+    ON courses_department_credit_summary (department_id);
+"""
+
+DROP_VIEW = "DROP MATERIALIZED VIEW IF EXISTS courses_department_credit_summary;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0002_soft_delete_partial_indexes'),
+        ('courses', '0003_soft_delete_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DepartmentCreditSummary',
+            fields=[
+                ('department', models.OneToOneField(on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='credit_summary', serialize=False, to='academics.department')),
+                ('department_name', models.CharField(max_length=50)),
+                ('faculty', models.CharField(max_length=4)),
+                ('course_count', models.PositiveIntegerField()),
+                ('total_credit', models.PositiveIntegerField()),
+                ('average_credit', models.FloatField(null=True)),
+                ('cbcs_category_counts', models.JSONField()),
+                ('type_counts', models.JSONField()),
+                ('course_category_counts', models.JSONField()),
+                ('refreshed_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'courses_department_credit_summary',
+                'managed': False,
+            },
+        ),
+        migrations.RunSQL(CREATE_VIEW, DROP_VIEW),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.7 on 2026-10-17 11:51
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0004_department_credit_summary'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyllabusUpload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('version', models.CharField(default='1.0', help_text='Version of the syllabus.', max_length=10)),
+                ('description', models.TextField(blank=True, help_text='Optional description of the syllabus.')),
+                ('filename', models.CharField(help_text='Original file name (must end in .pdf).', max_length=100)),
+                ('length', models.PositiveIntegerField(help_text='Total size of the file in bytes.')),
+                ('offset', models.PositiveIntegerField(default=0, help_text='Bytes received so far.')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('course', models.ForeignKey(help_text='Course the syllabus will belong to.', on_delete=django.db.models.deletion.CASCADE, related_name='syllabus_uploads', to='courses.course')),
+                ('syllabus', models.OneToOneField(blank=True, editable=False, help_text='Syllabus created when the upload completed.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='upload', to='courses.syllabus')),
+                ('uploaded_by', models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='syllabus_uploads', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['updated_at'], name='courses_syl_updated_ff5506_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.7 on 2026-10-17 11:55
+
+import courses.storage
+import courses.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0005_syllabus_upload'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyllabusBlob',
+            fields=[
+                ('sha256', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('name', models.CharField(help_text='Storage name of the blob.', max_length=255, unique=True)),
+                ('size', models.PositiveIntegerField(help_text='Size in bytes.')),
+                ('ref_count', models.PositiveIntegerField(default=0, help_text='Syllabi referencing this blob.')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='syllabus',
+            name='syllabus_file',
+            field=models.FileField(help_text='Upload a PDF syllabus file.', max_length=255, storage=courses.storage.ContentAddressedStorage(), upload_to='syllabi/%Y/%m/%d/', validators=[courses.validators.validate_pdf]),
+        ),
+    ]
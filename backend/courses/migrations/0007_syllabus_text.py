@@ -0,0 +1,30 @@
+# Generated by Django 5.1.7 on 2026-10-17 11:57
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0006_syllabus_blob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyllabusText',
+            fields=[
+                ('syllabus', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='text', serialize=False, to='courses.syllabus')),
+                ('file_name', models.CharField(help_text='Storage name of the extracted file.', max_length=255)),
+                ('content', models.TextField(blank=True, help_text='Extracted plain text.')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('error', models.CharField(blank=True, help_text='Why extraction failed, if it did.', max_length=255)),
+                ('extracted_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='syllabus_text_search_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.7 on 2026-10-17 12:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0007_syllabus_text'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='syllabus',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['course', '-version'], include=('id',), name='syllabus_live_latest_idx'),
+        ),
+    ]
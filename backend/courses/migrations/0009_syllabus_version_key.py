@@ -0,0 +1,67 @@
+# Generated by Django 5.1.7 on 2026-10-17 12:03
+
+import re
+
+from django.conf import settings
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def version_key(version):
+    # Frozen copy of courses.models.version_key
+    return re.sub(r'\d+', lambda match: match.group().zfill(6), version.strip())
+
+
+def backfill_version_keys(apps, schema_editor):
+    Syllabus = apps.get_model('courses', 'Syllabus')
+    batch = []
+    for syllabus in Syllabus.objects.only('pk', 'version').iterator(chunk_size=BATCH_SIZE):
+        syllabus.version_key = version_key(syllabus.version)
+        batch.append(syllabus)
+        if len(batch) == BATCH_SIZE:
+            Syllabus.objects.bulk_update(batch, ['version_key'])
+            batch = []
+    Syllabus.objects.bulk_update(batch, ['version_key'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0008_syllabus_latest_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='syllabus',
+            name='courses_syl_course__2a577a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='syllabus',
+            name='syllabus_live_course_ver_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='syllabus',
+            name='syllabus_live_latest_idx',
+        ),
+        migrations.AddField(
+            model_name='syllabus',
+            name='version_key',
+            field=models.CharField(default='', editable=False, help_text='Zero-padded version used for ordering (2.1 sorts before 10.0).', max_length=64),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_version_keys, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='syllabus',
+            index=models.Index(fields=['course', 'version_key'], name='syllabus_course_ver_key_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='syllabus',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['course', 'version_key'], name='syllabus_live_course_ver_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='syllabus',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['course', '-version_key'], include=('id',), name='syllabus_live_latest_idx'),
+        ),
+    ]
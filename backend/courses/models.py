@@ -1,6 +1,17 @@
+import os
+import re
+import uuid
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models, transaction
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.functions import Now
 from academics.models import Department
 from django.contrib.auth import get_user_model
+from university.managers import SoftDeleteManager, SoftDeleteQuerySet
+from .previews import preview_name
+from .storage import blob_digest, lock_blob, syllabus_storage
 from .validators import validate_pdf
 from enum import Enum
 
@@ -105,20 +116,76 @@ class Course(models.Model):
         help_text="Marks the course as soft-deleted."
     )
 
+    objects = SoftDeleteManager()
+
     class Meta:
         indexes = [
             models.Index(fields=['course_code']),
             models.Index(fields=['discipline']),
+            # Partial indexes covering only live rows (what non-staff requests query)
+            models.Index(fields=['course_code'], name='course_live_code_idx', condition=models.Q(is_deleted=False)),
+            models.Index(fields=['discipline', 'course_code'], name='course_live_discipline_idx',
+                         condition=models.Q(is_deleted=False)),
+            # Trigram indexes (pg_trgm) for typo-tolerant autocomplete
+            GinIndex(fields=['course_code'], name='course_code_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['course_name'], name='course_name_trgm_idx', opclasses=['gin_trgm_ops']),
         ]
 
     def __str__(self):
         return f"{self.course_code} - {self.course_name}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered so save() only propagates actual renames.
+        instance._loaded_course_name = instance.__dict__.get('course_name')
+        return instance
+
+    def save(self, *args, **kwargs):
+        """Saves the course and copies a changed course_name to its syllabi with one UPDATE."""
+        update_fields = kwargs.get('update_fields')
+        renamed = (
+            not self._state.adding
+            and (update_fields is None or 'course_name' in update_fields)
+            and 'course_name' in self.__dict__
+            and self.course_name != getattr(self, '_loaded_course_name', self.course_name)
+        )
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+            if renamed:
+                Syllabus.objects.filter(course_id=self.pk).sync_course_names()
+        self._loaded_course_name = self.course_name
+
     @property
     def is_active(self):
         """Returns True if the course is not soft-deleted."""
         return not self.is_deleted
 
+VERSION_PART_WIDTH = 6  # Digits each numeric part of a version is padded to
+
+def version_key(version):
+    """
+    Sortable form of a version string: every run of digits is zero-padded, so
+    text order matches numeric order ("2.1" -> "000002.000001" < "000010.000000").
+    """
+    return re.sub(r'\d+', lambda match: match.group().zfill(VERSION_PART_WIDTH), version.strip())
+
+class SyllabusQuerySet(SoftDeleteQuerySet):
+    def sync_course_names(self):
+        """Copies the current course name into the selected syllabi with a single UPDATE."""
+        return self.update(
+            course_name=Subquery(Course.objects.filter(pk=OuterRef('course_id')).values('course_name')[:1]),
+            updated_at=Now(),  # update() skips auto_now; keeps list validators in step
+        )
+
+    def latest_per_course(self):
+        """
+        The highest version of each course, as one DISTINCT ON (course) query.
+        On live rows it is answered from syllabus_live_latest_idx.
+        """
+        return self.order_by('course_id', '-version_key').distinct('course_id')
+
+
 class Syllabus(models.Model):
     """
     Represents a syllabus document for a specific course version.
@@ -136,7 +203,8 @@ class Syllabus(models.Model):
         help_text="Auto-populated from the course name."
     )
     syllabus_file = models.FileField(
-        upload_to='syllabi/%Y/%m/%d/',
+        upload_to='syllabi/%Y/%m/%d/',  # Only the extension is kept; names are content hashes
+        storage=syllabus_storage,
         validators=[validate_pdf],
         max_length=255,
         help_text="Upload a PDF syllabus file."
@@ -175,29 +243,241 @@ class Syllabus(models.Model):
         default='1.0',
         help_text="Version of the syllabus (e.g., 1.0, 2.1)."
     )
+    version_key = models.CharField(
+        max_length=64,
+        editable=False,
+        help_text="Zero-padded version used for ordering (2.1 sorts before 10.0)."
+    )
     is_deleted = models.BooleanField(
         default=False,
         help_text="Marks the syllabus as soft-deleted."
     )
 
+    objects = SoftDeleteManager.from_queryset(SyllabusQuerySet)()
+
     class Meta:
         verbose_name_plural = 'Syllabi'
         unique_together = ('course', 'version')
         indexes = [
-            models.Index(fields=['course', 'version']),
+            # Version order within a course (latest-version and version-range seeks)
+            models.Index(fields=['course', 'version_key'], name='syllabus_course_ver_key_idx'),
             models.Index(fields=['uploaded_at']),
+            # Partial index covering only live rows (what non-staff requests query)
+            models.Index(fields=['course', 'version_key'], name='syllabus_live_course_ver_idx',
+                         condition=models.Q(is_deleted=False)),
+            # Latest version per course (DISTINCT ON); covers id so the lookup is index-only
+            models.Index(fields=['course', '-version_key'], name='syllabus_live_latest_idx', include=['id'],
+                         condition=models.Q(is_deleted=False)),
         ]
 
     def __str__(self):
-        return f"{self.course.course_code} - Version {self.version}"
+        return f"{self.course_id} - Version {self.version}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_course_id = instance.__dict__.get('course_id')
+        instance._loaded_file_name = instance.__dict__.get('syllabus_file')
+        return instance
 
     def save(self, *args, **kwargs):
-        """Auto-populate course_name from the related Course."""
-        if self.course:
+        """
+        Auto-populate course_name from the related Course when the syllabus is
+        created or moved to another course; the cached course is used when set.
+        Renames reach existing syllabi through Course.save(). Keeps version_key
+        in step with version.
+        """
+        self.version_key = version_key(self.version)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'version' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'version_key'}
+        if self.course_id is not None and (
+            self._state.adding or self.course_id != getattr(self, '_loaded_course_id', None)
+        ):
             self.course_name = self.course.course_name
-        super().save(*args, **kwargs)
+        previous_file = getattr(self, '_loaded_file_name', None)
+        file_changed = 'syllabus_file' in self.__dict__ and self.syllabus_file.name != previous_file
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+            if file_changed:
+                SyllabusBlob.objects.retain(self.syllabus_file.name)
+                SyllabusBlob.objects.release(previous_file)
+        self._loaded_course_id = self.course_id
+        self._loaded_file_name = self.syllabus_file.name
 
     @property
     def is_active(self):
         """Returns True if the syllabus is not soft-deleted."""
-        return not self.is_deleted
\ No newline at end of file
+        return not self.is_deleted
+
+
+class SyllabusBlobManager(models.Manager):
+    def retain(self, name):
+        """Counts one more syllabus referencing the blob stored under name (legacy names are ignored)."""
+        digest = blob_digest(name)
+        if digest is None:
+            return
+        with transaction.atomic():
+            blob, created = self.select_for_update().get_or_create(
+                sha256=digest, defaults={'name': name, 'size': syllabus_storage.size(name), 'ref_count': 1}
+            )
+            if not created:
+                self.filter(pk=blob.pk).update(ref_count=F('ref_count') + 1)
+
+    def release(self, name):
+        """Drops one reference; the last one deletes the row and, after commit, the file."""
+        digest = blob_digest(name)
+        if digest is None:
+            return
+        with transaction.atomic():
+            blob = self.select_for_update().filter(pk=digest).first()
+            if blob is None:
+                return
+            if blob.ref_count > 1:
+                self.filter(pk=digest).update(ref_count=F('ref_count') - 1)
+                return
+            blob.delete()
+        transaction.on_commit(lambda: self.discard_unreferenced(name))
+
+    def discard_unreferenced(self, name):
+        """
+        Deletes the blob stored under name, and its preview, unless a row
+        references it. Waits on the digest's lock first, so an upload that is
+        reusing the file commits its reference before the check.
+        """
+        digest = blob_digest(name)
+        if digest is None:
+            return
+        with transaction.atomic():
+            lock_blob(digest)
+            if self.filter(pk=digest).exists():
+                return
+            syllabus_storage.delete(name)
+            preview = preview_name(name)
+            if syllabus_storage.exists(preview):
+                syllabus_storage.delete(preview)
+
+
+class SyllabusBlob(models.Model):
+    """
+    A distinct syllabus file in content-addressed storage and the number of
+    syllabus rows (any version, any course, live or soft-deleted) using it.
+    """
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    name = models.CharField(max_length=255, unique=True, help_text="Storage name of the blob.")
+    size = models.PositiveIntegerField(help_text="Size in bytes.")
+    ref_count = models.PositiveIntegerField(default=0, help_text="Syllabi referencing this blob.")
+    created_at = models.DateTimeField(auto_now_add=True, editable=False)
+
+    objects = SyllabusBlobManager()
+
+    def __str__(self):
+        return f"{self.sha256[:12]} ({self.ref_count} references)"
+
+
+class SyllabusText(models.Model):
+    """
+    Text extracted from a syllabus PDF by courses.tasks, with its search vector.
+    file_name is the stored file the text came from: a new file triggers
+    re-extraction, an unchanged one is never parsed twice.
+    """
+    syllabus = models.OneToOneField(
+        Syllabus,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='text',
+    )
+    file_name = models.CharField(max_length=255, help_text="Storage name of the extracted file.")
+    content = models.TextField(blank=True, help_text="Extracted plain text.")
+    search_vector = SearchVectorField(null=True, editable=False)
+    error = models.CharField(max_length=255, blank=True, help_text="Why extraction failed, if it did.")
+    extracted_at = models.DateTimeField(auto_now=True, editable=False)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='syllabus_text_search_idx'),
+        ]
+
+    def __str__(self):
+        return f"Text of syllabus {self.syllabus_id}"
+
+
+class SyllabusUpload(models.Model):
+    """
+    A resumable (tus-style) syllabus upload in progress. Chunks are appended to
+    a part file under SYLLABUS_UPLOAD_DIR; once offset reaches length the file
+    is moved to storage as a new Syllabus and linked through syllabus.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        to_field='course_code',
+        related_name='syllabus_uploads',
+        help_text="Course the syllabus will belong to."
+    )
+    version = models.CharField(max_length=10, default='1.0', help_text="Version of the syllabus.")
+    description = models.TextField(blank=True, help_text="Optional description of the syllabus.")
+    filename = models.CharField(max_length=100, help_text="Original file name (must end in .pdf).")
+    length = models.PositiveIntegerField(help_text="Total size of the file in bytes.")
+    offset = models.PositiveIntegerField(default=0, help_text="Bytes received so far.")
+    uploaded_by = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='syllabus_uploads',
+        editable=False,
+    )
+    created_at = models.DateTimeField(auto_now_add=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, editable=False)
+    syllabus = models.OneToOneField(
+        Syllabus,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='upload',
+        editable=False,
+        help_text="Syllabus created when the upload completed."
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.course_id} - Version {self.version} ({self.offset}/{self.length} bytes)"
+
+    @property
+    def part_path(self):
+        return os.path.join(settings.SYLLABUS_UPLOAD_DIR, f"{self.pk}.part")
+
+    @property
+    def is_complete(self):
+        return self.syllabus_id is not None
+
+
+class DepartmentCreditSummary(models.Model):
+    """
+    Read-only per-department credit rollup backed by the
+    courses_department_credit_summary materialized view (live rows only).
+    Refreshed through courses.analytics.refresh_department_credit_summary().
+    """
+    department = models.OneToOneField(
+        Department,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        related_name='credit_summary',
+    )
+    department_name = models.CharField(max_length=50)
+    faculty = models.CharField(max_length=4)
+    course_count = models.PositiveIntegerField()
+    total_credit = models.PositiveIntegerField()
+    average_credit = models.FloatField(null=True)
+    cbcs_category_counts = models.JSONField()
+    type_counts = models.JSONField()
+    course_category_counts = models.JSONField()
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        managed = False
+        db_table = 'courses_department_credit_summary'
@@ -0,0 +1,60 @@
+"""
+PDF text extraction, run inside worker processes. Kept free of Django imports
+so spawned workers start quickly and never touch the database.
+"""
+import re
+import signal
+import threading
+from contextlib import contextmanager
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # Optional dependency: pip install pypdf
+    PdfReader = None
+
+# PostgreSQL caps a tsvector at 1 MB; syllabi rarely need more than this.
+MAX_TEXT_LENGTH = 200_000
+_WHITESPACE = re.compile(r'\s+')
+
+def extraction_available():
+    return PdfReader is not None
+
+@contextmanager
+def _deadline(seconds):
+    """
+    Raises TimeoutError in the block after seconds, using SIGALRM. Pool
+    workers run tasks on their main thread, so the alarm interrupts even a
+    parser stuck on a malformed file. A no-op without a timeout, off the main
+    thread, or where SIGALRM does not exist (Windows).
+    """
+    if not seconds or not hasattr(signal, 'SIGALRM') or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def expire(signum, frame):
+        raise TimeoutError(f'Extraction took longer than {seconds:g} s.')
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+def extract_pdf_text(path, max_length=MAX_TEXT_LENGTH, timeout=None):
+    """
+    Returns the whitespace-normalized text of the PDF at path, truncated to
+    max_length. Raises TimeoutError when it takes longer than timeout seconds.
+    """
+    if PdfReader is None:
+        raise RuntimeError('PDF text extraction requires the pypdf package.')
+    parts, length = [], 0
+    with _deadline(timeout):
+        for page in PdfReader(path).pages:
+            text = _WHITESPACE.sub(' ', page.extract_text() or '').strip()
+            if text:
+                parts.append(text)
+                length += len(text) + 1
+            if length >= max_length:
+                break
+    return ' '.join(parts)[:max_length]
@@ -0,0 +1,57 @@
+import os
+import subprocess
+import tempfile
+from django.conf import settings
+from .storage import blob_digest, syllabus_storage
+
+PREVIEW_PREFIX = 'syllabi/previews'
+RENDER_TIMEOUT = 30  # Seconds
+
+def preview_name(file_name):
+    """
+    Storage name of the first-page preview of a stored syllabus file, keyed by
+    the file's SHA-256 so identical files share one preview and a new file gets
+    a new one. None for legacy (not content-addressed) names.
+    """
+    digest = blob_digest(file_name)
+    if digest is None:
+        return None
+    return f"{PREVIEW_PREFIX}/{digest[:2]}/{digest}-{settings.SYLLABUS_PREVIEW_WIDTH}.png"
+
+def preview_exists(file_name):
+    name = preview_name(file_name)
+    return name is not None and syllabus_storage.exists(name)
+
+def render_first_page(pdf_path, output_path, width, binary='pdftoppm'):
+    """
+    Renders page 1 of the PDF to a PNG width pixels wide with poppler's
+    pdftoppm. Writes to a temporary file and renames it, so readers never see
+    a partial image.
+    """
+    directory = os.path.dirname(output_path)
+    os.makedirs(directory, exist_ok=True)
+    handle, temp_path = tempfile.mkstemp(dir=directory, suffix='.png')
+    os.close(handle)
+    try:
+        subprocess.run(
+            [binary, '-png', '-f', '1', '-l', '1', '-singlefile',
+             '-scale-to-x', str(width), '-scale-to-y', '-1', pdf_path, temp_path[:-len('.png')]],
+            check=True, capture_output=True, timeout=RENDER_TIMEOUT,
+        )
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def generate_preview(file_name):
+    """Renders the preview of a stored syllabus file unless it already exists. Returns its name."""
+    name = preview_name(file_name)
+    if name is None or syllabus_storage.exists(name):
+        return name
+    render_first_page(
+        syllabus_storage.path(file_name), syllabus_storage.path(name),
+        settings.SYLLABUS_PREVIEW_WIDTH, settings.SYLLABUS_PREVIEW_BINARY,
+    )
+    return name
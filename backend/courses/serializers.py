@@ -1,5 +1,12 @@
+from django.db import transaction
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Course, Syllabus, CourseCategory, CourseType, CBCSCategory, User
+from academics.models import Department
+from university.fieldsets import SparseFieldsetSerializerMixin
+from .models import Course, Syllabus, SyllabusUpload, CourseCategory, CourseType, CBCSCategory, User
+from .downloads import syllabus_download_path, syllabus_preview_path
+from .signals import courses_bulk_saved
+from .validators import MAX_SYLLABUS_SIZE
 
 class ChoiceSerializer(serializers.Serializer):
     """Serializer for Enum choices."""
@@ -9,7 +16,7 @@ class ChoiceSerializer(serializers.Serializer):
     def to_representation(self, instance):
         return {'value': instance[0], 'label': instance[1]}
 
-class CourseSerializer(serializers.ModelSerializer):
+class CourseSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """Serializer for Course model CRUD operations."""
     created_by = serializers.PrimaryKeyRelatedField(read_only=True)
     updated_by = serializers.PrimaryKeyRelatedField(read_only=True)
@@ -46,17 +53,119 @@ class CourseSerializer(serializers.ModelSerializer):
         instance.save()
         return instance
 
-class SyllabusSerializer(serializers.ModelSerializer):
+class CourseBulkListSerializer(serializers.ListSerializer):
+    """
+    Validates and writes a batch of courses with a fixed number of queries:
+    one lookup for existing course codes, one for disciplines and a single
+    bulk_create/bulk_update inside a transaction. Errors are returned per item.
+    """
+
+    def to_internal_value(self, data):
+        items = super().to_internal_value(data)
+        errors = [{} for _ in items]
+        codes = [item.get('course_code') for item in items]
+
+        if self.instance is None:
+            existing = set(Course.objects.filter(pk__in=codes).values_list('pk', flat=True))
+        else:
+            existing = {course.pk for course in self.instance}
+        disciplines = {item['discipline'] for item in items if 'discipline' in item}
+        known_disciplines = set(
+            Department.objects.filter(pk__in=disciplines).values_list('pk', flat=True)
+        )
+
+        seen = set()
+        for index, item in enumerate(items):
+            code = codes[index]
+            if code is None:
+                errors[index]['course_code'] = ['This field is required.']
+            elif code in seen:
+                errors[index]['course_code'] = ['Duplicate course code in this request.']
+            elif self.instance is None and code in existing:
+                errors[index]['course_code'] = ['Course with this course code already exists.']
+            elif self.instance is not None and code not in existing:
+                errors[index]['course_code'] = ['Course with this course code does not exist.']
+            seen.add(code)
+            if 'discipline' in item and item['discipline'] not in known_disciplines:
+                errors[index]['discipline'] = [f'Invalid pk "{item["discipline"]}" - object does not exist.']
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return items
+
+    def create(self, validated_data):
+        """Insert all courses in one transaction, stamping created_by/updated_by."""
+        user = self.context['request'].user
+        courses = [
+            Course(
+                discipline_id=item.pop('discipline'),
+                created_by=user,
+                updated_by=user,
+                **item
+            )
+            for item in validated_data
+        ]
+        with transaction.atomic():
+            Course.objects.bulk_create(courses)
+            courses_bulk_saved.send(sender=Course, instances=courses, created=True)
+        return courses
+
+    def update(self, instance, validated_data):
+        """Update all courses in one transaction, stamping updated_by and renaming their syllabi."""
+        user = self.context['request'].user
+        courses = {course.pk: course for course in instance}
+        now = timezone.now()
+        fields = {'updated_by', 'updated_at'}
+        renamed = []
+        for item in validated_data:
+            course = courses[item.pop('course_code')]
+            if 'discipline' in item:
+                course.discipline_id = item.pop('discipline')
+                fields.add('discipline')
+            if item.get('course_name', course.course_name) != course.course_name:
+                renamed.append(course.pk)
+            for attr, value in item.items():
+                setattr(course, attr, value)
+                fields.add(attr)
+            course.updated_by = user
+            course.updated_at = now  # bulk_update() skips auto_now
+        updated = list(courses.values())
+        with transaction.atomic():
+            Course.objects.bulk_update(updated, sorted(fields))
+            if renamed:
+                Syllabus.objects.filter(course_id__in=renamed).sync_course_names()
+            courses_bulk_saved.send(sender=Course, instances=updated, created=False)
+        return updated
+
+class CourseBulkSerializer(serializers.ModelSerializer):
+    """Item serializer for bulk course writes; use with many=True."""
+    # Existence of the discipline and uniqueness of course_code are checked for
+    # the whole batch in CourseBulkListSerializer instead of once per item.
+    discipline = serializers.CharField(max_length=3)
+
+    class Meta:
+        model = Course
+        fields = [
+            'course_code', 'course_name', 'course_category', 'type', 'cbcs_category',
+            'maximum_credit', 'discipline', 'is_deleted'
+        ]
+        extra_kwargs = {'course_code': {'validators': []}}
+        list_serializer_class = CourseBulkListSerializer
+
+class SyllabusSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """Serializer for Syllabus model CRUD operations."""
     uploaded_by = serializers.PrimaryKeyRelatedField(read_only=True)
     updated_by = serializers.PrimaryKeyRelatedField(read_only=True)
     course = serializers.PrimaryKeyRelatedField(queryset=Course.objects.all())  # Use course_code
+    download_url = serializers.SerializerMethodField()
+    preview_url = serializers.SerializerMethodField()
 
     class Meta:
         model = Syllabus
         fields = [
             'id', 'course', 'course_name', 'syllabus_file', 'uploaded_by', 'uploaded_at',
-            'updated_by', 'updated_at', 'description', 'version', 'is_deleted'
+            'updated_by', 'updated_at', 'description', 'version', 'is_deleted', 'download_url',
+            'preview_url'
         ]
         read_only_fields = ['course_name', 'uploaded_by', 'uploaded_at', 'updated_by', 'updated_at']
 
@@ -78,4 +187,61 @@ class SyllabusSerializer(serializers.ModelSerializer):
         instance.version = validated_data.get('version', instance.version)
         instance.updated_by = request.user
         instance.save()
-        return instance
\ No newline at end of file
+        return instance
+
+    def get_download_url(self, obj):
+        """Access-controlled, range-capable download URL pinned to the current file."""
+        if not obj.syllabus_file:
+            return None
+        path = syllabus_download_path(obj)
+        request = self.context.get('request')
+        return request.build_absolute_uri(path) if request else path
+
+    def get_preview_url(self, obj):
+        """Access-controlled first-page PNG preview, or None until the background worker has rendered it."""
+        path = syllabus_preview_path(obj)
+        request = self.context.get('request')
+        return request.build_absolute_uri(path) if path and request else path
+
+class SyllabusContentSearchSerializer(serializers.ModelSerializer):
+    """A syllabus matching a content search, with its rank and a highlighted snippet."""
+    rank = serializers.FloatField(read_only=True)
+    headline = serializers.CharField(read_only=True)
+
+    class Meta:
+        model = Syllabus
+        fields = ['id', 'course', 'course_name', 'version', 'description', 'rank', 'headline']
+
+class SyllabusUploadSerializer(serializers.ModelSerializer):
+    """Creates and reports resumable syllabus uploads."""
+    course = serializers.PrimaryKeyRelatedField(queryset=Course.objects.live())
+    filename = serializers.CharField(max_length=100, required=False)
+
+    class Meta:
+        model = SyllabusUpload
+        fields = [
+            'id', 'course', 'version', 'description', 'filename', 'length', 'offset',
+            'syllabus', 'created_at', 'updated_at'
+        ]
+        read_only_fields = ['offset', 'syllabus', 'created_at', 'updated_at']
+
+    def validate_length(self, value):
+        if value < 1 or value > MAX_SYLLABUS_SIZE:
+            raise serializers.ValidationError('File size must be between 1 byte and 5MB.')
+        return value
+
+    def validate_filename(self, value):
+        if not value.lower().endswith('.pdf'):
+            raise serializers.ValidationError('Only PDF files are allowed.')
+        return value
+
+    def validate(self, attrs):
+        version = attrs.get('version', '1.0')
+        if Syllabus.objects.filter(course=attrs['course'], version=version).exists():
+            raise serializers.ValidationError({'version': ['A syllabus with this course and version already exists.']})
+        attrs.setdefault('filename', f"{attrs['course'].course_code}-{version}.pdf")
+        return attrs
+
+    def create(self, validated_data):
+        validated_data['uploaded_by'] = self.context['request'].user
+        return super().create(validated_data)
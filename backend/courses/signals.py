@@ -0,0 +1,44 @@
+from functools import partial
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import Signal, receiver
+from academics.models import Department
+from university.cache import invalidate_catalog_cache_on_commit
+from .analytics import mark_credit_summary_stale
+from .tasks import schedule_preview, schedule_text_extraction
+from .models import Course, Syllabus, SyllabusBlob
+
+# Sent by bulk course writes, which bypass post_save. Arguments: instances, created.
+courses_bulk_saved = Signal()
+
+# Any catalog write (including soft deletes, which go through save()) drops the cached read responses.
+for model in (Course, Syllabus):
+    post_save.connect(invalidate_catalog_cache_on_commit, sender=model, dispatch_uid=f'catalog_cache_save_{model.__name__}')
+    post_delete.connect(invalidate_catalog_cache_on_commit, sender=model, dispatch_uid=f'catalog_cache_delete_{model.__name__}')
+courses_bulk_saved.connect(invalidate_catalog_cache_on_commit, sender=Course, dispatch_uid='catalog_cache_bulk_Course')
+
+# Course and department writes make the credit summary materialized view stale.
+for model in (Course, Department):
+    post_save.connect(mark_credit_summary_stale, sender=model, dispatch_uid=f'credit_summary_save_{model.__name__}')
+    post_delete.connect(mark_credit_summary_stale, sender=model, dispatch_uid=f'credit_summary_delete_{model.__name__}')
+courses_bulk_saved.connect(mark_credit_summary_stale, sender=Course, dispatch_uid='credit_summary_bulk_Course')
+
+# Hard-deleted syllabi (admin, course cascade) give up their reference to the shared file.
+@receiver(post_delete, sender=Syllabus, dispatch_uid='syllabus_blob_release')
+def release_syllabus_blob(sender, instance, **kwargs):
+    SyllabusBlob.objects.release(instance.syllabus_file.name)
+
+# New or replaced syllabus files get their text extracted off the request path, once committed.
+@receiver(post_save, sender=Syllabus, dispatch_uid='syllabus_text_extraction')
+def extract_syllabus_text(sender, instance, raw=False, **kwargs):
+    if raw or not settings.SYLLABUS_TEXT_EXTRACTION:
+        return
+    transaction.on_commit(partial(schedule_text_extraction, instance))
+
+# First-page previews are rendered by a local worker pool, once per distinct file.
+@receiver(post_save, sender=Syllabus, dispatch_uid='syllabus_preview')
+def generate_syllabus_preview(sender, instance, raw=False, **kwargs):
+    if raw or not settings.SYLLABUS_PREVIEWS:
+        return
+    transaction.on_commit(partial(schedule_preview, instance))
@@ -0,0 +1,82 @@
+import hashlib
+import os
+import re
+import tempfile
+from django.core.files.storage import FileSystemStorage
+from django.db import connection
+
+BLOB_PREFIX = 'syllabi/sha256'
+HASH_BLOCK_SIZE = 1024 * 1024
+_BLOB_NAME = re.compile(rf'^{re.escape(BLOB_PREFIX)}/[0-9a-f]{{2}}/(?P<digest>[0-9a-f]{{64}})\.[a-z0-9]+$')
+
+def blob_name(digest, ext='.pdf'):
+    """Storage name of the blob with the given SHA-256 hex digest."""
+    return f"{BLOB_PREFIX}/{digest[:2]}/{digest}{ext.lower()}"
+
+def blob_digest(name):
+    """The SHA-256 digest encoded in a blob name, or None for other (legacy) names."""
+    match = _BLOB_NAME.match(name or '')
+    return match.group('digest') if match else None
+
+def lock_blob(digest):
+    """
+    Takes a PostgreSQL advisory lock on the digest until the current
+    transaction ends. Reusing a stored blob and deleting an unreferenced one
+    both hold it, so a delete cannot slip in between an upload finding the file
+    and committing its SyllabusBlob reference.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))', [digest])
+
+def hash_file(path):
+    """SHA-256 hex digest of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File system storage that names files by the SHA-256 of their content
+    (syllabi/sha256/<aa>/<digest>.pdf). The content is hashed while it is
+    copied into a temporary file next to the blobs; saving bytes that are
+    already stored returns the existing name, so each distinct file is kept
+    once. The upload_to name only contributes its extension.
+
+    Blobs are shared, so deleting one is left to SyllabusBlob reference counting.
+    Save inside the transaction that retains the blob (Syllabus.save does):
+    the digest stays locked until it commits.
+    """
+
+    def _save(self, name, content):
+        ext = os.path.splitext(name)[1]
+        directory = self.path(BLOB_PREFIX)
+        os.makedirs(directory, exist_ok=True)
+        digest = hashlib.sha256()
+        handle, temp_path = tempfile.mkstemp(dir=directory, suffix='.part')
+        try:
+            with os.fdopen(handle, 'wb') as temp:
+                for chunk in content.chunks():
+                    digest.update(chunk)
+                    temp.write(chunk)
+            name = blob_name(digest.hexdigest(), ext)
+            lock_blob(digest.hexdigest())
+            path = self.path(name)
+            if os.path.exists(path):
+                os.remove(temp_path)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.chmod(temp_path, self.file_permissions_mode if self.file_permissions_mode is not None else 0o644)
+                os.replace(temp_path, path)  # Atomic: readers never see a partial blob
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return name
+
+    def get_available_name(self, name, max_length=None):
+        # The final name comes from the content hash; skip the exists()/suffix dance.
+        return name
+
+syllabus_storage = ContentAddressedStorage()
@@ -0,0 +1,140 @@
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import connection
+from django.db.models.functions import Now
+from university.cache import invalidate_catalog_cache
+from .models import Syllabus, SyllabusText
+from .pdftext import extract_pdf_text, extraction_available
+from .previews import generate_preview, preview_exists
+
+logger = logging.getLogger(__name__)
+
+TEXT_SEARCH_CONFIG = 'english'
+
+_executor = None
+_executor_lock = threading.Lock()
+_preview_executor = None
+_previews_in_flight = set()
+
+def get_executor():
+    """
+    The process pool of this web worker, created on first use. Workers are
+    spawned rather than forked so they never inherit database connections or
+    server threads.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.SYLLABUS_TEXT_WORKERS,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return _executor
+
+def store_text(syllabus_id, file_name, content='', error=''):
+    """
+    Saves extracted text and refreshes its search vector. Results for a file
+    the syllabus no longer points at are dropped. Returns True when stored.
+    """
+    if not Syllabus.objects.filter(pk=syllabus_id, syllabus_file=file_name).exists():
+        return False
+    SyllabusText.objects.update_or_create(
+        syllabus_id=syllabus_id,
+        defaults={'file_name': file_name, 'content': content, 'error': error[:255]},
+    )
+    SyllabusText.objects.filter(pk=syllabus_id).update(
+        search_vector=SearchVector('content', config=TEXT_SEARCH_CONFIG)
+    )
+    return True
+
+def reuse_text(syllabus_id, file_name):
+    """Copies text already extracted from the same stored file (names are content hashes)."""
+    source = SyllabusText.objects.filter(file_name=file_name, error='').exclude(syllabus_id=syllabus_id).first()
+    return source is not None and store_text(syllabus_id, file_name, source.content)
+
+def _extraction_done(syllabus_id, file_name, scheduling_thread, future):
+    # Normally runs on the pool's result thread, which gets its own database
+    # connection; a future that finished before the callback was attached runs
+    # it on the scheduling thread, whose connection must stay open.
+    try:
+        try:
+            content, error = future.result(), ''
+        except Exception as exc:
+            logger.warning('Text extraction failed for syllabus %s: %s', syllabus_id, exc)
+            content, error = '', f'{type(exc).__name__}: {exc}'
+        store_text(syllabus_id, file_name, content, error)
+    except Exception:
+        logger.exception('Could not store extracted text for syllabus %s', syllabus_id)
+    finally:
+        if threading.get_ident() != scheduling_thread:
+            connection.close()
+
+def schedule_text_extraction(syllabus):
+    """
+    Queues extraction of the syllabus file on the process pool unless its
+    text is already current. Returns the future, or None when nothing was queued.
+    """
+    file_name = syllabus.syllabus_file.name
+    if not file_name or not extraction_available():
+        return None
+    if SyllabusText.objects.filter(syllabus_id=syllabus.pk, file_name=file_name).exists():
+        return None
+    if reuse_text(syllabus.pk, file_name):
+        return None
+    future = get_executor().submit(
+        extract_pdf_text, syllabus.syllabus_file.path, timeout=settings.SYLLABUS_TEXT_TIMEOUT
+    )
+    future.add_done_callback(partial(_extraction_done, syllabus.pk, file_name, threading.get_ident()))
+    return future
+
+def get_preview_executor():
+    """Thread pool for previews: rendering runs in a pdftoppm subprocess, so threads suffice."""
+    global _preview_executor
+    with _executor_lock:
+        if _preview_executor is None:
+            _preview_executor = ThreadPoolExecutor(
+                max_workers=settings.SYLLABUS_PREVIEW_WORKERS, thread_name_prefix='syllabus-preview'
+            )
+        return _preview_executor
+
+def preview_ready(file_name):
+    """
+    Publishes a freshly rendered preview: touching updated_at changes the
+    validators of the syllabi using the file, and the cached catalog responses
+    (which carried preview_url null) are dropped.
+    """
+    Syllabus.objects.filter(syllabus_file=file_name).update(updated_at=Now())
+    invalidate_catalog_cache()
+
+def _preview_done(file_name, scheduling_thread, future):
+    with _executor_lock:
+        _previews_in_flight.discard(file_name)
+    try:
+        future.result()
+        preview_ready(file_name)
+    except Exception as exc:
+        logger.warning('Preview generation failed for %s: %s', file_name, exc)
+    finally:
+        if threading.get_ident() != scheduling_thread:
+            connection.close()
+
+def schedule_preview(syllabus):
+    """
+    Queues a first-page preview of the syllabus file unless one already exists
+    for its content (or is being rendered). Returns the future, or None.
+    """
+    file_name = syllabus.syllabus_file.name
+    if not file_name or preview_exists(file_name):
+        return None
+    with _executor_lock:
+        if file_name in _previews_in_flight:
+            return None
+        _previews_in_flight.add(file_name)
+    future = get_preview_executor().submit(generate_preview, file_name)
+    future.add_done_callback(partial(_preview_done, file_name, threading.get_ident()))
+    return future
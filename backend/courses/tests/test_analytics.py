@@ -0,0 +1,97 @@
+import threading
+import time
+from unittest import mock
+from django.core.cache import cache
+from django.db.models import Count, Sum
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from courses.analytics import get_refresh_executor, refresh_department_credit_summary
+from courses.models import Course
+from university.testing import seed_catalog
+
+
+class DepartmentCreditAnalyticsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_catalog(departments=2, courses_per_department=12, syllabi_per_course=0)
+
+    def setUp(self):
+        cache.clear()
+
+    def drain_refreshes(self):
+        # The executor has one thread, so a no-op queued last finishes last.
+        get_refresh_executor().submit(lambda: None).result(timeout=10)
+
+    def test_report_matches_live_courses(self):
+        refresh_department_credit_summary(concurrently=False)
+        response = APIClient().get('/courses/analytics/departments/')
+        self.assertEqual(response.status_code, 200)
+        expected = {
+            row['discipline']: (row['count'], row['total'])
+            for row in Course.objects.live().values('discipline').annotate(count=Count('pk'), total=Sum('maximum_credit'))
+        }
+        self.assertEqual(
+            {row['department']: (row['course_count'], row['total_credit']) for row in response.data['departments']},
+            expected,
+        )
+        self.assertEqual(sum(row['course_count'] for row in response.data['faculties']), Course.objects.live().count())
+        self.assertIsNone(response.data['pending_changes_since'])
+
+        faculty = response.data['departments'][0]['faculty']
+        filtered = APIClient().get('/courses/analytics/departments/', {'faculty': faculty}).data
+        self.assertEqual({row['faculty'] for row in filtered['departments']}, {faculty})
+
+    @override_settings(COURSE_ANALYTICS_REFRESH_ON_WRITE=False)
+    def test_write_marks_report_pending_until_refresh(self):
+        refresh_department_credit_summary(concurrently=False)
+        course = Course.objects.live().first()
+        course.maximum_credit += 1
+        course.save()
+        self.assertIsNotNone(APIClient().get('/courses/analytics/departments/').data['pending_changes_since'])
+        refresh_department_credit_summary(concurrently=False)
+        response = APIClient().get('/courses/analytics/departments/')
+        self.assertIsNone(response.data['pending_changes_since'])
+        row = next(row for row in response.data['departments'] if row['department'] == course.discipline_id)
+        self.assertEqual(row['total_credit'], sum(
+            Course.objects.live().filter(discipline=course.discipline).values_list('maximum_credit', flat=True)
+        ))
+
+    @override_settings(COURSE_ANALYTICS_REFRESH_ON_WRITE=True, COURSE_ANALYTICS_MIN_REFRESH_INTERVAL=60)
+    def test_refresh_on_write_is_throttled_and_off_the_request_thread(self):
+        threads = []
+        course = Course.objects.live().first()
+        with mock.patch('courses.analytics.refresh_department_credit_summary',
+                        side_effect=lambda: threads.append(threading.get_ident())), \
+                mock.patch('courses.analytics.threading.Timer') as timer:
+            for credit in (1, 2, 3):
+                with self.captureOnCommitCallbacks(execute=True):
+                    course.maximum_credit = credit
+                    course.save()
+            self.drain_refreshes()
+            self.assertEqual(len(threads), 1)
+            self.assertNotEqual(threads[0], threading.get_ident())
+            timer.assert_called_once()  # One trailing refresh for the two throttled writes
+            self.assertGreater(timer.call_args.args[0], 55)
+
+            cache.clear()  # The interval has passed
+            with self.captureOnCommitCallbacks(execute=True):
+                course.save()
+            self.drain_refreshes()
+        self.assertEqual(len(threads), 2)
+
+    @override_settings(COURSE_ANALYTICS_REFRESH_ON_WRITE=True, COURSE_ANALYTICS_MIN_REFRESH_INTERVAL=1)
+    def test_writes_inside_interval_get_one_trailing_refresh(self):
+        refreshed = []
+        course = Course.objects.live().first()
+        with mock.patch('courses.analytics.refresh_department_credit_summary',
+                        side_effect=lambda: refreshed.append(time.monotonic())):
+            for credit in (1, 2, 3):
+                with self.captureOnCommitCallbacks(execute=True):
+                    course.maximum_credit = credit
+                    course.save()
+            self.drain_refreshes()
+            self.assertEqual(len(refreshed), 1)
+            time.sleep(1.5)
+            self.drain_refreshes()
+        self.assertEqual(len(refreshed), 2)
+        self.assertGreaterEqual(refreshed[1] - refreshed[0], 0.9)
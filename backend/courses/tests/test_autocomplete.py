@@ -0,0 +1,53 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+from courses.models import Course
+from courses.views import AUTOCOMPLETE_MAX_RESULTS
+from university.testing import seed_catalog
+
+
+class CourseAutocompleteTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = seed_catalog(departments=1, courses_per_department=2, syllabi_per_course=0)
+        department = Course.objects.first().discipline
+        names = ['Thermodynamics', 'Quantum Mechanics', 'Organic Chemistry', 'Linear Algebra']
+        Course.objects.bulk_create([
+            Course(course_code=f'AC{number:03d}', course_name=names[number % len(names)], course_category='ELECTIVE',
+                   type='THEORY', cbcs_category='CORE', maximum_credit=3, discipline=department,
+                   is_deleted=number == 1)
+            for number in range(40)
+        ])
+
+    def complete(self, term, client=None, **params):
+        response = (client or APIClient()).get('/courses/courses/autocomplete/', {'q': term, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_code_prefix_matches_rank_first(self):
+        results = self.complete('ac00')
+        prefixed = [f'AC00{number}' for number in range(10) if number != 1]  # AC001 is soft-deleted
+        self.assertEqual([result['course_code'] for result in results[:len(prefixed)]], prefixed)
+        self.assertTrue(all(result['similarity'] == 1.0 for result in results[:len(prefixed)]))
+        self.assertTrue(all(result['similarity'] < 1.0 for result in results[len(prefixed):]))
+
+    def test_misspelled_name_matches_by_trigram(self):
+        results = self.complete('thermodinamics', limit=AUTOCOMPLETE_MAX_RESULTS)
+        self.assertTrue(results)
+        self.assertEqual({result['course_name'] for result in results}, {'Thermodynamics'})
+        self.assertTrue(all(0 < result['similarity'] < 1 for result in results))
+
+    def test_limit_is_applied_and_capped(self):
+        self.assertEqual(len(self.complete('AC', limit=3)), 3)
+        self.assertEqual(len(self.complete('AC')), 10)
+        self.assertEqual(len(self.complete('AC', limit=1000)), AUTOCOMPLETE_MAX_RESULTS)
+        self.assertEqual(len(self.complete('AC', limit='many')), 10)
+
+    def test_soft_deleted_courses_are_staff_only(self):
+        self.assertNotIn('AC001', [result['course_code'] for result in self.complete('AC001')])
+        staff = APIClient()
+        staff.force_authenticate(self.user)
+        self.assertEqual(self.complete('AC001', client=staff)[0]['course_code'], 'AC001')
+
+    def test_short_terms_return_nothing(self):
+        self.assertEqual(self.complete('A'), [])
+        self.assertEqual(self.complete('  '), [])
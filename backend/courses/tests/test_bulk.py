@@ -0,0 +1,85 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+from courses.models import Course
+from university.testing import seed_catalog
+
+
+def course_payload(code, discipline, **fields):
+    return {
+        'course_code': code, 'course_name': f'Bulk {code}', 'course_category': 'ELECTIVE', 'type': 'THEORY',
+        'cbcs_category': 'MINOR', 'maximum_credit': 3, 'discipline': discipline, **fields,
+    }
+
+
+class CourseBulkTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = seed_catalog(departments=1, courses_per_department=3, syllabi_per_course=0)
+        cls.existing = Course.objects.live().order_by('pk').first()
+        cls.discipline = cls.existing.discipline_id
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_bulk_create(self):
+        payload = [course_payload(f'BLK{number}', self.discipline) for number in range(3)]
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/courses/courses/bulk/', payload, format='json')
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual([course['course_code'] for course in response.data], ['BLK0', 'BLK1', 'BLK2'])
+        created = Course.objects.filter(pk__startswith='BLK')
+        self.assertEqual(created.count(), 3)
+        self.assertTrue(all(course.created_by_id == self.user.pk for course in created))
+
+    def test_mixed_batch_reports_errors_per_item_and_writes_nothing(self):
+        payload = [
+            course_payload('BLK0', self.discipline),
+            course_payload(self.existing.pk, self.discipline),
+            course_payload('BLK0', self.discipline),
+            course_payload('BLK1', '999'),
+            course_payload('BLK2', self.discipline),
+        ]
+        response = self.client.post('/courses/courses/bulk/', payload, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(response.data), len(payload))
+        self.assertEqual(response.data[0], {})
+        self.assertEqual(response.data[1]['course_code'], ['Course with this course code already exists.'])
+        self.assertEqual(response.data[2]['course_code'], ['Duplicate course code in this request.'])
+        self.assertIn('discipline', response.data[3])
+        self.assertEqual(response.data[4], {})
+        self.assertFalse(Course.objects.filter(pk__startswith='BLK').exists())
+
+    def test_bulk_update(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch('/courses/courses/bulk/', [
+                {'course_code': self.existing.pk, 'course_name': 'Renamed in bulk'},
+            ], format='json')
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(Course.objects.get(pk=self.existing.pk).course_name, 'Renamed in bulk')
+
+    def test_malformed_update_items_are_rejected_per_item(self):
+        response = self.client.patch('/courses/courses/bulk/', [
+            {'course_code': self.existing.pk, 'course_name': 'Renamed in bulk'},
+            {'course_code': ['not', 'hashable']},
+            {'course_code': {'nested': 1}},
+            ['not', 'an', 'object'],
+        ], format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data[0], {})
+        self.assertEqual(response.data[1]['course_code'][0].code, 'invalid')
+        self.assertEqual(response.data[2]['course_code'][0].code, 'invalid')
+        self.assertIn('non_field_errors', response.data[3])
+        self.assertNotEqual(Course.objects.get(pk=self.existing.pk).course_name, 'Renamed in bulk')
+
+    def test_update_of_unknown_course_is_rejected_per_item(self):
+        response = self.client.patch('/courses/courses/bulk/', [
+            {'course_code': self.existing.pk, 'course_name': 'Renamed in bulk'},
+            {'course_code': 'MISSING', 'course_name': 'Nowhere'},
+        ], format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, [{}, {'course_code': ['Course with this course code does not exist.']}])
+
+    def test_non_list_payload_is_rejected(self):
+        response = self.client.patch('/courses/courses/bulk/', {'course_code': self.existing.pk}, format='json')
+        self.assertEqual(response.status_code, 400)
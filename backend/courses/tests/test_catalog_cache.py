@@ -0,0 +1,54 @@
+import shutil
+import tempfile
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from courses.models import Course
+from university.cache import catalog_cache_timeout
+from university.testing import seed_catalog
+
+
+@override_settings(CATALOG_CACHE_TIMEOUT=300, CATALOG_CACHE_LOCAL_TIMEOUT=300)
+class CatalogCacheTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = seed_catalog(departments=1, courses_per_department=3, syllabi_per_course=0)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def names(self, response):
+        return {course['course_code']: course['course_name'] for course in response.data['results']}
+
+    def test_write_invalidates_cached_list(self):
+        course = Course.objects.live().order_by('pk').first()
+        self.assertEqual(self.client.get('/courses/courses/')['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get('/courses/courses/')['X-Cache'], 'HIT')
+
+        editor = APIClient()
+        editor.force_authenticate(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = editor.patch(f'/courses/courses/{course.pk}/', {'course_name': 'Renamed'}, format='json')
+        self.assertEqual(response.status_code, 200, response.data)
+
+        response = self.client.get('/courses/courses/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(self.names(response)[course.pk], 'Renamed')
+
+    @override_settings(CATALOG_CACHE_LOCAL_TIMEOUT=0)
+    def test_process_local_backend_can_disable_caching(self):
+        self.assertEqual(catalog_cache_timeout(), 0)
+        for _ in range(2):
+            response = self.client.get('/courses/courses/')
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('X-Cache', response)
+
+    @override_settings(CATALOG_CACHE_LOCAL_TIMEOUT=5)
+    def test_timeout_capped_only_for_process_local_backend(self):
+        self.assertEqual(catalog_cache_timeout(), 5)
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location)
+        shared = {'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location}}
+        with override_settings(CACHES=shared):
+            self.assertEqual(catalog_cache_timeout(), 300)
@@ -0,0 +1,41 @@
+import json
+from django.test import SimpleTestCase
+from university.choices import CHOICES_BUNDLE
+
+
+class ChoicesEndpointTest(SimpleTestCase):
+    BUNDLE_URL = '/courses/choices/'
+    ENDPOINTS = {
+        'course_category': '/courses/course-category-choices/',
+        'course_type': '/courses/course-type-choices/',
+        'cbcs_category': '/courses/cbcs-category-choices/',
+        'faculty': '/academic/faculty-choices/',
+    }
+
+    def test_etag_and_not_modified(self):
+        response = self.client.get(self.BUNDLE_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['ETag'], CHOICES_BUNDLE.etag)
+        revalidated = self.client.get(self.BUNDLE_URL, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated.content, b'')
+        self.assertEqual(self.client.get(self.BUNDLE_URL, HTTP_IF_NONE_MATCH='"other"').status_code, 200)
+
+    def test_immutable_only_for_current_version(self):
+        self.assertIn('no-cache', self.client.get(self.BUNDLE_URL)['Cache-Control'])
+        pinned = self.client.get(self.BUNDLE_URL, {'v': CHOICES_BUNDLE.version})
+        self.assertIn('immutable', pinned['Cache-Control'])
+        stale = self.client.get(self.BUNDLE_URL, {'v': 'outdated'})
+        self.assertNotIn('immutable', stale['Cache-Control'])
+        self.assertIn('no-cache', stale['Cache-Control'])
+
+    def test_bundle_matches_per_enum_endpoints(self):
+        bundle = json.loads(self.client.get(self.BUNDLE_URL).content)
+        self.assertEqual(set(bundle), set(self.ENDPOINTS))
+        for name, url in self.ENDPOINTS.items():
+            with self.subTest(name=name):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(json.loads(response.content), bundle[name])
+                pinned = self.client.get(url, {'v': response['ETag'].strip('"')})
+                self.assertIn('immutable', pinned['Cache-Control'])
@@ -0,0 +1,75 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from courses.models import Course
+from university.testing import seed_catalog
+
+LIST_URL = '/courses/courses/'
+
+
+class ConditionalGetTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = seed_catalog(departments=1, courses_per_department=5, syllabi_per_course=0)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.staff = APIClient()
+        self.staff.force_authenticate(self.user)
+
+    def test_list_revalidates_by_etag_only(self):
+        response = self.client.get(LIST_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Last-Modified', response)
+        etag = response['ETag']
+        self.assertEqual(self.client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        # Served from the catalog cache this time; still only the ETag validates.
+        self.assertEqual(self.client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        far_future = 'Fri, 01 Jan 2100 00:00:00 GMT'
+        self.assertEqual(self.client.get(LIST_URL, HTTP_IF_MODIFIED_SINCE=far_future).status_code, 200)
+
+    def test_list_etag_differs_for_staff(self):
+        public = self.client.get(LIST_URL)['ETag']
+        self.assertEqual(self.staff.get(LIST_URL, HTTP_IF_NONE_MATCH=public).status_code, 200)
+        staff = self.staff.get(LIST_URL)['ETag']
+        self.assertNotEqual(public, staff)
+        self.assertEqual(self.staff.get(LIST_URL, HTTP_IF_NONE_MATCH=staff).status_code, 304)
+
+    def test_soft_deleting_newest_course_changes_list_etag(self):
+        etag = self.client.get(LIST_URL)['ETag']
+        newest = Course.objects.live().order_by('-updated_at').first()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.staff.delete(f'{LIST_URL}{newest.pk}/').status_code, 204)
+        response = self.client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(newest.pk, [course['course_code'] for course in response.data['results']])
+
+    def test_hard_deleting_older_course_changes_list_etag(self):
+        etag = self.client.get(LIST_URL)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            Course.objects.live().order_by('updated_at').first().delete()
+        self.assertEqual(self.client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_detail_revalidates_by_etag_and_date(self):
+        course = Course.objects.live().first()
+        url = f'{LIST_URL}{course.pk}/'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        etag, last_modified = response['ETag'], response['Last-Modified']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+        self.assertEqual(self.staff.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.staff.patch(url, {'course_name': 'Renamed'}, format='json')
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_soft_deleted_detail_is_not_revalidated_for_public(self):
+        course = Course.objects.live().first()
+        url = f'{LIST_URL}{course.pk}/'
+        etag = self.client.get(url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.staff.delete(url)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 404)
+        self.assertEqual(self.staff.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
@@ -0,0 +1,81 @@
+import shutil
+import tempfile
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from courses.models import Course, Syllabus
+from university.testing import seed_catalog
+
+PDF = b'%PDF-1.7\n' + bytes(range(256)) * 8 + b'\n%%EOF\n'
+
+
+class SyllabusDownloadTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = seed_catalog(departments=1, courses_per_department=1, syllabi_per_course=0)
+        cls.course = Course.objects.get()
+
+    def setUp(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media)
+        settings = override_settings(MEDIA_ROOT=media, SYLLABUS_DOWNLOAD_OFFLOAD='')
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.syllabus = Syllabus(course=self.course, version='1.0', uploaded_by=self.user)
+        self.syllabus.syllabus_file.save('outline.pdf', ContentFile(PDF))
+        self.url = f'/courses/syllabi/{self.syllabus.pk}/download/'
+        self.client = APIClient()
+
+    def content(self, response):
+        return b''.join(response.streaming_content)
+
+    def test_full_download_with_validators(self):
+        response = self.client.get(self.url, HTTP_ACCEPT='application/pdf')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.content(response), PDF)
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertFalse(response['ETag'].startswith('W/'))
+        revalidated = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_range_and_if_range(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=5-14')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], f'bytes 5-14/{len(PDF)}')
+        self.assertEqual(self.content(response), PDF[5:15])
+        etag = response['ETag']
+        self.assertEqual(self.client.get(self.url, HTTP_RANGE='bytes=-7', HTTP_IF_RANGE=etag).status_code, 206)
+        stale = self.client.get(self.url, HTTP_RANGE='bytes=0-3', HTTP_IF_RANGE='"stale"')
+        self.assertEqual(stale.status_code, 200)
+        self.assertEqual(self.client.get(self.url, HTTP_RANGE=f'bytes={len(PDF)}-').status_code, 416)
+
+    def test_invalid_range_is_ignored(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=20-10')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.content(response), PDF)
+
+    @override_settings(SYLLABUS_DOWNLOAD_OFFLOAD='nginx', SYLLABUS_ACCEL_REDIRECT_PREFIX='/protected-media/')
+    def test_filename_is_encoded_in_content_disposition(self):
+        Syllabus.objects.filter(pk=self.syllabus.pk).update(version='2"; x=é')
+        expected = f"inline; filename*=utf-8''{self.course.pk}-2%22%3B%20x%3D%C3%A9.pdf"
+        self.assertEqual(self.client.get(self.url)['Content-Disposition'], expected)
+        with self.settings(SYLLABUS_DOWNLOAD_OFFLOAD=''):
+            self.assertEqual(self.client.get(self.url, HTTP_RANGE='bytes=0-3')['Content-Disposition'], expected)
+
+    def test_versioned_url_is_immutable(self):
+        download_url = self.client.get(f'/courses/syllabi/{self.syllabus.pk}/').data['download_url']
+        response = self.client.get(download_url)
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertIn('no-cache', self.client.get(self.url)['Cache-Control'])
+
+    def test_soft_deleted_syllabus_is_staff_only(self):
+        Syllabus.objects.filter(pk=self.syllabus.pk).update(is_deleted=True)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    @override_settings(SYLLABUS_DOWNLOAD_OFFLOAD='nginx', SYLLABUS_ACCEL_REDIRECT_PREFIX='/protected-media/')
+    def test_offloads_to_front_server(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{self.syllabus.syllabus_file.name}')
+        self.assertEqual(response.content, b'')
@@ -0,0 +1,61 @@
+import csv
+import io
+import json
+from django.http import StreamingHttpResponse
+from django.test import TestCase
+from rest_framework.test import APIClient
+from courses.models import Course, Syllabus
+from courses.views import CourseViewSet
+from university.testing import seed_catalog
+
+
+class ExportTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = seed_catalog(departments=2, courses_per_department=10, syllabi_per_course=1)
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def export(self, url, client=None, **params):
+        response = (client or self.client).get(url, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response, StreamingHttpResponse)
+        return response, b''.join(response.streaming_content).decode()
+
+    def test_ndjson_rows(self):
+        response, body = self.export('/courses/courses/export/')
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="courses.ndjson"')
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([row['course_code'] for row in rows],
+                         list(Course.objects.live().order_by('pk').values_list('pk', flat=True)))
+        self.assertEqual(set(rows[0]), set(CourseViewSet.export_fields))
+
+    def test_csv_rows_with_selected_fields(self):
+        response, body = self.export('/courses/syllabi/export/', output='csv', fields='course,version')
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.reader(io.StringIO(body)))
+        self.assertEqual(rows[0], ['course', 'version'])
+        self.assertEqual(len(rows) - 1, Syllabus.objects.live().count())
+
+    def test_filters_apply(self):
+        discipline = Course.objects.first().discipline_id
+        _, body = self.export('/courses/courses/export/', discipline=discipline, fields='course_code,discipline')
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertTrue(rows)
+        self.assertEqual({row['discipline'] for row in rows}, {discipline})
+        self.assertEqual(len(rows), Course.objects.live().filter(discipline=discipline).count())
+
+    def test_soft_deleted_rows_are_staff_only(self):
+        deleted = set(Course.objects.filter(is_deleted=True).values_list('pk', flat=True))
+        self.assertTrue(deleted)
+        _, body = self.export('/courses/courses/export/', output='csv', fields='course_code')
+        self.assertFalse(deleted & {row[0] for row in csv.reader(io.StringIO(body))})
+        staff = APIClient()
+        staff.force_authenticate(self.user)
+        _, body = self.export('/courses/courses/export/', client=staff, output='csv', fields='course_code')
+        self.assertTrue(deleted <= {row[0] for row in csv.reader(io.StringIO(body))})
+
+    def test_unknown_output_is_rejected(self):
+        self.assertEqual(self.client.get('/courses/courses/export/', {'output': 'xml'}).status_code, 400)
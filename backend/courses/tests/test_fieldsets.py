@@ -0,0 +1,47 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from university.testing import seed_catalog
+
+
+class SparseFieldsetTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_catalog(departments=1, courses_per_department=3, syllabi_per_course=1)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def test_fields_and_omit_trim_output(self):
+        course = self.client.get('/courses/courses/', {'fields': 'course_code,course_name'}).data['results'][0]
+        self.assertEqual(set(course), {'course_code', 'course_name'})
+        course = self.client.get('/courses/courses/', {'omit': 'created_by,updated_by'}).data['results'][0]
+        self.assertNotIn('created_by', course)
+        self.assertIn('discipline', course)
+        code = course['course_code']
+        detail = self.client.get(f'/courses/courses/{code}/', {'fields': 'course_code', 'omit': 'course_code'}).data
+        self.assertEqual(detail, {})
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get('/courses/courses/', {'fields': 'course_code,password'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('password', str(response.data['fields']))
+        self.assertEqual(self.client.get('/courses/syllabi/', {'omit': 'nope'}).status_code, 400)
+
+    def test_only_selected_columns_are_loaded(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/courses/courses/', {'fields': 'course_code'})
+        self.assertEqual(response.status_code, 200)
+        page_query = queries.captured_queries[-1]['sql']
+        self.assertIn('"course_code"', page_query)
+        self.assertNotIn('"course_name"', page_query)
+
+    def test_related_and_computed_fields_serialize(self):
+        syllabus = self.client.get('/courses/syllabi/', {'fields': 'id,course,download_url'}).data['results'][0]
+        self.assertEqual(set(syllabus), {'id', 'course', 'download_url'})
+        self.assertIn(f"/courses/syllabi/{syllabus['id']}/download/?v=", syllabus['download_url'])
+        course = self.client.get('/courses/courses/', {'fields': 'discipline'}).data['results'][0]
+        self.assertTrue(course['discipline'])
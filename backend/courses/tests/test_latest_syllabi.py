@@ -0,0 +1,53 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+from courses.models import Course, Syllabus
+from university.testing import seed_catalog
+
+
+class LatestSyllabusTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_catalog(departments=2, courses_per_department=3, syllabi_per_course=2)
+        cls.first = Course.objects.order_by('pk').first()
+        # A deleted newer version must not shadow the live latest one
+        Syllabus.objects.filter(course=cls.first, version='2.0').update(is_deleted=True)
+
+    def get(self, **params):
+        response = APIClient().get('/courses/syllabi/latest/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_one_live_syllabus_per_course(self):
+        results = self.get(limit=100)['results']
+        live = Course.objects.live().filter(syllabi__is_deleted=False).distinct().order_by('pk')
+        self.assertEqual([result['course'] for result in results], list(live.values_list('pk', flat=True)))
+        versions = {result['course']: result['version'] for result in results}
+        self.assertEqual(versions[self.first.pk], '1.0')
+        self.assertEqual(set(versions.values()) - {'1.0'}, {'2.0'})
+
+    def test_department_filter_and_keyset_pages(self):
+        department = self.first.discipline_id
+        expected = list(
+            Syllabus.objects.live().filter(course__discipline_id=department)
+            .values_list('course_id', flat=True).distinct().order_by('course_id')
+        )
+        seen, params = [], {'discipline': department, 'limit': 2}
+        while True:
+            page = self.get(**params)
+            seen += [result['course'] for result in page['results']]
+            if page['next'] is None:
+                break
+            params['after'] = seen[-1]
+            self.assertIn(f'after={seen[-1]}', page['next'])
+        self.assertEqual(seen, expected)
+
+    def test_versions_order_numerically(self):
+        syllabus = Syllabus.objects.filter(course=self.first).get(version='1.0')
+        syllabus.version = '10.0'
+        syllabus.save()
+        Syllabus.objects.filter(course=self.first, version='2.0').update(is_deleted=False)
+        self.assertEqual(syllabus.version_key, '000010.000000')
+        versions = Syllabus.objects.filter(course=self.first).order_by('version_key').values_list('version', flat=True)
+        self.assertEqual(list(versions), ['2.0', '10.0'])
+        latest = {result['course']: result['version'] for result in self.get(limit=100)['results']}
+        self.assertEqual(latest[self.first.pk], '10.0')
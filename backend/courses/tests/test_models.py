@@ -1,5 +1,9 @@
+from django.db import connection
 from django.test import TestCase
-from courses.models import Course
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from courses.models import Course, Syllabus
+from university.testing import seed_catalog
 
 class CourseModelTest(TestCase):
     def test_course_creation(self):
@@ -12,4 +16,46 @@ class CourseModelTest(TestCase):
             maximum_credit=3,
             discipline_id=101  # Adjust to a valid Department ID
         )
-        self.assertEqual(course.course_name, "Intro to Programming")
\ No newline at end of file
+        self.assertEqual(course.course_name, "Intro to Programming")
+
+class CourseRenamePropagationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = seed_catalog(departments=1, courses_per_department=3, syllabi_per_course=3)
+
+    def test_rename_updates_syllabi_with_one_statement(self):
+        course = Course.objects.live().first()
+        course.course_name = "Renamed Course"
+        with CaptureQueriesContext(connection) as context:
+            course.save()
+        updates = [query['sql'] for query in context.captured_queries if 'UPDATE "courses_syllabus"' in query['sql']]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(set(course.syllabi.values_list('course_name', flat=True)), {"Renamed Course"})
+
+    def test_save_without_rename_leaves_syllabi_alone(self):
+        course = Course.objects.live().first()
+        course.maximum_credit = 4
+        with CaptureQueriesContext(connection) as context:
+            course.save()
+        self.assertFalse(any('courses_syllabus' in query['sql'] for query in context.captured_queries))
+
+    def test_bulk_rename_updates_syllabi(self):
+        codes = list(Course.objects.live().values_list('pk', flat=True)[:2])
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.patch(
+            '/courses/courses/bulk/',
+            [{'course_code': code, 'course_name': f"Bulk {code}"} for code in codes],
+            format='json',
+        )
+        self.assertEqual(response.status_code, 200)
+        for code in codes:
+            names = set(Syllabus.objects.filter(course_id=code).values_list('course_name', flat=True))
+            self.assertEqual(names, {f"Bulk {code}"})
+
+    def test_syllabus_save_skips_course_lookup(self):
+        syllabus = Syllabus.objects.first()
+        syllabus.description = "Updated"
+        with CaptureQueriesContext(connection) as context:
+            syllabus.save()
+        self.assertFalse(any('FROM "courses_course"' in query['sql'] for query in context.captured_queries))
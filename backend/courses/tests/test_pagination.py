@@ -0,0 +1,55 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from courses.models import Course, Syllabus
+from university.testing import seed_catalog
+
+
+class CursorPaginationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_catalog(departments=2, courses_per_department=12, syllabi_per_course=2)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def walk(self, url, params):
+        """Follows next links from the first page; returns the pages' results."""
+        pages = []
+        response = self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('count', response.data)
+            pages.append(response.data['results'])
+            if response.data['next'] is None:
+                return pages
+            self.assertIn('cursor=', response.data['next'])
+            response = self.client.get(response.data['next'])
+
+    def test_courses_cursor_visits_every_row_once(self):
+        pages = self.walk('/courses/courses/', {'pagination': 'cursor', 'limit': 5})
+        codes = [course['course_code'] for page in pages for course in page]
+        self.assertEqual(codes, list(Course.objects.live().order_by('pk').values_list('pk', flat=True)))
+        self.assertGreater(len(pages), 1)
+
+    def test_cursor_keeps_filters(self):
+        discipline = Course.objects.first().discipline_id
+        pages = self.walk('/courses/courses/', {'pagination': 'cursor', 'limit': 3, 'discipline': discipline})
+        codes = [course['course_code'] for page in pages for course in page]
+        expected = Course.objects.live().filter(discipline=discipline).order_by('pk').values_list('pk', flat=True)
+        self.assertEqual(codes, list(expected))
+
+    def test_syllabi_cursor_visits_every_row_once(self):
+        pages = self.walk('/courses/syllabi/', {'pagination': 'cursor', 'limit': 4})
+        ids = [syllabus['id'] for page in pages for syllabus in page]
+        expected = Syllabus.objects.live().order_by('course_id', 'version_key').values_list('pk', flat=True)
+        self.assertEqual(ids, list(expected))
+
+    def test_page_number_pagination_is_the_default(self):
+        response = self.client.get('/courses/courses/', {'limit': 5})
+        self.assertEqual(response.data['count'], Course.objects.live().count())
+        self.assertIn('page=2', response.data['next'])
+        second = self.client.get('/courses/courses/', {'limit': 5, 'page': 2})
+        expected = Course.objects.live().order_by('pk').values_list('pk', flat=True)[5:10]
+        self.assertEqual([course['course_code'] for course in second.data['results']], list(expected))
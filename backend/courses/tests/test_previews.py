@@ -0,0 +1,109 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from courses.models import Course, Syllabus
+from courses.previews import preview_exists, preview_name
+from courses.tasks import preview_ready, schedule_preview
+from university.testing import make_pdf, seed_catalog
+
+# Stands in for poppler's pdftoppm: records each call and writes <output base>.png.
+FAKE_PDFTOPPM = f"""#!{sys.executable}
+import sys
+with open(__file__ + '.calls', 'a') as calls:
+    calls.write(sys.argv[-2] + '\\n')
+with open(sys.argv[-1] + '.png', 'wb') as image:
+    image.write(b'\\x89PNG fake preview of ' + sys.argv[-2].encode())
+"""
+
+
+class SyllabusPreviewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = seed_catalog(departments=1, courses_per_department=2, syllabi_per_course=0)
+        cls.courses = list(Course.objects.order_by('pk'))
+
+    def setUp(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media)
+        self.binary = os.path.join(media, 'pdftoppm')
+        with open(self.binary, 'w') as script:
+            script.write(FAKE_PDFTOPPM)
+        os.chmod(self.binary, 0o755)
+        settings = override_settings(MEDIA_ROOT=media, SYLLABUS_PREVIEW_BINARY=self.binary,
+                                     SYLLABUS_PREVIEWS=True, SYLLABUS_TEXT_EXTRACTION=False)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def upload(self, course, text, version='1.0'):
+        with self.captureOnCommitCallbacks(execute=True):
+            syllabus = Syllabus(course=course, version=version, uploaded_by=self.user)
+            syllabus.syllabus_file.save('outline.pdf', ContentFile(make_pdf(text)))
+        return syllabus
+
+    def render_calls(self):
+        with open(self.binary + '.calls') as calls:
+            return calls.read().split()
+
+    def wait_for_preview(self, syllabus):
+        deadline = time.monotonic() + 30
+        while not preview_exists(syllabus.syllabus_file.name):
+            self.assertLess(time.monotonic(), deadline, 'Preview was not rendered.')
+            time.sleep(0.05)
+
+    def test_preview_is_rendered_once_per_file_content(self):
+        first = self.upload(self.courses[0], 'Linear algebra')
+        self.wait_for_preview(first)
+        second = self.upload(self.courses[1], 'Linear algebra')  # Same content, same blob
+        self.assertIsNone(schedule_preview(second))
+        self.assertEqual(len(self.render_calls()), 1)
+
+        url = APIClient().get(f'/courses/syllabi/{second.pk}/').data['preview_url']
+        self.assertIn(f'/courses/syllabi/{second.pk}/preview/?v=', url)
+        response = APIClient().get(url)
+        self.assertEqual((response.status_code, response['Content-Type']), (200, 'image/png'))
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertTrue(b''.join(response.streaming_content).startswith(b'\x89PNG'))
+
+    def test_new_content_gets_a_new_preview(self):
+        syllabus = self.upload(self.courses[0], 'Draft')
+        self.wait_for_preview(syllabus)
+        old_preview = preview_name(syllabus.syllabus_file.name)
+        with self.captureOnCommitCallbacks(execute=True):
+            syllabus.syllabus_file.save('outline.pdf', ContentFile(make_pdf('Final')))
+        self.wait_for_preview(syllabus)
+        self.assertNotEqual(preview_name(syllabus.syllabus_file.name), old_preview)
+        self.assertEqual(len(self.render_calls()), 2)
+
+    def test_preview_url_is_null_until_rendered(self):
+        with override_settings(SYLLABUS_PREVIEWS=False):
+            syllabus = self.upload(self.courses[0], 'Not rendered yet')
+        self.assertIsNone(APIClient().get(f'/courses/syllabi/{syllabus.pk}/').data['preview_url'])
+
+    def test_rendered_preview_refreshes_cached_responses(self):
+        with override_settings(SYLLABUS_PREVIEWS=False):
+            syllabus = self.upload(self.courses[0], 'Late preview')
+        client = APIClient()
+        before = client.get(f'/courses/syllabi/{syllabus.pk}/')
+        self.assertIsNone(client.get('/courses/syllabi/').data['results'][0]['preview_url'])
+
+        schedule_preview(syllabus)
+        self.wait_for_preview(syllabus)
+        preview_ready(syllabus.syllabus_file.name)  # The worker's own connection cannot see this test's rows
+        response = client.get(f'/courses/syllabi/{syllabus.pk}/', HTTP_IF_NONE_MATCH=before['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.data['preview_url'])
+        self.assertIsNotNone(client.get('/courses/syllabi/').data['results'][0]['preview_url'])
+
+    def test_preview_of_deleted_syllabus_is_staff_only(self):
+        syllabus = self.upload(self.courses[0], 'Withdrawn')
+        self.wait_for_preview(syllabus)
+        Syllabus.objects.filter(pk=syllabus.pk).update(is_deleted=True)
+        self.assertEqual(APIClient().get(f'/courses/syllabi/{syllabus.pk}/preview/').status_code, 404)
+        staff = APIClient()
+        staff.force_authenticate(self.user)
+        self.assertEqual(staff.get(f'/courses/syllabi/{syllabus.pk}/preview/').status_code, 200)
@@ -0,0 +1,64 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from academics.admin import DepartmentResource
+from courses.admin import CourseResource, SyllabusResource
+from courses.models import Syllabus
+from university.testing import ADMIN_QUERY_BUDGETS, API_QUERY_BUDGETS, QueryBudget, seed_catalog
+
+
+class QueryBudgetTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = seed_catalog(departments=4, courses_per_department=30, syllabi_per_course=2)
+
+    def setUp(self):
+        cache.clear()
+
+    def get(self, client, url):
+        response = client.get(url)
+        if response.streaming:
+            b''.join(response.streaming_content)
+        self.assertEqual(response.status_code, 200, url)
+        return response
+
+    def measure(self, client, url, max_queries=None):
+        cache.clear()
+        with QueryBudget(url, max_queries) as budget:
+            self.get(client, url)
+        return budget
+
+    def test_api_endpoints_within_budget(self):
+        staff = APIClient()
+        staff.force_authenticate(self.user)
+        for client in (APIClient(), staff):
+            for url, max_queries in API_QUERY_BUDGETS.items():
+                with self.subTest(url=url, staff=client is staff):
+                    self.measure(client, url, max_queries)
+
+    def test_list_queries_do_not_grow_with_page_size(self):
+        client = APIClient()
+        for url in ('/courses/courses/', '/courses/syllabi/', '/courses/courses/?pagination=cursor',
+                    '/courses/syllabi/?pagination=cursor'):
+            separator = '&' if '?' in url else '?'
+            with self.subTest(url=url):
+                small = self.measure(client, f'{url}{separator}limit=2')
+                large = self.measure(client, f'{url}{separator}limit=50')
+                self.assertEqual(small.count, large.count, large.report())
+
+    def test_admin_changelists_within_budget(self):
+        self.client.force_login(self.user)
+        for url, max_queries in ADMIN_QUERY_BUDGETS.items():
+            with self.subTest(url=url):
+                self.measure(self.client, url, max_queries)
+
+    def test_admin_exports_do_not_query_per_row(self):
+        for resource in (CourseResource(), SyllabusResource(), DepartmentResource()):
+            with self.subTest(resource=type(resource).__name__):
+                with QueryBudget(type(resource).__name__, max_queries=1):
+                    resource.export()
+
+    def test_syllabus_str_does_not_load_course(self):
+        syllabus = Syllabus.objects.first()
+        with QueryBudget('Syllabus.__str__', max_queries=0):
+            str(syllabus)
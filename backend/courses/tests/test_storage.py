@@ -0,0 +1,117 @@
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from courses.models import Course, Syllabus, SyllabusBlob
+from courses.storage import blob_digest, syllabus_storage
+from university.testing import seed_catalog
+
+PDF = b'%PDF-1.7\n' + b'shared syllabus body\n' * 100
+
+
+class ContentAddressedStorageTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = seed_catalog(departments=1, courses_per_department=2, syllabi_per_course=0)
+        cls.courses = list(Course.objects.order_by('pk'))
+
+    def setUp(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media)
+        settings = override_settings(MEDIA_ROOT=media, SYLLABUS_TEXT_EXTRACTION=False)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def upload(self, course, version, content=PDF):
+        syllabus = Syllabus(course=course, version=version, uploaded_by=self.user)
+        syllabus.syllabus_file.save('outline.pdf', ContentFile(content))
+        return syllabus
+
+    def test_identical_files_are_stored_once(self):
+        first = self.upload(self.courses[0], '1.0')
+        second = self.upload(self.courses[1], '1.0')
+        self.assertEqual(first.syllabus_file.name, second.syllabus_file.name)
+        self.assertIsNotNone(blob_digest(first.syllabus_file.name))
+        self.assertEqual(SyllabusBlob.objects.get().ref_count, 2)
+
+    def test_last_reference_deletes_the_blob(self):
+        first = self.upload(self.courses[0], '1.0')
+        second = self.upload(self.courses[0], '2.0')
+        name = first.syllabus_file.name
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertEqual(SyllabusBlob.objects.get().ref_count, 1)
+        self.assertTrue(syllabus_storage.exists(name))
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertFalse(SyllabusBlob.objects.exists())
+        self.assertFalse(syllabus_storage.exists(name))
+
+    def test_replacing_the_file_moves_the_reference(self):
+        syllabus = self.upload(self.courses[0], '1.0')
+        old_name = syllabus.syllabus_file.name
+        syllabus = Syllabus.objects.get(pk=syllabus.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            syllabus.syllabus_file.save('outline.pdf', ContentFile(PDF + b'revised'))
+        self.assertFalse(syllabus_storage.exists(old_name))
+        self.assertEqual(SyllabusBlob.objects.get().name, syllabus.syllabus_file.name)
+
+    def test_dedupe_command_merges_legacy_files(self):
+        names = ['syllabi/2024/01/01/a.pdf', 'syllabi/2024/02/01/b.pdf']
+        for course, name in zip(self.courses, names):
+            path = syllabus_storage.path(name)
+            os.makedirs(os.path.dirname(path))
+            with open(path, 'wb') as handle:
+                handle.write(PDF)
+            Syllabus.objects.bulk_create([Syllabus(
+                course=course, course_name=course.course_name, version='1.0', uploaded_by=self.user,
+                syllabus_file=name,
+            )])
+        call_command('dedupe_syllabus_files', workers=2, stdout=io.StringIO())
+        stored = set(Syllabus.objects.values_list('syllabus_file', flat=True))
+        self.assertEqual(len(stored), 1)
+        blob = SyllabusBlob.objects.get()
+        self.assertEqual((blob.name, blob.ref_count), (stored.pop(), 2))
+        self.assertFalse(any(syllabus_storage.exists(name) for name in names))
+
+
+class BlobReuseRaceTest(TransactionTestCase):
+    def setUp(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media)
+        settings = override_settings(MEDIA_ROOT=media, SYLLABUS_TEXT_EXTRACTION=False)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.user = seed_catalog(departments=1, courses_per_department=2, syllabi_per_course=0)
+        self.courses = list(Course.objects.order_by('pk'))
+
+    def test_release_waits_for_an_upload_reusing_the_file(self):
+        first = Syllabus(course=self.courses[0], version='1.0', uploaded_by=self.user)
+        first.syllabus_file.save('outline.pdf', ContentFile(PDF))
+        name = first.syllabus_file.name
+        reused = threading.Event()
+
+        def upload_identical_file():
+            try:
+                with transaction.atomic():
+                    second = Syllabus(course=self.courses[1], version='1.0', uploaded_by=self.user)
+                    second.syllabus_file.save('outline.pdf', ContentFile(PDF), save=False)
+                    reused.set()
+                    time.sleep(0.5)  # The release below commits and waits on the digest meanwhile
+                    second.save()
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=upload_identical_file)
+        thread.start()
+        self.assertTrue(reused.wait(10))
+        first.delete()
+        thread.join(10)
+        self.assertTrue(syllabus_storage.exists(name))
+        self.assertEqual(SyllabusBlob.objects.get().ref_count, 1)
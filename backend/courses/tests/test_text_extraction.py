@@ -0,0 +1,95 @@
+import io
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from unittest import mock, skipUnless
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from courses.models import Course, Syllabus, SyllabusText
+from courses.pdftext import extract_pdf_text, extraction_available
+from courses.tasks import _extraction_done, schedule_text_extraction
+from university.testing import make_pdf, seed_catalog
+
+
+@skipUnless(extraction_available(), 'PDF text extraction requires pypdf')
+@override_settings(SYLLABUS_TEXT_EXTRACTION=False)
+class SyllabusTextExtractionTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = seed_catalog(departments=1, courses_per_department=2, syllabi_per_course=0)
+        cls.courses = list(Course.objects.order_by('pk'))
+
+    def setUp(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media)
+        settings = override_settings(MEDIA_ROOT=media)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def upload(self, course, text, version='1.0'):
+        syllabus = Syllabus(course=course, version=version, uploaded_by=self.user)
+        syllabus.syllabus_file.save('outline.pdf', ContentFile(make_pdf(text)))
+        return syllabus
+
+    def test_backfill_and_content_search(self):
+        live = self.upload(self.courses[0], 'Thermodynamics and statistical mechanics')
+        hidden = self.upload(self.courses[1], 'Advanced thermodynamics')
+        Syllabus.objects.filter(pk=hidden.pk).update(is_deleted=True)
+        call_command('extract_syllabus_text', workers=1, stdout=io.StringIO())
+
+        self.assertEqual(SyllabusText.objects.get(pk=live.pk).content, 'Thermodynamics and statistical mechanics')
+        response = APIClient().get('/courses/syllabi/content-search/', {'q': 'thermodynamics'})
+        self.assertEqual(response.status_code, 200)
+        results = response.data['results']
+        self.assertEqual([result['id'] for result in results], [live.pk])
+        self.assertIn('<b>Thermodynamics</b>', results[0]['headline'])
+
+    def test_content_search_keeps_rank_order_with_cursor_parameter(self):
+        weak = self.upload(self.courses[0], 'Optics with a short note on lasers')
+        strong = self.upload(self.courses[1], 'Lasers: laser physics, laser cavities and laser safety')
+        call_command('extract_syllabus_text', workers=1, stdout=io.StringIO())
+        for params in ({'q': 'laser'}, {'q': 'laser', 'pagination': 'cursor'}):
+            response = APIClient().get('/courses/syllabi/content-search/', params)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual([result['id'] for result in response.data['results']], [strong.pk, weak.pk])
+            self.assertEqual(response.data['count'], 2)
+
+    def test_text_is_reused_for_identical_files_and_kept_when_current(self):
+        first = self.upload(self.courses[0], 'Organic chemistry')
+        call_command('extract_syllabus_text', workers=1, stdout=io.StringIO())
+        second = self.upload(self.courses[1], 'Organic chemistry')
+        self.assertIsNone(schedule_text_extraction(second))  # Same blob: text copied, no extraction
+        self.assertEqual(SyllabusText.objects.get(pk=second.pk).content, 'Organic chemistry')
+        self.assertIsNone(schedule_text_extraction(first))
+
+    def test_replaced_file_is_extracted_again(self):
+        syllabus = self.upload(self.courses[0], 'First draft')
+        call_command('extract_syllabus_text', workers=1, stdout=io.StringIO())
+        syllabus.syllabus_file.save('outline.pdf', ContentFile(make_pdf('Final version')))
+        call_command('extract_syllabus_text', workers=1, stdout=io.StringIO())
+        text = SyllabusText.objects.get(pk=syllabus.pk)
+        self.assertEqual((text.file_name, text.content), (syllabus.syllabus_file.name, 'Final version'))
+
+    def test_empty_query_returns_an_empty_page(self):
+        response = APIClient().get('/courses/syllabi/content-search/', {'q': '  '})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['count'], response.data['results']), (0, []))
+
+    def test_slow_extraction_times_out_and_is_recorded_as_failed(self):
+        syllabus = self.upload(self.courses[0], 'Never finishes')
+        with mock.patch('courses.pdftext.PdfReader', side_effect=lambda path: time.sleep(5)):
+            start = time.monotonic()
+            with self.assertRaises(TimeoutError):
+                extract_pdf_text(syllabus.syllabus_file.path, timeout=0.2)
+        self.assertLess(time.monotonic() - start, 2)
+
+        future = Future()
+        future.set_exception(TimeoutError('Extraction took longer than 0.2 s.'))
+        _extraction_done(syllabus.pk, syllabus.syllabus_file.name, threading.get_ident(), future)
+        text = SyllabusText.objects.get(pk=syllabus.pk)
+        self.assertEqual(text.content, '')
+        self.assertTrue(text.error.startswith('TimeoutError'))
@@ -0,0 +1,120 @@
+import os
+import shutil
+import tempfile
+from io import BytesIO
+from unittest import mock
+from django.db.models import QuerySet
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from courses.models import Course, Syllabus, SyllabusUpload
+from courses.uploads import UploadConflict, append_chunk, receive_chunk
+from university.testing import seed_catalog
+
+PDF = b'%PDF-1.7\n' + b'x' * 5000 + b'\n%%EOF\n'
+
+
+class ResumableSyllabusUploadTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = seed_catalog(departments=1, courses_per_department=2, syllabi_per_course=1)
+        cls.course = Course.objects.live().first()
+
+    def setUp(self):
+        self.media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media)
+        settings = override_settings(MEDIA_ROOT=self.media, SYLLABUS_TEXT_EXTRACTION=False,
+                                     SYLLABUS_UPLOAD_DIR=os.path.join(self.media, 'parts'),
+                                     SYLLABUS_UPLOAD_CHUNK_SIZE=1024)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def start(self, length=len(PDF), version='9.0'):
+        response = self.client.post(
+            '/courses/syllabus-uploads/', {'course': self.course.pk, 'version': version},
+            format='json', HTTP_UPLOAD_LENGTH=str(length),
+        )
+        self.assertEqual(response.status_code, 201, response.data)
+        return response['Location']
+
+    def send(self, url, offset, chunk):
+        return self.client.generic(
+            'PATCH', url, chunk, content_type='application/offset+octet-stream', HTTP_UPLOAD_OFFSET=str(offset),
+        )
+
+    def test_resumes_and_finalizes_into_syllabus(self):
+        url = self.start()
+        self.assertEqual(self.send(url, 0, PDF[:2000])['Upload-Offset'], '2000')
+        self.assertEqual(self.client.head(url)['Upload-Offset'], '2000')
+        self.assertEqual(self.send(url, 1000, PDF[1000:3000]).status_code, 409)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.send(url, 2000, PDF[2000:])
+        self.assertEqual(response.status_code, 204)
+        upload = SyllabusUpload.objects.get()
+        syllabus = Syllabus.objects.get(pk=upload.syllabus_id)
+        self.assertEqual(syllabus.course_name, self.course.course_name)
+        with syllabus.syllabus_file.open('rb') as stored:
+            self.assertEqual(stored.read(), PDF)
+        self.assertFalse(os.path.exists(upload.part_path))
+
+    def test_rejects_non_pdf_on_first_chunk(self):
+        url = self.start(length=100)
+        response = self.send(url, 0, b'<html>' + b'x' * 10)
+        self.assertEqual(response.status_code, 415)
+        self.assertFalse(SyllabusUpload.objects.exists())
+
+    def test_rejects_chunk_past_length(self):
+        url = self.start(length=10)
+        self.assertEqual(self.send(url, 0, PDF[:20]).status_code, 413)
+
+    def test_rejects_existing_version(self):
+        existing = Syllabus.objects.filter(course=self.course).first()
+        response = self.client.post(
+            '/courses/syllabus-uploads/', {'course': self.course.pk, 'version': existing.version, 'length': 10},
+            format='json',
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_requires_content_length(self):
+        url = self.start()
+        response = self.client.generic(
+            'PATCH', url, PDF[:100], content_type='application/offset+octet-stream',
+            HTTP_UPLOAD_OFFSET='0', CONTENT_LENGTH='',
+        )
+        self.assertEqual(response.status_code, 411)
+        self.assertEqual(SyllabusUpload.objects.get().offset, 0)
+
+    def test_stale_offset_loses_compare_and_set(self):
+        self.start()
+        first, second = SyllabusUpload.objects.get(), SyllabusUpload.objects.get()
+        first_chunk, first_size = receive_chunk(first, BytesIO(PDF[:100]), 100)
+        second_chunk, second_size = receive_chunk(second, BytesIO(b'%PDF-9.9' + b'y' * 92), 100)
+        append_chunk(first, first_chunk, first_size)
+        with self.assertRaises(UploadConflict):
+            append_chunk(second, second_chunk, second_size)
+        self.assertEqual(SyllabusUpload.objects.get().offset, 100)
+        with open(first.part_path, 'rb') as part:
+            self.assertEqual(part.read(), PDF[:100])
+
+    def test_concurrently_created_version_is_a_conflict(self):
+        url = self.start()
+        Syllabus.objects.create(course=self.course, version='9.0', syllabus_file='syllabi/other.pdf',
+                                uploaded_by=self.user)
+        # Both requests passed the exists() check; the unique constraint decides.
+        with mock.patch.object(QuerySet, 'exists', return_value=False):
+            response = self.send(url, 0, PDF)
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(SyllabusUpload.objects.exists())
+        self.assertEqual(os.listdir(os.path.join(self.media, 'parts')), [])
+        stored = [name for _, _, names in os.walk(os.path.join(self.media, 'syllabi')) for name in names]
+        self.assertEqual(stored, [])  # The file written for the losing request is not orphaned
+
+    def test_truncated_pdf_is_rejected_on_last_chunk(self):
+        url = self.start(length=3000)
+        self.assertEqual(self.send(url, 0, PDF[:2000]).status_code, 204)
+        response = self.send(url, 2000, PDF[2000:3000])  # No %%EOF trailer
+        self.assertEqual(response.status_code, 415)
+        self.assertFalse(SyllabusUpload.objects.exists())
+        self.assertFalse(Syllabus.objects.filter(version='9.0').exists())
+        self.assertEqual(os.listdir(os.path.join(self.media, 'parts')), [])
@@ -0,0 +1,125 @@
+import glob
+import os
+import shutil
+import uuid
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files import File
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Now
+from .models import Syllabus, SyllabusBlob, SyllabusUpload
+from .validators import PDF_MAGIC, PDF_TRAILER_WINDOW, validate_pdf_header, validate_pdf_trailer
+
+TUS_VERSION = '1.0.0'
+OFFSET_CONTENT_TYPE = 'application/offset+octet-stream'
+
+
+class UploadConflict(Exception):
+    """Raised when another request moved the upload's offset first."""
+
+
+def receive_chunk(upload, stream, size):
+    """
+    Streams up to size bytes from stream into a scratch file next to the
+    upload's part file, in SYLLABUS_UPLOAD_CHUNK_SIZE blocks, with no
+    transaction open. The PDF signature is checked as soon as the first bytes
+    arrive. Returns (path, bytes written); fewer bytes are written when the
+    client disconnects mid-request. The caller removes the scratch file.
+    """
+    os.makedirs(settings.SYLLABUS_UPLOAD_DIR, exist_ok=True)
+    head = b''
+    if upload.offset and upload.offset < len(PDF_MAGIC):
+        with open(upload.part_path, 'rb') as part:
+            head = part.read(upload.offset)
+    path = os.path.join(settings.SYLLABUS_UPLOAD_DIR, f"{upload.pk}.{uuid.uuid4().hex}.chunk")
+    written = 0
+    with open(path, 'wb') as chunk:
+        try:
+            while written < size:
+                block = stream.read(min(settings.SYLLABUS_UPLOAD_CHUNK_SIZE, size - written))
+                if not block:
+                    break
+                if upload.offset + written < len(PDF_MAGIC):
+                    head += block[:len(PDF_MAGIC) - len(head)]
+                    validate_pdf_header(head)
+                chunk.write(block)
+                written += len(block)
+        except BaseException:
+            chunk.close()
+            discard_file(path)
+            raise
+    return path, written
+
+
+def append_chunk(upload, chunk_path, written):
+    """
+    Advances the upload's offset by written bytes with a compare-and-set
+    UPDATE and copies the received chunk onto the part file. Call inside a
+    transaction: the updated row stays locked until commit, so a concurrent
+    request for the same offset fails the compare-and-set instead of writing
+    the part file too. Raises UploadConflict when the offset has moved.
+    """
+    advanced = SyllabusUpload.objects.filter(pk=upload.pk, offset=upload.offset, syllabus__isnull=True).update(
+        offset=F('offset') + written, updated_at=Now()
+    )
+    if not advanced:
+        raise UploadConflict
+    path = upload.part_path
+    with open(path, 'r+b' if os.path.exists(path) else 'w+b') as part, open(chunk_path, 'rb') as chunk:
+        # Drop bytes past the recorded offset left by an interrupted copy.
+        part.truncate(upload.offset)
+        part.seek(upload.offset)
+        shutil.copyfileobj(chunk, part, settings.SYLLABUS_UPLOAD_CHUNK_SIZE)
+    upload.offset += written
+
+
+def finalize_upload(upload):
+    """
+    Moves the completed part file to storage as a new Syllabus. Call inside the
+    transaction that advanced the upload's offset; the part file is removed
+    once the transaction commits. Raises ValidationError when the assembled
+    file does not end like a PDF (code 'invalid_pdf') or when the course
+    already has this version, including one created concurrently.
+    """
+    with open(upload.part_path, 'rb') as part:
+        part.seek(max(0, upload.length - PDF_TRAILER_WINDOW))
+        validate_pdf_trailer(part.read())
+    if Syllabus.objects.filter(course_id=upload.course_id, version=upload.version).exists():
+        raise ValidationError('A syllabus with this course and version already exists.')
+    syllabus = Syllabus(
+        course=upload.course,
+        version=upload.version,
+        description=upload.description,
+        uploaded_by=upload.uploaded_by,
+        updated_by=upload.uploaded_by,
+    )
+    with open(upload.part_path, 'rb') as part:
+        # Storage copies from the open file in chunks; nothing is read into memory at once.
+        syllabus.syllabus_file.save(upload.filename, File(part), save=False)
+    try:
+        with transaction.atomic():
+            syllabus.save()
+    except IntegrityError:
+        # Lost the race on unique_together to a concurrent create. The file was
+        # stored with no blob row; drop it unless another syllabus shares it.
+        SyllabusBlob.objects.discard_unreferenced(syllabus.syllabus_file.name)
+        raise ValidationError('A syllabus with this course and version already exists.')
+    upload.syllabus = syllabus
+    upload.save(update_fields=['syllabus', 'updated_at'])
+    transaction.on_commit(lambda: discard_part(upload))
+    return syllabus
+
+
+def discard_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def discard_part(upload):
+    """Removes the part file and any scratch chunk files a killed request left behind."""
+    discard_file(upload.part_path)
+    for path in glob.glob(os.path.join(settings.SYLLABUS_UPLOAD_DIR, f"{upload.pk}.*.chunk")):
+        discard_file(path)
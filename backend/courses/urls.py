@@ -2,7 +2,8 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import (
     CourseViewSet, SyllabusViewSet, CourseCategoryChoicesView,
-    CourseTypeChoicesView, CBCSCategoryChoicesView
+    CourseTypeChoicesView, CBCSCategoryChoicesView, ChoicesBundleView, DepartmentCreditAnalyticsView,
+    SyllabusUploadCreateView, SyllabusUploadView
 )
 
 router = DefaultRouter()
@@ -14,4 +15,8 @@ urlpatterns = [
     path('course-category-choices/', CourseCategoryChoicesView.as_view(), name='course-category-choices'),
     path('course-type-choices/', CourseTypeChoicesView.as_view(), name='course-type-choices'),
     path('cbcs-category-choices/', CBCSCategoryChoicesView.as_view(), name='cbcs-category-choices'),
+    path('choices/', ChoicesBundleView.as_view(), name='choices-bundle'),
+    path('syllabus-uploads/', SyllabusUploadCreateView.as_view(), name='syllabus-upload-create'),
+    path('syllabus-uploads/<uuid:pk>/', SyllabusUploadView.as_view(), name='syllabus-upload-detail'),
+    path('analytics/departments/', DepartmentCreditAnalyticsView.as_view(), name='department-credit-analytics'),
 ]
\ No newline at end of file
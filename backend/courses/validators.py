@@ -1,9 +1,33 @@
 from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import UploadedFile
 import os
 
+PDF_MAGIC = b'%PDF-'
+PDF_TRAILER = b'%%EOF'
+PDF_TRAILER_WINDOW = 1024  # Readers look for the end-of-file marker in the last 1KB
+MAX_SYLLABUS_SIZE = 5 * 1024 * 1024  # 5MB
+
+def validate_pdf_header(head):
+    """Checks the leading bytes of a file (possibly fewer than the magic) against the PDF signature."""
+    if not PDF_MAGIC.startswith(head[:len(PDF_MAGIC)]):
+        raise ValidationError('File content is not a PDF document.')
+
+def validate_pdf_trailer(tail):
+    """Checks the last PDF_TRAILER_WINDOW bytes of a file for the end-of-file marker."""
+    if PDF_TRAILER not in tail[-PDF_TRAILER_WINDOW:]:
+        raise ValidationError('File content is not a complete PDF document.', code='invalid_pdf')
+
 def validate_pdf(value):
     ext = os.path.splitext(value.name)[1].lower()
     if ext != '.pdf':
         raise ValidationError('Only PDF files are allowed.')
-    if value.size > 5 * 1024 * 1024:  # 5MB limit
-        raise ValidationError('File size must be under 5MB.')
\ No newline at end of file
+    if value.size > MAX_SYLLABUS_SIZE:
+        raise ValidationError('File size must be under 5MB.')
+    if isinstance(value, UploadedFile):
+        # Fresh uploads only; stored files were checked when they were uploaded.
+        value.seek(0)
+        head = value.read(len(PDF_MAGIC))
+        value.seek(0)
+        if len(head) < len(PDF_MAGIC):
+            raise ValidationError('File content is not a PDF document.')
+        validate_pdf_header(head)
@@ -1,11 +1,81 @@
+from django.contrib.postgres.search import (
+    SearchHeadline, SearchQuery, SearchRank, TrigramSimilarity, TrigramWordSimilarity
+)
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.db.models import Case, F, FloatField, Q, Value, When
+from django.db.models.functions import Greatest
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
 from rest_framework.views import APIView
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import Course, Syllabus, CourseCategory, CourseType, CBCSCategory
-from .serializers import CourseSerializer, SyllabusSerializer, ChoiceSerializer
-from rest_framework.pagination import PageNumberPagination
+from .models import Course, Syllabus, SyllabusUpload
+from .serializers import (
+    CourseSerializer, CourseBulkSerializer, SyllabusSerializer, SyllabusUploadSerializer, SyllabusContentSearchSerializer,
+    ChoiceSerializer
+)
+from .analytics import credit_summary_report
+from .downloads import PassthroughRenderer, serve_syllabus_file, serve_syllabus_preview
+from .export import EXPORT_FORMATS, stream_export
+from .tasks import TEXT_SEARCH_CONFIG
+from .uploads import (
+    OFFSET_CONTENT_TYPE, TUS_VERSION, UploadConflict, append_chunk, discard_file, discard_part, finalize_upload,
+    receive_chunk
+)
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+from rest_framework.utils.urls import replace_query_param
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from university.cache import CachedReadMixin
+from university.choices import CHOICE_PAYLOADS, CHOICES_BUNDLE
+from university.conditional import ConditionalGetMixin
+from university.fieldsets import SparseFieldsetMixin, requested_fields
+
+BULK_MAX_ITEMS = 500  # Upper bound on courses per bulk request
+AUTOCOMPLETE_DEFAULT_RESULTS = 10
+AUTOCOMPLETE_MAX_RESULTS = 25
+LATEST_DEFAULT_RESULTS = 10
+LATEST_MAX_RESULTS = 100
+
+class ExportMixin:
+    """
+    Adds an export action streaming the full filtered queryset as NDJSON
+    (default) or CSV: ?output=ndjson|csv. Columns follow export_fields and can be
+    narrowed with ?fields= / ?omit=.
+    """
+    export_fields = ()
+    export_filename = 'export'
+
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        output = request.query_params.get('output', 'ndjson')
+        if output not in EXPORT_FORMATS:
+            return Response(
+                {'output': [f"Must be one of {list(EXPORT_FORMATS)}."]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        selected = requested_fields(request, self.export_fields)
+        fields = [name for name in self.export_fields if selected is None or name in selected]
+        queryset = self.filter_queryset(self.get_queryset())
+        return stream_export(queryset, fields, output, self.export_filename)
+
+def bulk_course_codes(data):
+    """
+    The string course codes of a bulk update payload, used to load the
+    instances. Anything else (non-list payloads, non-dict items, codes of
+    other types, oversized batches) yields no codes; the serializer then
+    reports the per-item errors.
+    """
+    if not isinstance(data, list) or len(data) > BULK_MAX_ITEMS:
+        return []
+    return [
+        item['course_code'] for item in data
+        if isinstance(item, dict) and isinstance(item.get('course_code'), str)
+    ]
 
 class CoursePagination(PageNumberPagination):
     page_size = 10
@@ -17,7 +87,44 @@ class SyllabusPagination(PageNumberPagination):
     page_size_query_param = 'limit'
     max_page_size = 50
 
-class CourseViewSet(viewsets.ModelViewSet):
+class CourseCursorPagination(CursorPagination):
+    """Keyset pagination on the course_code primary key (no COUNT, no OFFSET scans)."""
+    page_size = 10
+    page_size_query_param = 'limit'
+    max_page_size = 100
+    ordering = 'course_code'
+
+class SyllabusCursorPagination(CursorPagination):
+    """Keyset pagination on (course, version_key), served by the course/version key index."""
+    page_size = 5
+    page_size_query_param = 'limit'
+    max_page_size = 50
+    # course_id holds the course_code, so ordering on it avoids joining Course.
+    ordering = ('course_id', 'version_key')
+
+class CursorPaginationMixin:
+    """
+    Opt-in keyset pagination: ?pagination=cursor switches the list action from
+    pagination_class to cursor_pagination_class. Filters still apply since
+    pagination runs on the filtered queryset. Other actions (ranked search)
+    keep pagination_class, whose order the cursor ordering would replace.
+    """
+    cursor_pagination_class = None
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            if (self.cursor_pagination_class is not None and self.action == 'list'
+                    and self.request.query_params.get('pagination') == 'cursor'):
+                self._paginator = self.cursor_pagination_class()
+            elif self.pagination_class is None:
+                self._paginator = None
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+class CourseViewSet(CachedReadMixin, ConditionalGetMixin, SparseFieldsetMixin, CursorPaginationMixin,
+                    ExportMixin, viewsets.ModelViewSet):
     """ViewSet for CRUD operations on Course model."""
     serializer_class = CourseSerializer
     filter_backends = [DjangoFilterBackend]
@@ -25,10 +132,13 @@ class CourseViewSet(viewsets.ModelViewSet):
     # Order by course_code to ensure consistent pagination
     queryset = Course.objects.all().order_by('course_code')
     pagination_class = CoursePagination
+    cursor_pagination_class = CourseCursorPagination  # ?pagination=cursor
+    export_fields = CourseSerializer.Meta.fields  # /export/?output=ndjson|csv
+    export_filename = 'courses'
 
     def get_permissions(self):
         """Set permissions based on the request method."""
-        if self.action in ['list', 'retrieve']:
+        if self.action in ['list', 'retrieve', 'autocomplete', 'export']:
             return [AllowAny()]  # Open to all for GET requests
         return [IsAuthenticated()]  # Auth required for POST, PUT, DELETE
 
@@ -36,7 +146,7 @@ class CourseViewSet(viewsets.ModelViewSet):
         """Filter out soft-deleted courses for non-admin users."""
         if self.request.user.is_authenticated and self.request.user.is_staff:
             return self.queryset
-        return self.queryset.filter(is_deleted=False)
+        return self.queryset.live()
 
     def perform_destroy(self, instance):
         """Soft delete instead of hard delete."""
@@ -44,18 +154,78 @@ class CourseViewSet(viewsets.ModelViewSet):
         instance.updated_by = self.request.user
         instance.save()
 
-class SyllabusViewSet(viewsets.ModelViewSet):
+    @action(detail=False, methods=['post', 'put', 'patch'], url_path='bulk',
+            serializer_class=CourseBulkSerializer)
+    def bulk(self, request):
+        """Create (POST) or update (PUT/PATCH) a list of courses in one transaction."""
+        if request.method == 'POST':
+            serializer = self.get_serializer(data=request.data, many=True, max_length=BULK_MAX_ITEMS)
+            response_status = status.HTTP_201_CREATED
+        else:
+            serializer = self.get_serializer(
+                Course.objects.filter(pk__in=bulk_course_codes(request.data)), data=request.data, many=True,
+                partial=request.method == 'PATCH', max_length=BULK_MAX_ITEMS
+            )
+            response_status = status.HTTP_200_OK
+        serializer.is_valid(raise_exception=True)
+        courses = serializer.save()
+        return Response(CourseSerializer(courses, many=True).data, status=response_status)
+
+    @action(detail=False, methods=['get'], url_path='autocomplete')
+    def autocomplete(self, request):
+        """
+        Typo-tolerant course lookup: ?q=<term>&limit=<n>. Matches code prefixes and
+        trigram-similar codes/names using the pg_trgm indexes; returns the best
+        matches with a similarity score.
+        """
+        term = request.query_params.get('q', '').strip()
+        if len(term) < 2:
+            return Response([], status=status.HTTP_200_OK)
+        try:
+            limit = int(request.query_params.get('limit', AUTOCOMPLETE_DEFAULT_RESULTS))
+        except ValueError:
+            limit = AUTOCOMPLETE_DEFAULT_RESULTS
+        limit = max(1, min(limit, AUTOCOMPLETE_MAX_RESULTS))
+
+        prefix = term.upper()
+        matches = self.get_queryset().filter(
+            Q(course_code__startswith=prefix)
+            | Q(course_code__trigram_similar=term)
+            | Q(course_name__trigram_similar=term)
+            | Q(course_name__trigram_word_similar=term)
+        ).annotate(
+            similarity=Greatest(
+                Case(When(course_code__startswith=prefix, then=Value(1.0)), default=Value(0.0),
+                     output_field=FloatField()),
+                TrigramSimilarity('course_code', term),
+                TrigramSimilarity('course_name', term),
+                TrigramWordSimilarity(term, 'course_name'),
+            )
+        ).order_by('-similarity', 'course_code').values('course_code', 'course_name', 'similarity')[:limit]
+        results = [dict(match, similarity=round(match['similarity'], 3)) for match in matches]
+        return Response(results, status=status.HTTP_200_OK)
+
+class SyllabusViewSet(CachedReadMixin, ConditionalGetMixin, SparseFieldsetMixin, CursorPaginationMixin,
+                      ExportMixin, viewsets.ModelViewSet):
     """ViewSet for CRUD operations on Syllabus model."""
     serializer_class = SyllabusSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['course', 'version', 'is_deleted']
-    # Order by course__course_code and version for consistent pagination
-    queryset = Syllabus.objects.all().order_by('course__course_code', 'version')
+    # Order by course__course_code and numeric version for consistent pagination
+    queryset = Syllabus.objects.all().order_by('course__course_code', 'version_key')
     pagination_class = SyllabusPagination
+    cursor_pagination_class = SyllabusCursorPagination  # ?pagination=cursor
+    # Cursor ordering keys, plus the file name download_url and preview_url are derived from
+    sparse_fieldset_required = ('course', 'version_key', 'updated_at', 'syllabus_file')
+    # /export/?output=ndjson|csv (stored columns only)
+    export_fields = [
+        name for name in SyllabusSerializer.Meta.fields if name not in ('download_url', 'preview_url')
+    ]
+    export_filename = 'syllabi'
 
     def get_permissions(self):
         """Set permissions based on the request method."""
-        if self.action in ['list', 'retrieve']:
+        if self.action in ['list', 'retrieve', 'export', 'download', 'preview', 'content_search', 'latest']:
             return [AllowAny()]  # Open to all for GET requests
         return [IsAuthenticated()]  # Auth required for POST, PUT, DELETE
 
@@ -63,7 +233,7 @@ class SyllabusViewSet(viewsets.ModelViewSet):
         """Filter out soft-deleted syllabi for non-admin users."""
         if self.request.user.is_authenticated and self.request.user.is_staff:
             return self.queryset
-        return self.queryset.filter(is_deleted=False)
+        return self.queryset.live()
 
     def perform_destroy(self, instance):
         """Soft delete instead of hard delete."""
@@ -71,29 +241,257 @@ class SyllabusViewSet(viewsets.ModelViewSet):
         instance.updated_by = self.request.user
         instance.save()
 
+    @extend_schema(responses={
+        (200, 'application/pdf'): {'description': 'The syllabus PDF.'},
+        (206, 'application/pdf'): {'description': 'The requested byte range.'},
+        304: {'description': 'Not modified (If-None-Match / If-Modified-Since).'},
+        416: {'description': 'Range not satisfiable.'},
+    })
+    @action(detail=True, methods=['get'], url_path='download', renderer_classes=[JSONRenderer, PassthroughRenderer])
+    def download(self, request, pk=None):
+        """
+        Serves the syllabus PDF to anyone who may see the syllabus (soft-deleted
+        ones are staff only). Supports Range/If-Range and conditional requests;
+        with SYLLABUS_DOWNLOAD_OFFLOAD the front server sends the bytes.
+        """
+        return serve_syllabus_file(request, self.get_object())
+
+    @extend_schema(responses={
+        (200, 'image/png'): {'description': 'First-page preview of the syllabus PDF.'},
+        304: {'description': 'Not modified (If-None-Match).'},
+        404: {'description': 'No such syllabus, or the preview is not rendered yet.'},
+    })
+    @action(detail=True, methods=['get'], url_path='preview', renderer_classes=[JSONRenderer, PassthroughRenderer])
+    def preview(self, request, pk=None):
+        """Serves the first-page PNG preview to anyone who may see the syllabus (soft-deleted ones are staff only)."""
+        return serve_syllabus_preview(request, self.get_object())
+
+    @extend_schema(
+        parameters=[OpenApiParameter('q', str, description='Search terms (web search syntax).')],
+        responses=SyllabusContentSearchSerializer(many=True),
+    )
+    @action(detail=False, methods=['get'], url_path='content-search')
+    def content_search(self, request):
+        """
+        Ranked full-text search over the extracted text of live syllabus PDFs:
+        ?q=<terms>. Each result carries a highlighted snippet. Always page
+        numbered: ?pagination=cursor is ignored so results stay in rank order.
+        """
+        terms = request.query_params.get('q', '').strip()
+        queryset = self.get_queryset().none()  # No terms: an empty page
+        if terms:
+            query = SearchQuery(terms, search_type='websearch', config=TEXT_SEARCH_CONFIG)
+            queryset = self.filter_queryset(self.get_queryset()).live().filter(
+                text__search_vector=query
+            ).annotate(
+                rank=SearchRank(F('text__search_vector'), query),
+                headline=SearchHeadline('text__content', query, config=TEXT_SEARCH_CONFIG, max_fragments=2),
+            ).order_by('-rank', 'course_id', 'version_key')
+        page = self.paginate_queryset(queryset)
+        serializer = SyllabusContentSearchSerializer(page, many=True, context=self.get_serializer_context())
+        return self.get_paginated_response(serializer.data)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('discipline', str, description='Only courses of this department.'),
+            OpenApiParameter('after', str, description='Course code to continue after (set by the next link).'),
+            OpenApiParameter('limit', int, description=f'Courses per page (max {LATEST_MAX_RESULTS}).'),
+        ],
+        responses=SyllabusSerializer(many=True),
+    )
+    @action(detail=False, methods=['get'], url_path='latest')
+    def latest(self, request):
+        """
+        The latest live syllabus of every course, one per course, in a single
+        DISTINCT ON (course) query. Keyset paginated by course code: follow
+        `next` (?after=<course_code>). Optional ?discipline=<department id>.
+        """
+        params = request.query_params
+        try:
+            limit = min(max(int(params.get('limit', LATEST_DEFAULT_RESULTS)), 1), LATEST_MAX_RESULTS)
+        except ValueError:
+            limit = LATEST_DEFAULT_RESULTS
+        latest = Syllabus.objects.live().latest_per_course()
+        if params.get('discipline'):
+            latest = latest.filter(course__discipline_id=params['discipline'])
+        if params.get('after'):
+            latest = latest.filter(course_id__gt=params['after'])
+        # The DISTINCT ON picks ids from the index; the outer query fetches only this page's rows.
+        syllabi = list(Syllabus.objects.filter(pk__in=latest.values('pk')[:limit + 1]).order_by('course_id'))
+        next_url = None
+        if len(syllabi) > limit:
+            syllabi = syllabi[:limit]
+            next_url = replace_query_param(request.build_absolute_uri(), 'after', syllabi[-1].course_id)
+        serializer = self.get_serializer(syllabi, many=True)
+        return Response({'next': next_url, 'results': serializer.data})
+
 class CourseCategoryChoicesView(APIView):
     """API endpoint to retrieve CourseCategory choices."""
     permission_classes = [AllowAny]
 
+    @extend_schema(responses=ChoiceSerializer(many=True))
     def get(self, request):
-        choices = CourseCategory.choices()
-        serializer = ChoiceSerializer(choices, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return CHOICE_PAYLOADS['course_category'].response(request)
 
 class CourseTypeChoicesView(APIView):
     """API endpoint to retrieve CourseType choices."""
     permission_classes = [AllowAny]
 
+    @extend_schema(responses=ChoiceSerializer(many=True))
     def get(self, request):
-        choices = CourseType.choices()
-        serializer = ChoiceSerializer(choices, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return CHOICE_PAYLOADS['course_type'].response(request)
 
 class CBCSCategoryChoicesView(APIView):
     """API endpoint to retrieve CBCSCategory choices."""
     permission_classes = [AllowAny]
 
+    @extend_schema(responses=ChoiceSerializer(many=True))
     def get(self, request):
-        choices = CBCSCategory.choices()
-        serializer = ChoiceSerializer(choices, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
\ No newline at end of file
+        return CHOICE_PAYLOADS['cbcs_category'].response(request)
+
+class ChoicesBundleView(APIView):
+    """
+    API endpoint returning every enum choice set (course category, course type,
+    CBCS category, faculty) in one precomputed payload. Pin the ETag hash with
+    ?v=<hash> to let clients cache it as immutable.
+    """
+    permission_classes = [AllowAny]
+
+    @extend_schema(responses={200: {
+        'description': 'Maps course_category, course_type, cbcs_category and faculty to lists of {value, label}.'
+    }})
+    def get(self, request):
+        return CHOICES_BUNDLE.response(request)
+
+class DepartmentCreditAnalyticsView(APIView):
+    """
+    API endpoint for per-department and per-faculty credit rollups, served from
+    a materialized view. Reports when the view was refreshed and whether writes
+    are pending. Optional ?faculty= filter.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        report = credit_summary_report(faculty=request.query_params.get('faculty'))
+        return Response(report, status=status.HTTP_200_OK)
+
+class SyllabusUploadMixin:
+    """Shared lookup and tus headers for the resumable upload endpoints."""
+    permission_classes = [IsAuthenticated]
+
+    def get_upload(self, pk):
+        return get_object_or_404(SyllabusUpload.objects.filter(uploaded_by=self.request.user), pk=pk)
+
+    def upload_headers(self, response, upload):
+        response['Tus-Resumable'] = TUS_VERSION
+        response['Upload-Offset'] = str(upload.offset)
+        response['Upload-Length'] = str(upload.length)
+        response['Cache-Control'] = 'no-store'
+        return response
+
+    def conflict(self, upload):
+        return self.upload_headers(Response(
+            {'detail': 'Upload-Offset does not match the upload.'}, status=status.HTTP_409_CONFLICT
+        ), upload)
+
+class SyllabusUploadCreateView(SyllabusUploadMixin, APIView):
+    """
+    Starts a resumable syllabus upload. POST the metadata (course, version,
+    description, filename, length or an Upload-Length header); the Location
+    header points at the upload to PATCH chunks into.
+    """
+
+    @extend_schema(request=SyllabusUploadSerializer, responses={201: SyllabusUploadSerializer})
+    def post(self, request):
+        data = request.data.copy()
+        if 'length' not in data and 'Upload-Length' in request.headers:
+            data['length'] = request.headers['Upload-Length']
+        serializer = SyllabusUploadSerializer(data=data, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.save()
+        response = Response(serializer.data, status=status.HTTP_201_CREATED)
+        response['Location'] = reverse('courses:syllabus-upload-detail', kwargs={'pk': upload.pk})
+        return self.upload_headers(response, upload)
+
+class SyllabusUploadView(SyllabusUploadMixin, APIView):
+    """
+    A resumable syllabus upload (tus-style). HEAD reports Upload-Offset; PATCH
+    with Content-Type application/offset+octet-stream and the current
+    Upload-Offset appends the body; the upload becomes a Syllabus once all
+    bytes are received. DELETE abandons it.
+    """
+
+    @extend_schema(responses={200: SyllabusUploadSerializer})
+    def get(self, request, pk):
+        upload = self.get_upload(pk)
+        return self.upload_headers(Response(SyllabusUploadSerializer(upload).data), upload)
+
+    def head(self, request, pk):
+        return self.upload_headers(Response(status=status.HTTP_200_OK), self.get_upload(pk))
+
+    @extend_schema(request=None, responses={
+        204: {'description': 'Chunk stored; Upload-Offset holds the new offset.'},
+        409: {'description': 'Upload-Offset does not match, the upload is complete, or the version '
+                             'was taken before the last chunk arrived (the upload is discarded).'},
+        411: {'description': 'No Content-Length (chunked transfer is not supported).'},
+        413: {'description': 'Chunk extends past Upload-Length.'},
+        415: {'description': 'Wrong content type or the content is not a PDF (the upload is discarded).'},
+    })
+    def patch(self, request, pk):
+        if request.content_type != OFFSET_CONTENT_TYPE:
+            return Response({'detail': f"Content-Type must be {OFFSET_CONTENT_TYPE}."},
+                            status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        try:
+            offset = int(request.headers['Upload-Offset'])
+        except (KeyError, ValueError):
+            return Response({'detail': 'A numeric Upload-Offset header is required.'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        try:
+            size = int(request.META['CONTENT_LENGTH'])
+        except (KeyError, ValueError):
+            # Chunked transfer: the chunk size must be known before anything is stored.
+            return Response({'detail': 'A Content-Length header is required.'},
+                            status=status.HTTP_411_LENGTH_REQUIRED)
+
+        upload = self.get_upload(pk)
+        if upload.is_complete or offset != upload.offset:
+            return self.conflict(upload)
+        if size < 0 or offset + size > upload.length:
+            return self.upload_headers(Response(
+                {'detail': 'Chunk extends past Upload-Length.'}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            ), upload)
+        try:
+            # The body is received before any transaction or row lock is taken.
+            chunk_path, written = receive_chunk(upload, request.stream, size)
+        except DjangoValidationError as error:
+            discard_part(upload)
+            upload.delete()
+            return Response({'detail': error.messages[0]}, status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        try:
+            with transaction.atomic():
+                append_chunk(upload, chunk_path, written)
+                if upload.offset == upload.length:
+                    finalize_upload(upload)
+        except UploadConflict:
+            return self.conflict(self.get_upload(pk))
+        except DjangoValidationError as error:
+            # The offset rolled back with the transaction, but the complete file
+            # can never become a syllabus, so the upload is dropped as above.
+            discard_part(upload)
+            upload.delete()
+            code = (status.HTTP_415_UNSUPPORTED_MEDIA_TYPE if error.code == 'invalid_pdf'
+                    else status.HTTP_409_CONFLICT)
+            return Response({'detail': error.messages[0]}, status=code)
+        finally:
+            discard_file(chunk_path)
+
+        response = Response(status=status.HTTP_204_NO_CONTENT)
+        if upload.is_complete:
+            response['Syllabus-Location'] = reverse('courses:syllabus-detail', kwargs={'pk': upload.syllabus_id})
+        return self.upload_headers(response, upload)
+
+    def delete(self, request, pk):
+        upload = self.get_upload(pk)
+        discard_part(upload)
+        upload.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,107 @@
+from django.contrib.postgres.search import SearchVector
+from academics.models import Department
+from courses.models import Course, Syllabus
+from .models import CatalogSearchEntry, EntryKind
+
+SEARCH_CONFIG = 'english'
+
+# Weighted document: title ranks above subtitle, which ranks above body.
+SEARCH_DOCUMENT = (
+    SearchVector('title', weight='A', config=SEARCH_CONFIG)
+    + SearchVector('subtitle', weight='B', config=SEARCH_CONFIG)
+    + SearchVector('body', weight='C', config=SEARCH_CONFIG)
+)
+
+
+def _write_entries(kind, object_ids, entries):
+    """
+    Upserts the given entries and drops entries of the same kind for ids that
+    are no longer live. Runs a fixed number of queries regardless of batch size.
+    """
+    object_ids = [str(pk) for pk in object_ids]
+    live_ids = {entry.object_id for entry in entries}
+    stale_ids = [pk for pk in object_ids if pk not in live_ids]
+    if stale_ids:
+        CatalogSearchEntry.objects.filter(kind=kind, object_id__in=stale_ids).delete()
+    if entries:
+        CatalogSearchEntry.objects.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=['kind', 'object_id'],
+            update_fields=['title', 'subtitle', 'body', 'updated_at'],
+        )
+        CatalogSearchEntry.objects.filter(kind=kind, object_id__in=live_ids).update(
+            search_vector=SEARCH_DOCUMENT
+        )
+
+
+def index_departments(department_ids):
+    """Rebuilds the entries of the given departments."""
+    kind = EntryKind.DEPARTMENT.name
+    entries = [
+        CatalogSearchEntry(
+            kind=kind,
+            object_id=department.id,
+            title=department.name,
+            subtitle=department.get_faculty_display(),
+        )
+        for department in Department.objects.live().filter(pk__in=department_ids)
+    ]
+    _write_entries(kind, department_ids, entries)
+
+
+def index_courses(course_codes):
+    """Rebuilds the entries of the given courses, including their department name."""
+    kind = EntryKind.COURSE.name
+    courses = Course.objects.live().filter(pk__in=course_codes).select_related('discipline')
+    entries = [
+        CatalogSearchEntry(
+            kind=kind,
+            object_id=course.course_code,
+            title=f"{course.course_code} {course.course_name}",
+            subtitle=course.discipline.name,
+            body=' '.join([
+                course.get_course_category_display(),
+                course.get_type_display(),
+                course.get_cbcs_category_display(),
+                course.discipline.get_faculty_display(),
+            ]),
+        )
+        for course in courses
+    ]
+    _write_entries(kind, course_codes, entries)
+
+
+def index_syllabi(syllabus_ids):
+    """Rebuilds the entries of the given syllabi, including course and department names."""
+    kind = EntryKind.SYLLABUS.name
+    syllabi = Syllabus.objects.live().filter(pk__in=syllabus_ids).select_related(
+        'course__discipline'
+    )
+    entries = [
+        CatalogSearchEntry(
+            kind=kind,
+            object_id=str(syllabus.pk),
+            title=f"{syllabus.course_id} {syllabus.course_name}",
+            subtitle=syllabus.course.discipline.name,
+            body=f"Version {syllabus.version} {syllabus.description}",
+        )
+        for syllabus in syllabi
+    ]
+    _write_entries(kind, syllabus_ids, entries)
+
+
+def index_course_dependents(course_codes):
+    """Re-indexes the syllabi of the given courses (they embed course and department names)."""
+    index_syllabi(list(Syllabus.objects.filter(course_id__in=course_codes).values_list('pk', flat=True)))
+
+
+def index_department_dependents(department_ids):
+    """Re-indexes the courses and syllabi of the given departments."""
+    course_codes = list(Course.objects.filter(discipline_id__in=department_ids).values_list('pk', flat=True))
+    index_courses(course_codes)
+    index_course_dependents(course_codes)
+
+
+def remove_entries(kind, object_ids):
+    CatalogSearchEntry.objects.filter(kind=kind.name, object_id__in=[str(pk) for pk in object_ids]).delete()
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from academics.models import Department
+from courses.models import Course, Syllabus
+from search import indexing
+from search.models import CatalogSearchEntry
+
+class Command(BaseCommand):
+    help = 'Rebuilds the catalog search index from the department, course and syllabus tables.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Objects indexed per batch.')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        CatalogSearchEntry.objects.all().delete()
+        for label, queryset, index in (
+            ('departments', Department.objects.live(), indexing.index_departments),
+            ('courses', Course.objects.live(), indexing.index_courses),
+            ('syllabi', Syllabus.objects.live(), indexing.index_syllabi),
+        ):
+            ids = list(queryset.order_by('pk').values_list('pk', flat=True))
+            for start in range(0, len(ids), batch_size):
+                index(ids[start:start + batch_size])
+            self.stdout.write(f"Indexed {len(ids)} {label}.")
+        self.stdout.write(self.style.SUCCESS('Search index rebuilt.'))
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.7 on 2026-10-17 11:41
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogSearchEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('DEPARTMENT', 'Department'), ('COURSE', 'Course'), ('SYLLABUS', 'Syllabus')], help_text='Type of the indexed object.', max_length=10)),
+                ('object_id', models.CharField(help_text='Primary key of the indexed object (department id, course code or syllabus id).', max_length=20)),
+                ('title', models.CharField(help_text='Primary text (weight A).', max_length=255)),
+                ('subtitle', models.CharField(blank=True, help_text='Secondary text (weight B).', max_length=255)),
+                ('body', models.TextField(blank=True, help_text='Additional searchable text (weight C).')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Catalog search entries',
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='search_entry_vector_gin')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='unique_search_entry')],
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+from enum import Enum
+
+class EntryKind(Enum):
+    """Kinds of catalog objects that are indexed for search."""
+    DEPARTMENT = "Department"
+    COURSE = "Course"
+    SYLLABUS = "Syllabus"
+
+    @classmethod
+    def choices(cls):
+        return [(key.name, key.value) for key in cls]
+
+class CatalogSearchEntry(models.Model):
+    """
+    One searchable document per live department, course or syllabus.
+    Rows are maintained incrementally by search.signals; soft-deleted objects
+    have no entry.
+    """
+    kind = models.CharField(
+        max_length=10,
+        choices=EntryKind.choices(),
+        help_text="Type of the indexed object."
+    )
+    object_id = models.CharField(
+        max_length=20,
+        help_text="Primary key of the indexed object (department id, course code or syllabus id)."
+    )
+    title = models.CharField(max_length=255, help_text="Primary text (weight A).")
+    subtitle = models.CharField(max_length=255, blank=True, help_text="Secondary text (weight B).")
+    body = models.TextField(blank=True, help_text="Additional searchable text (weight C).")
+    search_vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, editable=False)
+
+    class Meta:
+        verbose_name_plural = 'Catalog search entries'
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='unique_search_entry')
+        ]
+        indexes = [
+            GinIndex(fields=['search_vector'], name='search_entry_vector_gin'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id} - {self.title}"
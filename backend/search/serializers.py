@@ -0,0 +1,10 @@
+from rest_framework import serializers
+from .models import CatalogSearchEntry
+
+class CatalogSearchResultSerializer(serializers.ModelSerializer):
+    """Serializer for ranked catalog search hits."""
+    rank = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = CatalogSearchEntry
+        fields = ['kind', 'object_id', 'title', 'subtitle', 'rank']
@@ -0,0 +1,45 @@
+from functools import partial
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from academics.models import Department
+from courses.models import Course, Syllabus
+from courses.signals import courses_bulk_saved
+from . import indexing
+from .models import EntryKind
+
+# Index maintenance runs after commit so rolled-back writes never reach the index.
+
+@receiver(post_save, sender=Department, dispatch_uid='search_index_department')
+def index_department(sender, instance, **kwargs):
+    def update():
+        indexing.index_departments([instance.pk])
+        indexing.index_department_dependents([instance.pk])
+    transaction.on_commit(update)
+
+@receiver(post_save, sender=Course, dispatch_uid='search_index_course')
+def index_course(sender, instance, **kwargs):
+    def update():
+        indexing.index_courses([instance.pk])
+        indexing.index_course_dependents([instance.pk])
+    transaction.on_commit(update)
+
+@receiver(courses_bulk_saved, sender=Course, dispatch_uid='search_index_courses_bulk')
+def index_courses_bulk(sender, instances, created, **kwargs):
+    codes = [course.pk for course in instances]
+    def update():
+        indexing.index_courses(codes)
+        if not created:
+            indexing.index_course_dependents(codes)
+    transaction.on_commit(update)
+
+@receiver(post_save, sender=Syllabus, dispatch_uid='search_index_syllabus')
+def index_syllabus(sender, instance, **kwargs):
+    transaction.on_commit(partial(indexing.index_syllabi, [instance.pk]))
+
+@receiver(post_delete, sender=Department, dispatch_uid='search_unindex_department')
+@receiver(post_delete, sender=Course, dispatch_uid='search_unindex_course')
+@receiver(post_delete, sender=Syllabus, dispatch_uid='search_unindex_syllabus')
+def unindex(sender, instance, **kwargs):
+    kind = EntryKind[sender.__name__.upper()]
+    transaction.on_commit(partial(indexing.remove_entries, kind, [instance.pk]))
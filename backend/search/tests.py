@@ -0,0 +1,67 @@
+import io
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+from courses.models import Course
+from search.models import CatalogSearchEntry
+from university.testing import seed_catalog
+
+
+class CatalogSearchTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # seed_catalog bulk inserts, so no signal indexes these rows.
+        cls.user = seed_catalog(departments=1, courses_per_department=2, syllabi_per_course=0)
+        cls.department = Course.objects.first().discipline
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def search(self, terms, **params):
+        response = APIClient().get('/search/', {'q': terms, **params})
+        self.assertEqual(response.status_code, 200)
+        return [(result['kind'], result['object_id'], result['title']) for result in response.data['results']]
+
+    def test_course_writes_reach_the_index(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/courses/courses/', {
+                'course_code': 'PHY101', 'course_name': 'Quantum Mechanics', 'course_category': 'COMPULSORY',
+                'type': 'THEORY', 'cbcs_category': 'CORE', 'maximum_credit': 4, 'discipline': self.department.pk,
+            }, format='json')
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(self.search('quantum'), [('COURSE', 'PHY101', 'PHY101 Quantum Mechanics')])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch('/courses/courses/PHY101/', {'course_name': 'Relativity'}, format='json')
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(self.search('quantum'), [])
+        self.assertEqual(self.search('relativity'), [('COURSE', 'PHY101', 'PHY101 Relativity')])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete('/courses/courses/PHY101/')
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.search('relativity'), [])
+        self.assertFalse(CatalogSearchEntry.objects.filter(object_id='PHY101').exists())
+
+    def test_department_rename_reindexes_its_courses(self):
+        call_command('rebuild_search_index', stdout=io.StringIO())
+        course = Course.objects.live().first()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.department.name = 'Astrophysics'
+            self.department.save()
+        self.assertIn(('COURSE', course.pk, f"{course.course_code} {course.course_name}"),
+                      self.search('astrophysics', kind='course'))
+        self.assertEqual(self.search('astrophysics', kind='department'),
+                         [('DEPARTMENT', str(self.department.pk), 'Astrophysics')])
+
+    def test_rebuild_indexes_bulk_inserted_rows_and_skips_soft_deleted(self):
+        self.assertEqual(self.search('seeded'), [])
+        call_command('rebuild_search_index', stdout=io.StringIO())
+        live = set(Course.objects.live().values_list('pk', flat=True))
+        found = {object_id for kind, object_id, title in self.search('seeded', kind='course', limit=50)}
+        self.assertEqual(found, live)
+
+    def test_blank_query_returns_nothing(self):
+        call_command('rebuild_search_index', stdout=io.StringIO())
+        self.assertEqual(self.search('  '), [])
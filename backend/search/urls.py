@@ -0,0 +1,11 @@
+from django.urls import path
+from .views import CatalogSearchView
+
+urlpatterns = [
+    path('', CatalogSearchView.as_view(), name='catalog-search'),
+]
+
+"""
+Note: With the namespace, the endpoint is accessible as:
+    GET /search/?q=<terms>[&kind=DEPARTMENT|COURSE|SYLLABUS][&page=<n>&limit=<n>]
+"""
@@ -0,0 +1,43 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F
+from rest_framework import generics
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.permissions import AllowAny
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from .indexing import SEARCH_CONFIG
+from .models import CatalogSearchEntry, EntryKind
+from .serializers import CatalogSearchResultSerializer
+
+class SearchPagination(PageNumberPagination):
+    page_size = 10
+    page_size_query_param = 'limit'
+    max_page_size = 50
+
+class CatalogSearchView(generics.ListAPIView):
+    """Ranked full-text search across live departments, courses and syllabi."""
+    serializer_class = CatalogSearchResultSerializer
+    pagination_class = SearchPagination
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('q', str, description='Search terms (web search syntax: "quoted phrase", -exclude, or).'),
+            OpenApiParameter('kind', str, enum=[kind.name for kind in EntryKind], description='Restrict results to one kind.'),
+        ],
+        description='Search the catalog by name, department, category or syllabus description.'
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self):
+        terms = self.request.query_params.get('q', '').strip()
+        if not terms:
+            return CatalogSearchEntry.objects.none()
+        query = SearchQuery(terms, search_type='websearch', config=SEARCH_CONFIG)
+        queryset = CatalogSearchEntry.objects.filter(search_vector=query)
+        kind = self.request.query_params.get('kind', '').upper()
+        if kind in EntryKind.__members__:
+            queryset = queryset.filter(kind=kind)
+        return queryset.annotate(
+            rank=SearchRank(F('search_vector'), query)
+        ).order_by('-rank', 'kind', 'object_id')
@@ -14,3 +14,7 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'university.settings')
 
 application = get_asgi_application()
+
+from accounts.maintenance import start_token_pruner  # noqa: E402  Needs the app registry
+
+start_token_pruner()  # Only when TOKEN_PRUNE_INTERVAL is set
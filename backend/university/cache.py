@@ -0,0 +1,133 @@
+import hashlib
+import threading
+import time
+from datetime import datetime, timezone
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.http import parse_http_date_safe
+from rest_framework.response import Response
+from .conditional import not_modified, set_validators
+
+CATALOG_GENERATION_KEY = 'catalog:generation'
+# Backends whose entries live in one process, so invalidations never reach other workers.
+PROCESS_LOCAL_BACKENDS = ('django.core.cache.backends.locmem.LocMemCache',)
+
+
+class CacheStats:
+    """Thread-safe, per-process hit/miss counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def snapshot(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+            }
+
+    def reset(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+catalog_cache_stats = CacheStats()
+
+
+def _new_generation():
+    # A fresh, never-repeating value: if the generation key is evicted the
+    # entries written under the old generation can never be served again.
+    return time.time_ns()
+
+
+def get_catalog_generation():
+    return cache.get_or_set(CATALOG_GENERATION_KEY, _new_generation, timeout=None)
+
+
+def catalog_cache_timeout():
+    """
+    CATALOG_CACHE_TIMEOUT on a shared backend. On a per-process backend the
+    timeout is capped at CATALOG_CACHE_LOCAL_TIMEOUT, which bounds how long
+    other workers serve a response a write has made stale; 0 turns caching off.
+    """
+    timeout = settings.CATALOG_CACHE_TIMEOUT
+    if settings.CACHES['default']['BACKEND'] in PROCESS_LOCAL_BACKENDS:
+        timeout = min(timeout, settings.CATALOG_CACHE_LOCAL_TIMEOUT)
+    return max(timeout, 0)
+
+
+def invalidate_catalog_cache():
+    """Drops every cached catalog response by moving to a new generation."""
+    cache.set(CATALOG_GENERATION_KEY, _new_generation(), timeout=None)
+
+
+def invalidate_catalog_cache_on_commit(**kwargs):
+    """Signal receiver: invalidate once the write is visible to other requests."""
+    transaction.on_commit(invalidate_catalog_cache)
+
+
+def catalog_cache_key(request, namespace):
+    """Cache key built from the path, the sorted query params and the staff flag."""
+    user = request.user
+    visibility = 'staff' if user.is_authenticated and user.is_staff else 'public'
+    query = sorted((key, sorted(values)) for key, values in request.query_params.lists())
+    digest = hashlib.sha1(f'{request.path}?{query}'.encode()).hexdigest()
+    return f'catalog:{get_catalog_generation()}:{namespace}:{visibility}:{digest}'
+
+
+class CachedReadMixin:
+    """
+    Serves list and retrieve responses from the Django cache. Entries are
+    invalidated through invalidate_catalog_cache() (wired to post_save and
+    post_delete of the catalog models) and expire after catalog_cache_timeout().
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(super().retrieve, request, *args, **kwargs)
+
+    def _cached_response(self, handler, request, *args, **kwargs):
+        timeout = catalog_cache_timeout()
+        if not timeout:
+            return handler(request, *args, **kwargs)
+        key = catalog_cache_key(request, self.basename)
+        cached = cache.get(key)
+        if cached is not None:
+            catalog_cache_stats.record(hit=True)
+            data, etag, last_modified = cached
+            response = not_modified(request, etag, last_modified) if etag else None
+            if response is None:
+                response = Response(data)
+                if etag:
+                    set_validators(response, etag, last_modified)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        catalog_cache_stats.record(hit=False)
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200 and isinstance(response, Response):
+            last_modified = parse_http_date_safe(response.get('Last-Modified', ''))
+            if last_modified is not None:
+                last_modified = datetime.fromtimestamp(last_modified, tz=timezone.utc)
+            cache.set(
+                key,
+                (response.data, response.get('ETag'), last_modified),
+                timeout,
+            )
+        response['X-Cache'] = 'MISS'
+        return response
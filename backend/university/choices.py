@@ -0,0 +1,49 @@
+"""
+Enum choice sets precomputed once at import time (URL configuration load).
+The values only change on deploy, so every payload is a ready-made JSON byte
+string with a content-hash ETag. Requests that pin the hash with ?v=<hash> get
+immutable caching; unpinned requests revalidate cheaply against the ETag.
+"""
+import hashlib
+import json
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from academics.models import Faculty
+from courses.models import CourseCategory, CourseType, CBCSCategory
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'public, no-cache'
+
+
+def _choices(enum_choices):
+    return [{'value': value, 'label': label} for value, label in enum_choices]
+
+
+class PrecomputedPayload:
+    """JSON bytes plus a strong ETag derived from their SHA-256."""
+
+    def __init__(self, data):
+        self.content = json.dumps(data, separators=(',', ':')).encode()
+        self.version = hashlib.sha256(self.content).hexdigest()
+        self.etag = f'"{self.version}"'
+
+    def response(self, request):
+        """Returns a 304 when the client already holds this payload, else the bytes."""
+        response = get_conditional_response(request, etag=self.etag)
+        if response is None:
+            response = HttpResponse(self.content, content_type='application/json')
+        response['ETag'] = self.etag
+        pinned = request.GET.get('v') == self.version
+        response['Cache-Control'] = IMMUTABLE_CACHE_CONTROL if pinned else REVALIDATE_CACHE_CONTROL
+        return response
+
+
+CHOICE_SETS = {
+    'course_category': _choices(CourseCategory.choices()),
+    'course_type': _choices(CourseType.choices()),
+    'cbcs_category': _choices(CBCSCategory.choices()),
+    'faculty': _choices(Faculty.choices()),
+}
+
+CHOICE_PAYLOADS = {name: PrecomputedPayload(data) for name, data in CHOICE_SETS.items()}
+CHOICES_BUNDLE = PrecomputedPayload(CHOICE_SETS)
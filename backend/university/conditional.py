@@ -0,0 +1,72 @@
+import hashlib
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+
+def make_etag(*parts):
+    """Builds a quoted ETag from the given validator parts."""
+    digest = hashlib.sha1('|'.join(str(part) for part in parts).encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def set_validators(response, etag, last_modified=None):
+    """Adds ETag/Last-Modified headers and asks clients to revalidate."""
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+def not_modified(request, etag, last_modified=None):
+    """
+    Returns a 304 (or 412) response when the request's If-None-Match /
+    If-Modified-Since headers match the given validators, otherwise None.
+    """
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    Conditional GET for list and retrieve actions. Validators are derived from
+    the database (max timestamp plus row count for lists, the row timestamp for
+    detail) so unchanged resources are answered with 304 before serialization.
+    Lists carry only an ETag: the newest timestamp can stay put or even move
+    back when rows are deleted, so Last-Modified would validate stale pages.
+    """
+    last_modified_field = 'updated_at'
+
+    def _validator_parts(self, request):
+        user = request.user
+        return (request.get_full_path(), user.is_authenticated and user.is_staff)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        stats = queryset.aggregate(
+            last_modified=Max(self.last_modified_field), count=Count('pk')
+        )
+        etag = make_etag(*self._validator_parts(request), stats['last_modified'], stats['count'])
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+        response = super().list(request, *args, **kwargs)
+        return set_validators(response, etag)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        last_modified = getattr(instance, self.last_modified_field)
+        etag = make_etag(*self._validator_parts(request), last_modified)
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+        serializer = self.get_serializer(instance)
+        return set_validators(Response(serializer.data), etag, last_modified)
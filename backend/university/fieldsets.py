@@ -0,0 +1,60 @@
+from rest_framework.exceptions import ValidationError
+
+
+def _field_names(value):
+    return {name.strip() for name in (value or '').split(',') if name.strip()}
+
+
+def sparse_fieldset_requested(request):
+    """True for a GET request carrying ?fields= or ?omit=."""
+    return (
+        request is not None and request.method in ('GET', 'HEAD')
+        and bool(_field_names(request.query_params.get('fields')) or _field_names(request.query_params.get('omit')))
+    )
+
+
+def requested_fields(request, available):
+    """
+    Returns the field names selected by ?fields=a,b and/or ?omit=c for a GET
+    request, or None when no selection was requested. Unknown names raise a
+    ValidationError (400).
+    """
+    if not sparse_fieldset_requested(request):
+        return None
+    fields = _field_names(request.query_params.get('fields'))
+    omit = _field_names(request.query_params.get('omit'))
+    unknown = (fields | omit) - set(available)
+    if unknown:
+        raise ValidationError({'fields': [f"Unknown field(s): {', '.join(sorted(unknown))}."]})
+    selected = set(available)
+    if fields:
+        selected &= fields
+    return selected - omit
+
+
+class SparseFieldsetSerializerMixin:
+    """Drops serializer fields not selected through ?fields= / ?omit= on reads (unknown names are a 400)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        selected = requested_fields(self.context.get('request'), self.fields.keys())
+        if selected is not None:
+            for name in set(self.fields) - selected:
+                self.fields.pop(name)
+
+
+class SparseFieldsetMixin:
+    """
+    Narrows the SQL of read actions to the columns backing the selected
+    serializer fields with .only(). sparse_fieldset_required lists columns that
+    are always loaded (ordering keys, cache validators).
+    """
+    sparse_fieldset_required = ('updated_at',)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not sparse_fieldset_requested(self.request):
+            return queryset
+        columns = {field.name for field in queryset.model._meta.concrete_fields}
+        sources = {field.source for field in self.get_serializer().fields.values()}
+        return queryset.only(*(sources & columns), *self.sparse_fieldset_required)
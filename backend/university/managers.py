@@ -0,0 +1,17 @@
+from django.db import models
+
+
+class SoftDeleteQuerySet(models.QuerySet):
+    """QuerySet for models with an is_deleted flag."""
+
+    def live(self):
+        """Rows that are not soft-deleted. Matches the partial indexes declared on is_deleted = false."""
+        return self.filter(is_deleted=False)
+
+    def deleted(self):
+        """Soft-deleted rows only."""
+        return self.filter(is_deleted=True)
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """Default manager exposing live()/deleted() while still returning every row from all()."""
@@ -40,6 +40,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',     # Full-text search fields and indexes
     # Third Party Apps
     'rest_framework',              # DRF
     'rest_framework_simplejwt',    # JWT
@@ -53,6 +54,7 @@ INSTALLED_APPS = [
     'accounts.apps.AccountsConfig',         # App For Custom Use Model
     'academics.apps.AcademicsConfig',
     'courses.apps.CoursesConfig',
+    'search.apps.SearchConfig',
 ]
 
 MIDDLEWARE = [
@@ -109,6 +111,30 @@ DATABASES = {
         }
     }
 
+# Password hashing. PASSWORD_HASHER picks the hasher for new (and upgraded) hashes; the
+# others still verify existing ones. 'argon2' needs argon2-cffi. Size the parameters
+# with `manage.py bench_password_hashers`.
+PASSWORD_HASHER = config('PASSWORD_HASHER', default='pbkdf2')  # 'pbkdf2' or 'argon2'
+PBKDF2_ITERATIONS = config('PBKDF2_ITERATIONS', default=870000, cast=int)  # Django 5.1 default
+ARGON2_TIME_COST = config('ARGON2_TIME_COST', default=2, cast=int)
+ARGON2_MEMORY_COST = config('ARGON2_MEMORY_COST', default=102400, cast=int)  # KiB
+ARGON2_PARALLELISM = config('ARGON2_PARALLELISM', default=8, cast=int)
+_TUNED_HASHERS = {
+    'pbkdf2': 'accounts.hashers.TunedPBKDF2PasswordHasher',
+    'argon2': 'accounts.hashers.TunedArgon2PasswordHasher',
+}
+PASSWORD_HASHERS = [
+    _TUNED_HASHERS[PASSWORD_HASHER],
+    *(hasher for name, hasher in _TUNED_HASHERS.items() if name != PASSWORD_HASHER),
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+# Async login/registration (ASGI): hashing runs on a per-process thread pool
+PASSWORD_HASHING_WORKERS = config('PASSWORD_HASHING_WORKERS', default=4, cast=int)  # Hashes run at once
+PASSWORD_HASHING_MAX_PENDING = config('PASSWORD_HASHING_MAX_PENDING', default=64, cast=int)  # Queued + running; beyond this, 503
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -157,8 +183,72 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Resumable syllabus uploads: part files live outside MEDIA_ROOT's public tree until complete.
+SYLLABUS_UPLOAD_DIR = config('SYLLABUS_UPLOAD_DIR', default=str(BASE_DIR / 'uploads' / 'syllabi'))
+SYLLABUS_UPLOAD_CHUNK_SIZE = config('SYLLABUS_UPLOAD_CHUNK_SIZE', default=64 * 1024, cast=int)  # Bytes read per block
+
+# Syllabus downloads: '' streams from Django (with Range support), 'nginx' emits X-Accel-Redirect to
+# SYLLABUS_ACCEL_REDIRECT_PREFIX (an `internal` location aliased to MEDIA_ROOT), 'sendfile' emits X-Sendfile.
+SYLLABUS_DOWNLOAD_OFFLOAD = config('SYLLABUS_DOWNLOAD_OFFLOAD', default='')
+SYLLABUS_ACCEL_REDIRECT_PREFIX = config('SYLLABUS_ACCEL_REDIRECT_PREFIX', default='/protected-media/')
+
+# Syllabus PDF text extraction (requires pypdf) in a per-process pool; backfill with `manage.py extract_syllabus_text`.
+SYLLABUS_TEXT_EXTRACTION = config('SYLLABUS_TEXT_EXTRACTION', default=True, cast=bool)
+SYLLABUS_TEXT_WORKERS = config('SYLLABUS_TEXT_WORKERS', default=2, cast=int)
+SYLLABUS_TEXT_TIMEOUT = config('SYLLABUS_TEXT_TIMEOUT', default=60, cast=float)  # Seconds per file; a timeout is a failed extraction
+
+# First-page syllabus previews rendered with poppler's pdftoppm; backfill with `manage.py generate_syllabus_previews`.
+SYLLABUS_PREVIEWS = config('SYLLABUS_PREVIEWS', default=True, cast=bool)
+SYLLABUS_PREVIEW_WIDTH = config('SYLLABUS_PREVIEW_WIDTH', default=320, cast=int)  # Pixels
+SYLLABUS_PREVIEW_WORKERS = config('SYLLABUS_PREVIEW_WORKERS', default=2, cast=int)
+SYLLABUS_PREVIEW_BINARY = config('SYLLABUS_PREVIEW_BINARY', default='pdftoppm')
+
 AUTH_USER_MODEL = 'accounts.CustomUser'
 
+# Cache Settings. Set a shared backend in production so every worker sees invalidations, e.g.
+# CACHE_BACKEND=django.core.cache.backends.redis.RedisCache CACHE_LOCATION=redis://127.0.0.1:6379/1
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='university-default'),
+    }
+}
+CATALOG_CACHE_TIMEOUT = config('CATALOG_CACHE_TIMEOUT', default=300, cast=int)  # Seconds
+# Cap on CATALOG_CACHE_TIMEOUT when the backend is per-process (LocMemCache): invalidations
+# only reach the worker that handled the write, so others serve stale lists this long
+CATALOG_CACHE_LOCAL_TIMEOUT = config('CATALOG_CACHE_LOCAL_TIMEOUT', default=5, cast=int)  # Seconds; 0 disables
+
+# Course analytics (materialized view). Also run `manage.py refresh_course_analytics` from cron: the
+# pending-changes marker and the refresh throttle live in the cache, so with the per-process default
+# each worker only sees its own writes, and refreshes queued in a worker are lost when it exits.
+COURSE_ANALYTICS_REFRESH_ON_WRITE = config('COURSE_ANALYTICS_REFRESH_ON_WRITE', default=True, cast=bool)  # Refreshes on a background thread after writes
+COURSE_ANALYTICS_MIN_REFRESH_INTERVAL = config('COURSE_ANALYTICS_MIN_REFRESH_INTERVAL', default=60, cast=int)  # Seconds
+
+# Per-process cache of authenticated users, keyed by user id and token issue time. Saves only clear
+# the saving worker's entries, so the TTL is how long other workers keep accepting a deactivated
+# user or a changed password: keep it to a few seconds.
+AUTH_USER_CACHE_SIZE = config('AUTH_USER_CACHE_SIZE', default=1024, cast=int)  # Entries; 0 disables
+AUTH_USER_CACHE_TTL = config('AUTH_USER_CACHE_TTL', default=5, cast=int)  # Seconds; bounds staleness in other workers
+# Per-process cache of signature-verified access tokens; entries end at the token's exp
+AUTH_TOKEN_CACHE_SIZE = config('AUTH_TOKEN_CACHE_SIZE', default=4096, cast=int)  # Entries; 0 disables
+
+# How logout, password change and refresh rotation revoke tokens: 'blacklist' (simplejwt
+# outstanding/blacklisted rows per token) or 'generation' (one per-user counter; logout
+# and password change revoke every session of the user). Generation mode trades replay
+# detection for speed: rotating a refresh token does not revoke the old one, so a stolen
+# refresh token stays usable until it expires or the user logs out or changes password.
+# It also needs a shared CACHE_BACKEND (Redis/Memcached): with the per-process default a
+# bump only reaches the worker that made it, and the others accept revoked tokens for up
+# to TOKEN_GENERATION_CACHE_TIMEOUT.
+TOKEN_REVOCATION_MODE = config('TOKEN_REVOCATION_MODE', default='blacklist')
+TOKEN_GENERATION_CACHE_TIMEOUT = config('TOKEN_GENERATION_CACHE_TIMEOUT', default=30, cast=int)  # Seconds; bounds staleness with a per-process cache backend
+
+# Expired token_blacklist rows: run `manage.py prune_tokens` from cron, or set an interval
+# to prune from a background thread in each web process (see accounts.maintenance)
+TOKEN_PRUNE_INTERVAL = config('TOKEN_PRUNE_INTERVAL', default=0, cast=int)  # Seconds; 0 disables the thread
+TOKEN_PRUNE_BATCH_SIZE = config('TOKEN_PRUNE_BATCH_SIZE', default=1000, cast=int)  # Rows per transaction
+TOKEN_PRUNE_PAUSE = config('TOKEN_PRUNE_PAUSE', default=0.1, cast=float)  # Seconds between batches
+
 # CORS Settings
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",  # Next.js dev server
@@ -186,7 +276,7 @@ SIMPLE_JWT = {
     'ROTATE_REFRESH_TOKENS': True,                   # Issue new refresh token on refresh
     'BLACKLIST_AFTER_ROTATION': True,                # Blacklist old refresh tokens
     'AUTH_HEADER_TYPES': ('Bearer',),                # Token type in Authorization header
-    'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
+    'AUTH_TOKEN_CLASSES': ('accounts.tokens.GenerationAccessToken',),  # AccessToken plus the generation check
     'AUTH_COOKIE': 'access_token',
     'REFRESH_COOKIE': 'refresh_token',
     'AUTH_COOKIE_SECURE': False, # Set to True in production
@@ -0,0 +1,180 @@
+import re
+import time
+from collections import Counter
+from itertools import cycle
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+# Maximum SQL statements per request. Lists run a validator aggregate, a COUNT
+# and the page query; anything that scales with the rows served is an N+1.
+API_QUERY_BUDGETS = {
+    '/courses/courses/': 3,
+    '/courses/courses/?pagination=cursor': 2,
+    '/courses/syllabi/': 3,
+    '/courses/syllabi/?pagination=cursor': 2,
+    '/courses/syllabi/latest/': 1,
+    '/academic/departments/': 2,
+    '/courses/courses/autocomplete/?q=seeded': 1,
+    '/courses/analytics/departments/': 1,
+    '/courses/choices/': 0,
+    '/search/?q=seeded': 1,
+}
+
+# Changelists: session, user, the filtered and total COUNTs, the page and the
+# choices of related-field list filters.
+ADMIN_QUERY_BUDGETS = {
+    '/admin/courses/course/': 6,
+    '/admin/courses/syllabus/': 6,
+    '/admin/academics/department/': 7,
+    '/admin/accounts/customuser/': 5,
+}
+
+_SQL_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+def normalize_sql(sql):
+    """Replaces literals with ? so statements differing only by parameters compare equal."""
+    return _SQL_LITERALS.sub('?', sql)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryBudget:
+    """
+    Context manager recording the SQL statements executed inside it, their
+    total database time and the wall time of the block. When max_queries is
+    given, exceeding it raises QueryBudgetExceeded listing the repeated
+    statements (the usual signature of an N+1).
+    """
+
+    def __init__(self, label='', max_queries=None, using=DEFAULT_DB_ALIAS):
+        self.label = label
+        self.max_queries = max_queries
+        self._context = CaptureQueriesContext(connections[using])
+        self.elapsed = 0.0
+
+    def __enter__(self):
+        self._context.__enter__()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.elapsed = time.perf_counter() - self._started
+        self._context.__exit__(exc_type, exc_value, traceback)
+        if exc_type is None and self.max_queries is not None and self.count > self.max_queries:
+            raise QueryBudgetExceeded(self.report())
+
+    @property
+    def queries(self):
+        return [query['sql'] for query in self._context.captured_queries]
+
+    @property
+    def count(self):
+        return len(self._context.captured_queries)
+
+    @property
+    def db_time(self):
+        """Total time spent in the database, in seconds."""
+        return sum(float(query['time']) for query in self._context.captured_queries)
+
+    def duplicates(self):
+        """Normalized statements executed more than once, with their counts."""
+        counts = Counter(normalize_sql(sql) for sql in self.queries)
+        return {sql: count for sql, count in counts.items() if count > 1}
+
+    def report(self):
+        lines = [f"{self.label or 'block'}: {self.count} queries (budget {self.max_queries}), "
+                 f"{self.db_time * 1000:.1f} ms in the database"]
+        for sql, count in sorted(self.duplicates().items(), key=lambda item: -item[1]):
+            lines.append(f"  repeated {count}x: {sql[:200]}")
+        return '\n'.join(lines)
+
+
+def seed_catalog(departments=4, courses_per_department=15, syllabi_per_course=2, user=None):
+    """
+    Creates a realistic catalog: departments spread over the faculties, courses
+    cycling through every category/type/CBCS value, a few soft-deleted rows and
+    syllabi with several versions. Rows are bulk inserted (no files are written).
+    Returns the user recorded as creator/uploader.
+    """
+    from django.contrib.auth import get_user_model
+    from academics.models import Department, Faculty
+    from courses.models import CBCSCategory, Course, CourseCategory, CourseType, Syllabus, version_key
+
+    if user is None:
+        user = get_user_model().objects.create_user(
+            email='catalog.seed@example.com', first_name='Catalog', last_name='Seed',
+            password='seed-password', is_staff=True, is_superuser=True,
+        )
+
+    faculties = cycle(Faculty)
+    seeded_departments = [
+        Department.objects.create_department(
+            name=f"Seeded Department {chr(ord('A') + index % 26) * (index // 26 + 1)}",
+            faculty=next(faculties).value,
+            created_by=user,
+            updated_by=user,
+        )
+        for index in range(departments)
+    ]
+
+    categories, types, cbcs = cycle(CourseCategory), cycle(CourseType), cycle(CBCSCategory)
+    courses = [
+        Course(
+            course_code=f"S{department.id}{number:03d}",
+            course_name=f"Seeded Course {department.id} {number}",
+            course_category=next(categories).name,
+            type=next(types).name,
+            cbcs_category=next(cbcs).name,
+            maximum_credit=number % 21,
+            discipline=department,
+            created_by=user,
+            updated_by=user,
+            is_deleted=number % 10 == 9,
+        )
+        for department in seeded_departments
+        for number in range(courses_per_department)
+    ]
+    Course.objects.bulk_create(courses)
+
+    Syllabus.objects.bulk_create([
+        Syllabus(
+            course=course,
+            course_name=course.course_name,
+            syllabus_file=f"syllabi/seed/{course.course_code}-{version}.pdf",
+            uploaded_by=user,
+            updated_by=user,
+            description=f"Seeded syllabus for {course.course_name}",
+            version=f"{version}.0",
+            version_key=version_key(f"{version}.0"),  # bulk_create skips save()
+            is_deleted=course.is_deleted,
+        )
+        for course in courses
+        for version in range(1, syllabi_per_course + 1)
+    ])
+    return user
+
+
+def make_pdf(text):
+    """Builds a minimal one-page PDF showing text in Helvetica (for upload, extraction and preview tests)."""
+    escaped = text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+    stream = f"BT /F1 18 Tf 72 720 Td ({escaped}) Tj ET".encode('latin-1')
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    pdf, offsets = bytearray(b"%PDF-1.4\n"), []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(pdf)
@@ -9,6 +9,7 @@ urlpatterns = [
     path('auth/', include(('accounts.urls', 'accounts'), namespace='accounts')),  # Namespace 'accounts'
     path('academic/', include(('academics.urls', 'academics'), namespace='academic')),
     path('courses/', include(('courses.urls', 'courses'), namespace='courses')),
+    path('search/', include(('search.urls', 'search'), namespace='search')),
 
     # API Schema and Swagger UI
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),